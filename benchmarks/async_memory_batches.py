@@ -0,0 +1,81 @@
+"""
+Benchmark of the async `MemoryBackend` batch operations.
+
+Compares the native `get_many()` and `set_many()` against the previous wrapper, which postponed
+every call to the synchronous backend and inherited the per-key protocol defaults.
+
+Usage:
+    python -m benchmarks.async_memory_batches
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Coroutine
+from time import perf_counter
+from typing import Any
+
+from cachetory.backends.async_ import MemoryBackend
+from cachetory.backends.sync import MemoryBackend as SyncMemoryBackend
+from cachetory.interfaces.backends.async_ import AsyncBackendRead, AsyncBackendWrite
+from cachetory.private.asyncio import postpone
+
+BATCH_SIZES = (1, 100, 10_000)
+N_KEYS_PER_ROUND = 100_000
+
+
+class _PostponingMemoryBackend(AsyncBackendRead[bytes], AsyncBackendWrite[bytes]):
+    """The previous wrapper, reduced to the methods under test."""
+
+    def __init__(self) -> None:
+        self._inner = SyncMemoryBackend[bytes]()
+
+    def get(self, key: str) -> Coroutine[Any, Any, bytes]:
+        return postpone(self._inner.get, key)
+
+    def set(  # noqa: A003
+        self,
+        key: str,
+        value: bytes,
+        *,
+        time_to_live: Any = None,
+        if_not_exists: bool = False,
+    ) -> Coroutine[Any, Any, bool]:
+        return postpone(self._inner.set, key, value, time_to_live=time_to_live, if_not_exists=if_not_exists)
+
+
+async def _measure(backend: Any, batch_size: int) -> tuple[float, float]:
+    keys = [f"key:{i}" for i in range(batch_size)]
+    items = [(key, b"value") for key in keys]
+    n_rounds = max(N_KEYS_PER_ROUND // batch_size, 1)
+
+    start_time = perf_counter()
+    for _ in range(n_rounds):
+        await backend.set_many(items)
+    set_many_time = (perf_counter() - start_time) / n_rounds
+
+    start_time = perf_counter()
+    for _ in range(n_rounds):
+        async for _item in backend.get_many(*keys):
+            pass
+    get_many_time = (perf_counter() - start_time) / n_rounds
+
+    return set_many_time, get_many_time
+
+
+async def main() -> None:
+    for batch_size in BATCH_SIZES:
+        for name, backend in (
+            ("wrapper", _PostponingMemoryBackend()),  # type: ignore[abstract]
+            ("native", MemoryBackend[bytes]()),
+        ):
+            set_many_time, get_many_time = await _measure(backend, batch_size)
+            print(  # noqa: T201
+                f"{batch_size:>6} keys, {name:>7}:"
+                f" set_many {set_many_time * 1e6:10.1f} µs,"
+                f" get_many {get_many_time * 1e6:10.1f} µs",
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+"""
+Micro-benchmark of the `MemoryBackend` deadline representation.
+
+Compares the current monotonic float deadlines against the previous layout,
+where each entry carried an aware `datetime` deadline checked against `datetime.now(timezone.utc)`.
+
+Usage:
+    python -m benchmarks.memory_deadlines
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from timeit import repeat
+from typing import Any, Callable
+
+from cachetory.backends.sync import MemoryBackend
+
+N_ENTRIES = 100_000
+N_GETS = 1_000_000
+TIME_TO_LIVE = timedelta(hours=1)
+
+
+class _DatetimeEntry:
+    """The previous entry layout."""
+
+    __slots__ = ("value", "deadline")
+
+    def __init__(self, value: Any, deadline: datetime | None) -> None:
+        self.value = value
+        self.deadline = deadline
+
+
+class _DatetimeMemoryBackend:
+    """The previous `get()` path, reduced to the essentials."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, _DatetimeEntry] = {}
+
+    def set(self, key: str, value: Any, *, time_to_live: timedelta | None = None) -> None:  # noqa: A003
+        deadline = datetime.now(timezone.utc) + time_to_live if time_to_live is not None else None
+        self._entries[key] = _DatetimeEntry(value, deadline)
+
+    def get(self, key: str) -> Any:
+        entry = self._entries[key]
+        if entry.deadline is not None and entry.deadline <= datetime.now(timezone.utc):
+            self._entries.pop(key, None)
+            raise KeyError(key)
+        return entry.value
+
+
+def _measure(name: str, make_backend: Callable[[], Any], entry_size: int) -> None:
+    tracemalloc.start()
+    backend = make_backend()
+    keys = [f"key:{i}" for i in range(N_ENTRIES)]
+    values = [b"value"] * N_ENTRIES
+    baseline, _ = tracemalloc.get_traced_memory()
+    for key, value in zip(keys, values):
+        backend.set(key, value, time_to_live=TIME_TO_LIVE)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    get = backend.get
+    key = keys[N_ENTRIES // 2]
+    seconds = min(repeat(lambda: get(key), number=N_GETS, repeat=5))
+
+    print(  # noqa: T201
+        f"{name:>10}: {seconds / N_GETS * 1e9:6.1f} ns per get,"
+        f" {entry_size:4d} bytes per entry object and its deadline,"
+        f" {(allocated - baseline) / N_ENTRIES:6.1f} bytes per entry including the backend indices",
+    )
+
+
+def main() -> None:
+    datetime_entry = _DatetimeEntry(b"value", datetime.now(timezone.utc))
+    _measure(
+        "datetime",
+        _DatetimeMemoryBackend,
+        sys.getsizeof(datetime_entry) + sys.getsizeof(datetime_entry.deadline),
+    )
+    backend = MemoryBackend[bytes]()
+    backend.set("key", b"value", time_to_live=TIME_TO_LIVE)
+    entry = backend._entries["key"]
+    _measure("monotonic", MemoryBackend[bytes], sys.getsizeof(entry) + sys.getsizeof(entry.deadline))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Trace-driven hit ratio benchmark of the `MemoryBackend` eviction policies.
+
+The trace mixes Zipf-distributed requests for popular keys with periodic one-off scans of cold keys,
+like a nightly export calling the cached functions. Each request is served cache-aside: `get()` first,
+and `set()` on a miss.
+
+Usage:
+    python -m benchmarks.memory_policies
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from itertools import accumulate
+from random import Random
+from time import perf_counter
+
+from cachetory.backends.sync.memory import MemoryBackend, Policy
+
+N_POPULAR_KEYS = 10_000
+ZIPF_EXPONENT = 0.9
+N_REQUESTS = 500_000
+SCAN_PERIOD = 20_000
+SCAN_LENGTH = 5_000
+CAPACITIES = (100, 1_000, 5_000)
+
+
+def _make_trace(seed: int = 42) -> Iterator[str]:
+    random = Random(seed)
+    cum_weights = list(accumulate(1.0 / (rank**ZIPF_EXPONENT) for rank in range(1, N_POPULAR_KEYS + 1)))
+    popular_keys = random.choices(range(N_POPULAR_KEYS), cum_weights=cum_weights, k=N_REQUESTS)
+    n_scans = 0
+    for i, key in enumerate(popular_keys):
+        if i % SCAN_PERIOD == 0:
+            for j in range(SCAN_LENGTH):
+                yield f"scan:{n_scans}:{j}"
+            n_scans += 1
+        yield f"popular:{key}"
+
+
+def _replay(trace: list[str], capacity: int, policy: Policy) -> tuple[float, float]:
+    backend = MemoryBackend[int](max_entries=capacity, policy=policy)
+    n_hits = 0
+    start_time = perf_counter()
+    for key in trace:
+        try:
+            backend.get(key)
+        except KeyError:
+            backend.set(key, 0)
+        else:
+            n_hits += 1
+    return n_hits / len(trace), (perf_counter() - start_time) / len(trace)
+
+
+def main() -> None:
+    trace = list(_make_trace())
+    for capacity in CAPACITIES:
+        for policy in ("lru", "tinylfu"):
+            hit_ratio, seconds = _replay(trace, capacity, policy)
+            print(  # noqa: T201
+                f"capacity {capacity:>5}, {policy:>7}: hit ratio {hit_ratio:6.2%}, {seconds * 1e9:6.0f} ns per request",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,14 +8,28 @@ from .memory import MemoryBackend
 
 try:
     from .redis import RedisBackend
+    from .redis_cluster import RedisClusterBackend
+    from .redis_replicated import RedisReplicatedBackend
 except ImportError:
     RedisBackend = None  # type: ignore[assignment, misc]
+    RedisClusterBackend = None  # type: ignore[assignment, misc]
+    RedisReplicatedBackend = None  # type: ignore[assignment, misc]
 
 try:
     from .django import DjangoBackend
 except ImportError:
     DjangoBackend = None  # type: ignore[assignment, misc]
 
+try:
+    from .disk import DiskBackend
+except ImportError:  # the platform lacks `os.pread()`
+    DiskBackend = None  # type: ignore[assignment, misc]
+
+try:
+    from .shm import SharedMemoryBackend
+except ImportError:  # the platform lacks `fcntl`
+    SharedMemoryBackend = None  # type: ignore[assignment, misc]
+
 
 def from_url(url: str) -> AsyncBackend[Any]:
     """
@@ -32,10 +46,26 @@ def from_url(url: str) -> AsyncBackend[Any]:
         if RedisBackend is None:
             raise ValueError(f"`{scheme}://` requires `cachetory[redis]` extra")  # pragma: no cover
         return RedisBackend.from_url(url)
+    if scheme in ("redis+cluster", "rediss+cluster"):
+        if RedisClusterBackend is None:
+            raise ValueError(f"`{scheme}://` requires `cachetory[redis]` extra")  # pragma: no cover
+        return RedisClusterBackend.from_url(url)
+    if scheme in ("redis+replicas", "rediss+replicas", "redis+sentinel"):
+        if RedisReplicatedBackend is None:
+            raise ValueError(f"`{scheme}://` requires `cachetory[redis]` extra")  # pragma: no cover
+        return RedisReplicatedBackend.from_url(url)
     if scheme == "dummy":
         return DummyBackend.from_url(url)
     if scheme == "django":
         if DjangoBackend is None:
             raise ValueError(f"`{scheme}://` requires `cachetory[django]` extra")  # pragma: no cover
         return DjangoBackend.from_url(url)
+    if scheme == "disk":
+        if DiskBackend is None:
+            raise ValueError(f"`{scheme}://` is not supported on this platform")  # pragma: no cover
+        return DiskBackend.from_url(url)
+    if scheme == "shm":
+        if SharedMemoryBackend is None:
+            raise ValueError(f"`{scheme}://` is not supported on this platform")  # pragma: no cover
+        return SharedMemoryBackend.from_url(url)
     raise ValueError(f"`{scheme}://` is not supported")
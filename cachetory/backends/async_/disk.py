@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from asyncio import to_thread
+from collections.abc import AsyncIterable, Iterable
+from datetime import datetime, timedelta
+from os import PathLike
+
+from cachetory.backends.sync.disk import DiskBackend as SyncDiskBackend
+from cachetory.interfaces.backends.async_ import AsyncBackend
+
+_DEFAULT_BATCH_SIZE = 100
+
+
+class DiskBackend(AsyncBackend[bytes]):
+    """
+    Asynchronous version of the disk backend.
+
+    The file operations run in the default executor, so that they do not block the event loop.
+    """
+
+    __slots__ = ("_inner", "_batch_size")
+
+    @classmethod
+    def from_url(cls, url: str) -> DiskBackend:
+        """
+        Instantiate a backend from the URL.
+
+        Accepts the same URL as the synchronous `DiskBackend`.
+        """
+        backend = cls.__new__(cls)
+        backend._inner = SyncDiskBackend.from_url(url)
+        backend._batch_size = _DEFAULT_BATCH_SIZE
+        return backend
+
+    def __init__(
+        self,
+        directory: str | PathLike[str],
+        *,
+        max_bytes: int | None = None,
+        mmap_threshold: int = 65536,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            directory: cache directory, it gets created if it does not exist
+            max_bytes: approximate maximum total size of the entry files, see the synchronous `DiskBackend`
+            mmap_threshold: values of this size or larger are copied out of a memory mapping instead of `pread()`
+            batch_size: number of keys which `get_many()` reads in a single executor call
+        """
+        self._inner = SyncDiskBackend(directory, max_bytes=max_bytes, mmap_threshold=mmap_threshold)
+        self._batch_size = batch_size
+
+    async def get(self, key: str) -> bytes:
+        return await to_thread(self._inner.get, key)
+
+    async def get_many(self, *keys: str) -> AsyncIterable[tuple[str, bytes]]:
+        for start in range(0, len(keys), self._batch_size):
+            batch = keys[start : start + self._batch_size]
+            for item in await to_thread(lambda: list(self._inner.get_many(*batch))):  # noqa: B023
+                yield item
+
+    async def expire_in(self, key: str, time_to_live: timedelta | None = None) -> None:
+        await to_thread(self._inner.expire_in, key, time_to_live)
+
+    async def expire_at(self, key: str, deadline: datetime | None) -> None:
+        await to_thread(self._inner.expire_at, key, deadline)
+
+    async def set(  # noqa: A003
+        self,
+        key: str,
+        value: bytes,
+        *,
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> bool:
+        return await to_thread(self._inner.set, key, value, time_to_live=time_to_live, if_not_exists=if_not_exists)
+
+    async def set_many(
+        self,
+        items: Iterable[tuple[str, bytes]],
+        *,
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> list[bool]:
+        return await to_thread(
+            self._inner.set_many,
+            list(items),
+            time_to_live=time_to_live,
+            if_not_exists=if_not_exists,
+        )
+
+    async def delete(self, key: str) -> bool:
+        return await to_thread(self._inner.delete, key)
+
+    async def delete_many(self, *keys: str) -> None:
+        await to_thread(self._inner.delete_many, *keys)
+
+    async def clear(self) -> None:
+        await to_thread(self._inner.clear)
+
+    async def clear_prefix(self, prefix: str) -> None:
+        await to_thread(self._inner.clear_prefix, prefix)
+
+    async def delete_expired(self) -> int:
+        """
+        Delete all the expired entries.
+
+        Returns:
+            Number of the deleted entries.
+        """
+        return await to_thread(self._inner.delete_expired)
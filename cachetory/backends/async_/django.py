@@ -52,8 +52,19 @@ class DjangoBackend(AsyncBackend[WireT], Generic[WireT]):
             await self._cache.aset(key, value, timeout)
             return True
 
-    async def set_many(self, items: Iterable[tuple[str, WireT]]) -> None:
-        await self._cache.aset_many(dict(items))
+    async def set_many(
+        self,
+        items: Iterable[tuple[str, WireT]],
+        *,
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> list[bool]:
+        timeout = self._to_timeout(time_to_live)
+        if if_not_exists:
+            return [bool(await self._cache.aadd(key, value, timeout)) for key, value in items]
+        items = list(items)
+        failed_keys = set(await self._cache.aset_many(dict(items), timeout))
+        return [key not in failed_keys for key, _ in items]
 
     async def delete(self, key: str) -> bool:
         return await self._cache.adelete(key)  # type: ignore[no-any-return]
@@ -64,6 +75,9 @@ class DjangoBackend(AsyncBackend[WireT], Generic[WireT]):
     async def clear(self) -> None:
         await self._cache.aclear()
 
+    async def clear_prefix(self, prefix: str) -> None:
+        raise NotImplementedError("Django cache does not support deleting keys by prefix")
+
     async def expire_in(self, key: str, time_to_live: timedelta | None = None) -> None:
         await self._cache.atouch(key, self._to_timeout(time_to_live))
 
@@ -38,8 +38,14 @@ class DummyBackend(AsyncBackend[WireT], Generic[WireT]):
     ) -> bool:  # pragma: no cover
         return True
 
-    async def set_many(self, items: Iterable[tuple[str, WireT]]) -> None:  # pragma: no cover
-        return None
+    async def set_many(
+        self,
+        items: Iterable[tuple[str, WireT]],
+        *,
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> list[bool]:  # pragma: no cover
+        return [True for _ in items]
 
     async def delete(self, key: str) -> bool:  # pragma: no cover
         return False  # has never been there
@@ -49,3 +55,6 @@ class DummyBackend(AsyncBackend[WireT], Generic[WireT]):
 
     async def clear(self) -> None:  # pragma: no cover
         return None  # already perfectly clean
+
+    async def clear_prefix(self, prefix: str) -> None:  # pragma: no cover
+        return None
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from collections.abc import Coroutine
+from collections.abc import AsyncIterable, Iterable
 from datetime import datetime, timedelta
-from typing import Any, Generic
+from os import PathLike
+from types import TracebackType
+from typing import Callable, Generic
 
 from cachetory.backends.sync.memory import MemoryBackend as SyncMemoryBackend
+from cachetory.backends.sync.memory import Policy
 from cachetory.interfaces.backends.async_ import AsyncBackend
 from cachetory.interfaces.backends.private import WireT
-from cachetory.private.asyncio import postpone
 
 
 class MemoryBackend(AsyncBackend[WireT], Generic[WireT]):
@@ -16,44 +18,117 @@ class MemoryBackend(AsyncBackend[WireT], Generic[WireT]):
     __slots__ = ("_inner",)
 
     @classmethod
-    def from_url(cls, _url: str) -> MemoryBackend[WireT]:
-        return MemoryBackend()
+    def from_url(cls, url: str) -> MemoryBackend[WireT]:
+        """
+        Instantiate a backend from the URL.
 
-    def __init__(self) -> None:
-        # We'll simply delegate call to the wrapped backend.
-        self._inner: SyncMemoryBackend[WireT] = SyncMemoryBackend()
+        Accepts the same URL parameters as the synchronous `MemoryBackend`.
+        """
+        backend = cls()
+        backend._inner = SyncMemoryBackend.from_url(url)
+        return backend
 
-    def get(self, key: str) -> Coroutine[Any, Any, WireT]:
-        return postpone(self._inner.get, key)
+    def __init__(
+        self,
+        *,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        weigh: Callable[[WireT], int] | None = None,
+        expire_batch_size: int = 20,
+        policy: Policy = "lru",
+        snapshot: str | PathLike[str] | None = None,
+    ) -> None:
+        """
+        Initialize the backend.
+
+        The parameters are the same as of the synchronous `MemoryBackend`.
+        """
+        # We'll simply delegate calls to the wrapped backend. The calls never block,
+        # so there's no need to run them in an executor.
+        self._inner: SyncMemoryBackend[WireT] = SyncMemoryBackend(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            weigh=weigh,
+            expire_batch_size=expire_batch_size,
+            policy=policy,
+            snapshot=snapshot,
+        )
+
+    async def get(self, key: str) -> WireT:
+        return self._inner.get(key)
+
+    async def get_many(self, *keys: str) -> AsyncIterable[tuple[str, WireT]]:
+        for item in self._inner.get_many(*keys):
+            yield item
 
-    def expire_at(self, key: str, deadline: datetime | None) -> Coroutine[Any, Any, None]:
-        return postpone(self._inner.expire_at, key, deadline)
+    async def expire_in(self, key: str, time_to_live: timedelta | None = None) -> None:
+        self._inner.expire_in(key, time_to_live)
 
-    def set(  # noqa: A003
+    async def expire_at(self, key: str, deadline: datetime | None) -> None:
+        self._inner.expire_at(key, deadline)
+
+    async def set(  # noqa: A003
         self,
         key: str,
         value: WireT,
         *,
         time_to_live: timedelta | None = None,
         if_not_exists: bool = False,
-    ) -> Coroutine[Any, Any, bool]:
-        return postpone(
-            self._inner.set,
-            key,
-            value,
-            time_to_live=time_to_live,
-            if_not_exists=if_not_exists,
-        )
+    ) -> bool:
+        return self._inner.set(key, value, time_to_live=time_to_live, if_not_exists=if_not_exists)
 
-    def delete(self, key: str) -> Coroutine[Any, Any, bool]:
-        return postpone(self._inner.delete, key)
+    async def set_many(
+        self,
+        items: Iterable[tuple[str, WireT]],
+        *,
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> list[bool]:
+        return self._inner.set_many(items, time_to_live=time_to_live, if_not_exists=if_not_exists)
 
-    def delete_many(self, *keys: str) -> Coroutine[Any, Any, None]:
-        return postpone(self._inner.delete_many, *keys)
+    async def delete(self, key: str) -> bool:
+        return self._inner.delete(key)
 
-    def clear(self) -> Coroutine[Any, Any, None]:
-        return postpone(self._inner.clear)
+    async def delete_many(self, *keys: str) -> None:
+        self._inner.delete_many(*keys)
+
+    async def clear(self) -> None:
+        self._inner.clear()
+
+    async def clear_prefix(self, prefix: str) -> None:
+        self._inner.clear_prefix(prefix)
+
+    async def delete_expired(self) -> int:
+        return self._inner.delete_expired()
+
+    def dump(self, path: str | PathLike[str]) -> int:
+        """
+        Write the live entries into the snapshot file, see the synchronous `MemoryBackend.dump()`.
+
+        This is a blocking call, it is meant to be made on shutdown.
+        """
+        return self._inner.dump(path)
+
+    def load(self, path: str | PathLike[str]) -> int:
+        """
+        Load the entries from the snapshot file, see the synchronous `MemoryBackend.load()`.
+
+        This is a blocking call, it is meant to be made on startup.
+        """
+        return self._inner.load(path)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._inner.__exit__(exc_type, exc_value, traceback)
 
     @property
     def size(self) -> int:
         return self._inner.size
+
+    @property
+    def nbytes(self) -> int:
+        return self._inner.nbytes
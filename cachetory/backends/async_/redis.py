@@ -1,55 +1,193 @@
 from __future__ import annotations
 
+import asyncio
 import itertools
-from collections.abc import AsyncIterable, Iterable
+import secrets
+from collections.abc import AsyncIterable, Collection, Iterable, Sequence
+from contextlib import suppress
 from datetime import datetime, timedelta
 from types import TracebackType
+from typing import Any
+from weakref import WeakKeyDictionary
 
-from redis.asyncio import Redis
+from redis.asyncio import BlockingConnectionPool, ConnectionPool, Redis, RedisError
+from redis.asyncio.client import PubSub
+from redis.asyncio.connection import AbstractConnection
+from redis.exceptions import ResponseError
 
 from cachetory.interfaces.backends.async_ import AsyncBackend
+from cachetory.private.redis import (
+    FILL_SCRIPT,
+    GET_CONNECTION_ARGS,
+    GET_OR_LEASE_SCRIPT,
+    INVALIDATION_CHANNEL,
+    LEASE_GRANTED,
+    LEASE_HIT,
+    MANIFEST_SIZE,
+    RELEASE_SCRIPT,
+    SCAN_BATCH_SIZE,
+    NearCache,
+    PoolMetrics,
+    PoolStats,
+    UrlParams,
+    ValueManifest,
+    decode_invalidated_keys,
+    make_fill_channel,
+    make_lease_key,
+    make_match_pattern,
+    make_tracking_command,
+    split_into_chunks,
+    split_url,
+)
 
 
 class RedisBackend(AsyncBackend[bytes]):
     """Asynchronous Redis backend."""
 
-    __slots__ = ("_client",)
+    __slots__ = (
+        "_client",
+        "_near_cache",
+        "_listener",
+        "_get_batcher",
+        "_chunk_size",
+        "_value_chunk_size",
+        "_get_or_lease_script",
+        "_fill_script",
+        "_release_script",
+    )
 
     @classmethod
     def from_url(cls, url: str) -> RedisBackend:
-        """Instantiate a backend from the URL."""
+        """
+        Instantiate a backend from the URL.
+
+        Accepts the same URL parameters as the synchronous `RedisBackend`, plus:
+
+        | Parameter             |                                                                    |
+        |-----------------------|--------------------------------------------------------------------|
+        | `get-batch-size`      | enables the `get()` batching, up to this number of keys per `MGET` |
+        | `get-batch-window-us` | batching window in microseconds, `0` means the current loop tick   |
+        """
         if url.startswith("redis+"):
             url = url[6:]
-        return RedisBackend(Redis.from_url(url))
+        url, params = split_url(url)
+        pool_class = _MeteredBlockingConnectionPool if params.blocking_pool else _MeteredConnectionPool
+        client = Redis(connection_pool=pool_class.from_url(url, **params.make_pool_kwargs()))
+        client.auto_close_connection_pool = True  # like `Redis.from_url()` does
+        return cls._from_params(client, params)
+
+    @classmethod
+    def _from_params(cls, client: Redis, params: UrlParams) -> RedisBackend:  # type: ignore[type-arg]
+        """Instantiate a backend using the client and the parsed URL parameters."""
+        return cls(
+            client,
+            near_cache_size=params.near_cache_size,
+            near_cache_prefixes=params.near_cache_prefixes,
+            get_batch_size=params.get_batch_size,
+            get_batch_window=timedelta(microseconds=params.get_batch_window_us),
+            chunk_size=params.chunk_size,
+            value_chunk_size=params.value_chunk_size,
+        )
+
+    def __init__(
+        self,
+        client: Redis,  # type: ignore[type-arg]
+        *,
+        near_cache_size: int | None = None,
+        near_cache_prefixes: Collection[str] = (),
+        get_batch_size: int | None = None,
+        get_batch_window: timedelta = timedelta(),
+        chunk_size: int | None = None,
+        value_chunk_size: int | None = None,
+    ) -> None:
+        """
+        Instantiate a backend using the Redis client.
 
-    def __init__(self, client: Redis) -> None:  # type: ignore[type-arg]
-        """Instantiate a backend using the Redis client."""
+        Args:
+            client: Redis client
+            near_cache_size: see the synchronous `RedisBackend`
+            near_cache_prefixes: see the synchronous `RedisBackend`
+            get_batch_size:
+                If set, concurrent `get()` calls are merged into a single `MGET` of up to this number of keys.
+                Each caller still receives its own value.
+            get_batch_window:
+                How long a batch waits for more keys. By default, the batch collects the keys
+                requested within the current event loop iteration.
+            chunk_size:
+                See the synchronous `RedisBackend`. Additionally, `get_many()` fetches the next chunk
+                while the caller is consuming the current one.
+            value_chunk_size: see the synchronous `RedisBackend`
+
+        Note:
+            The invalidation listener task starts on the first read.
+        """
         self._client = client
+        self._chunk_size = chunk_size
+        self._value_chunk_size = value_chunk_size
+        self._get_or_lease_script = client.register_script(GET_OR_LEASE_SCRIPT)
+        self._fill_script = client.register_script(FILL_SCRIPT)
+        self._release_script = client.register_script(RELEASE_SCRIPT)
+        self._near_cache: NearCache | None = None
+        self._listener: _InvalidationListener | None = None
+        if near_cache_size is not None:
+            self._near_cache = NearCache(near_cache_size)
+            self._listener = _InvalidationListener(client.connection_pool, self._near_cache, near_cache_prefixes)
+        self._get_batcher: _GetBatcher | None = None
+        if get_batch_size is not None:
+            self._get_batcher = _GetBatcher(client, self._listener, get_batch_size, get_batch_window.total_seconds())
 
     async def get(self, key: str) -> bytes:
-        data: bytes | None = await self._client.get(key)
-        if data is not None:
-            return data
+        if (near_cache := self._near_cache) is not None:
+            self._listener.ensure_started()  # type: ignore[union-attr]
+            if (value := near_cache.get(key)) is not None:
+                return value
+            token = near_cache.reserve(key)
+            data: bytes | None = None
+            is_tracked = False
+            try:
+                data, is_tracked = await self._fetch(key)
+            finally:
+                near_cache.fill(key, token, data if is_tracked else None)
+        else:
+            data, _ = await self._fetch(key)
+        if data is not None and (value := await self._join_chunks(key, data)) is not None:
+            return value
         raise KeyError(key)
 
     async def get_many(self, *keys: str) -> AsyncIterable[tuple[str, bytes]]:
-        for key, value in zip(keys, await self._client.mget(*keys)):
-            if value is not None:
-                yield key, value
+        if not keys:
+            return
+        if self._listener is not None:
+            self._listener.ensure_started()
+        chunks = split_into_chunks(keys, self._chunk_size)
+        # Fetching the next chunk while the caller is consuming the current one.
+        fetching = asyncio.ensure_future(self._get_chunk(chunks[0]))
+        try:
+            for next_chunk in itertools.chain(chunks[1:], (None,)):
+                items = await fetching
+                if next_chunk is not None:
+                    fetching = asyncio.ensure_future(self._get_chunk(next_chunk))
+                for key, data in items:
+                    if (value := await self._join_chunks(key, data)) is not None:
+                        yield key, value
+        finally:
+            # The prefetch is not needed anymore, and its exception, if any, must not go unretrieved:
+            fetching.add_done_callback(_retrieve_exception)
+            fetching.cancel()
 
     async def expire_at(self, key: str, deadline: datetime | None) -> None:
         if deadline:
             # One can pass `datetime` directly to `pexpireat`, but the latter
             # incorrectly converts datetime into timestamp.
-            await self._client.pexpireat(key, int(deadline.timestamp() * 1000.0))
+            await self._expire(key, "PEXPIREAT", int(deadline.timestamp() * 1000.0))
         else:
-            await self._client.persist(key)
+            await self._expire(key, "PERSIST")
 
     async def expire_in(self, key: str, time_to_live: timedelta | None = None) -> None:
         if time_to_live:
-            await self._client.pexpire(key, time_to_live)
+            await self._expire(key, "PEXPIRE", int(time_to_live.total_seconds() * 1000.0))
         else:
-            await self._client.persist(key)
+            await self._expire(key, "PERSIST")
 
     async def set(  # noqa: A003
         self,
@@ -59,20 +197,169 @@ class RedisBackend(AsyncBackend[bytes]):
         time_to_live: timedelta | None = None,
         if_not_exists: bool = False,
     ) -> bool:
-        return bool(await self._client.set(key, value, px=time_to_live, nx=if_not_exists))
+        if self._value_chunk_size is not None:
+            return (await self._set_chunked([(key, value)], time_to_live, if_not_exists))[0]
+        is_set = bool(await self._client.set(key, value, px=time_to_live, nx=if_not_exists))
+        self._discard(key)
+        return is_set
 
-    async def set_many(self, items: Iterable[tuple[str, bytes]]) -> None:
-        await self._client.execute_command("MSET", *itertools.chain.from_iterable(items))
+    async def set_many(
+        self,
+        items: Iterable[tuple[str, bytes]],
+        *,
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> list[bool]:
+        items = list(items)
+        if not items:
+            return []
+        if self._value_chunk_size is not None:
+            return await self._set_chunked(items, time_to_live, if_not_exists)
+        if time_to_live is None and not if_not_exists:
+            # Plain `MSET` is a single atomic command.
+            await self._client.execute_command("MSET", *itertools.chain.from_iterable(items))
+            results = [True] * len(items)
+        else:
+            # `MSET` can carry neither expiration, nor per-key `NX`, thus sending `SET`'s in a single round trip.
+            pipeline = self._client.pipeline(transaction=False)
+            for key, value in items:
+                pipeline.set(key, value, px=time_to_live, nx=if_not_exists)
+            results = [bool(result) for result in await pipeline.execute()]
+        self._discard(*(key for key, _ in items))
+        return results
 
     async def delete(self, key: str) -> bool:
-        return bool(await self._client.delete(key))
+        if self._value_chunk_size is not None:
+            transaction = self._client.pipeline(transaction=True)
+            transaction.getrange(key, 0, MANIFEST_SIZE - 1)
+            transaction.delete(key)
+            head, n_deleted = await transaction.execute()
+            await self._delete_chunks([(key, head)])
+            is_deleted = bool(n_deleted)
+        else:
+            is_deleted = bool(await self._client.delete(key))
+        self._discard(key)
+        return is_deleted
 
     async def delete_many(self, *keys: str) -> None:
-        if keys:
+        if not keys:
+            return
+        chunks = split_into_chunks(keys, self._chunk_size)
+        if self._value_chunk_size is not None:
+            pipeline = self._client.pipeline(transaction=False)
+            for key in keys:
+                pipeline.getrange(key, 0, MANIFEST_SIZE - 1)
+                pipeline.delete(key)
+            await self._delete_chunks(zip(keys, (await pipeline.execute())[::2]))
+        elif len(chunks) == 1:
             await self._client.delete(*keys)
+        else:
+            pipeline = self._client.pipeline(transaction=False)
+            for chunk in chunks:
+                pipeline.delete(*chunk)
+            await pipeline.execute()
+        self._discard(*keys)
 
     async def clear(self) -> None:
-        await self._client.flushdb()
+        await self._client.flushdb(asynchronous=True)
+        if self._near_cache is not None:
+            self._near_cache.clear()
+
+    async def clear_prefix(self, prefix: str) -> None:
+        """
+        Delete the keys which start with the prefix, see the synchronous `RedisBackend.clear_prefix()`.
+
+        Each batch is unlinked while the next one is being scanned.
+        """
+        cursor = 0
+        unlinking: asyncio.Task[Any] | None = None
+        try:
+            while True:
+                cursor, keys = await self._client.scan(cursor, match=make_match_pattern(prefix), count=SCAN_BATCH_SIZE)
+                if unlinking is not None:
+                    await unlinking
+                    unlinking = None
+                if keys:
+                    unlinking = asyncio.ensure_future(self._client.unlink(*keys))
+                if cursor == 0:
+                    break
+            if unlinking is not None:
+                await unlinking
+        finally:
+            if unlinking is not None and not unlinking.done():
+                unlinking.cancel()
+        if self._near_cache is not None:
+            self._near_cache.clear()
+
+    async def get_or_lease(self, key: str, lease_time_to_live: timedelta) -> tuple[bytes | None, str | None]:
+        """Get the value or try to acquire the lease to compute it, see the synchronous `RedisBackend`."""
+        token = secrets.token_hex(16)
+        args: list[str | int | bytes] = [token, max(int(lease_time_to_live.total_seconds() * 1000.0), 1)]
+        while True:
+            status, *payload = await self._get_or_lease_script(keys=[key, make_lease_key(key)], args=args)
+            if status != LEASE_HIT:
+                break
+            if (value := await self._join_chunks(key, payload[0])) is not None:
+                return value, None
+            # Some chunks have been evicted: treating the value as missing, and dropping the rest of its chunks.
+            if (manifest := ValueManifest.unpack(payload[0])) is not None:
+                await self._client.delete(*manifest.make_chunk_keys(key))
+            args = [*args[:2], payload[0]]
+        if status == LEASE_GRANTED:
+            return None, token
+        return None, None
+
+    async def fill(self, key: str, value: bytes, token: str, *, time_to_live: timedelta | None = None) -> bool:
+        """Set the value and release the lease, see the synchronous `RedisBackend`."""
+        chunk_keys: list[str] = []
+        if self._value_chunk_size is not None:
+            ((_, value, chunk_keys),) = await self._write_chunks([(key, value)], time_to_live)
+        result = await self._fill_script(
+            keys=[key, make_lease_key(key)],
+            args=[
+                token,
+                value,
+                int(time_to_live.total_seconds() * 1000.0) if time_to_live is not None else "",
+                make_fill_channel(key),
+                MANIFEST_SIZE,
+            ],
+        )
+        self._discard(key)
+        if result is None:
+            if chunk_keys:
+                await self._client.unlink(*chunk_keys)
+            return False
+        await self._delete_chunks([(key, result[0])])
+        return True
+
+    async def release(self, key: str, token: str) -> None:
+        """Release the lease without filling the value."""
+        await self._release_script(keys=[make_lease_key(key)], args=[token, make_fill_channel(key)])
+
+    async def wait_for_fill(self, key: str, timeout: timedelta) -> bytes:
+        """
+        Wait until the lease holder fills the value, see the synchronous `RedisBackend`.
+
+        Raises:
+            KeyError: the value has not been filled within the timeout, or the lease has been released
+        """
+        async with self._client.pubsub(ignore_subscribe_messages=True) as pubsub:
+            await pubsub.subscribe(make_fill_channel(key))
+            deadline = asyncio.get_running_loop().time() + timeout.total_seconds()
+            is_notified = False
+            while True:
+                with suppress(KeyError):
+                    return await self.get(key)
+                if is_notified or (remaining := deadline - asyncio.get_running_loop().time()) <= 0.0:
+                    raise KeyError(key)
+                is_notified = await pubsub.get_message(timeout=remaining) is not None
+
+    def pool_stats(self) -> PoolStats | None:
+        """Get the connection pool statistics, see the synchronous `RedisBackend`."""
+        pool = self._client.connection_pool
+        if not isinstance(pool, _MeteredConnectionPool):
+            return None
+        return pool.metrics.snapshot(pool.max_connections)
 
     async def __aexit__(
         self,
@@ -80,5 +367,343 @@ class RedisBackend(AsyncBackend[bytes]):
         exc_value: BaseException | None,
         traceback: TracebackType | None,
     ) -> None:
+        if self._listener is not None:
+            await self._listener.stop()
         await self._client.connection_pool.disconnect()  # https://github.com/aio-libs/aioredis-py/issues/1103
         return await self._client.__aexit__(exc_type, exc_value, traceback)
+
+    async def _fetch(self, key: str) -> tuple[bytes | None, bool]:
+        """Fetch the value, and tell whether the key is tracked, so that the value may be stored in the near cache."""
+        if self._get_batcher is not None:
+            # Shielding, so that a cancelled caller does not cancel the other callers of the same key.
+            return await asyncio.shield(self._get_batcher.get(key))
+        if self._listener is not None:
+            return await self._listener.execute("GET", key)
+        return await self._client.get(key), False  # type: ignore[return-value]
+
+    async def _get_chunk(self, keys: Sequence[str]) -> list[tuple[str, bytes]]:
+        if (near_cache := self._near_cache) is None:
+            fetched_values: list[bytes | None] = await self._client.mget(*keys)
+            return [(key, value) for key, value in zip(keys, fetched_values) if value is not None]
+
+        local_items: dict[str, bytes] = {}
+        for key in keys:
+            if (value := near_cache.get(key)) is not None:
+                local_items[key] = value
+        missing_keys = [key for key in keys if key not in local_items]
+        if missing_keys:
+            tokens = [near_cache.reserve(key) for key in missing_keys]
+            values: list[bytes | None] = [None] * len(missing_keys)
+            is_tracked = False
+            try:
+                values, is_tracked = await self._listener.execute("MGET", *missing_keys)  # type: ignore[union-attr]
+            finally:
+                for key, token, value in zip(missing_keys, tokens, values):
+                    near_cache.fill(key, token, value if is_tracked else None)
+            local_items.update((key, value) for key, value in zip(missing_keys, values) if value is not None)
+        return [(key, value) for key in keys if (value := local_items.get(key)) is not None]
+
+    async def _join_chunks(self, key: str, data: bytes) -> bytes | None:
+        """Fetch the chunks if the data is a manifest, see the synchronous `RedisBackend`."""
+        if self._value_chunk_size is None or (manifest := ValueManifest.unpack(data)) is None:
+            return data
+        pipeline = self._client.pipeline(transaction=False)
+        for chunk_key in manifest.make_chunk_keys(key):
+            pipeline.get(chunk_key)
+        return manifest.join(await pipeline.execute())
+
+    async def _set_chunked(
+        self,
+        items: Iterable[tuple[str, bytes]],
+        time_to_live: timedelta | None,
+        if_not_exists: bool,
+    ) -> list[bool]:
+        """Set the values, splitting the large ones into chunks, see the synchronous `RedisBackend`."""
+        stored_items = await self._write_chunks(items, time_to_live)
+        transaction = self._client.pipeline(transaction=True)
+        for key, value, _ in stored_items:
+            transaction.getrange(key, 0, MANIFEST_SIZE - 1)
+            transaction.set(key, value, px=time_to_live, nx=if_not_exists)
+        responses = await transaction.execute()
+        results = [bool(is_set) for is_set in responses[1::2]]
+
+        await self._delete_chunks(
+            (key, head) for (key, _, _), head, is_set in zip(stored_items, responses[::2], results) if is_set
+        )
+        if unused_chunk_keys := [
+            chunk_key
+            for (_, _, chunk_keys), is_set in zip(stored_items, results)
+            if not is_set
+            for chunk_key in chunk_keys
+        ]:
+            await self._client.unlink(*unused_chunk_keys)
+        self._discard(*(key for key, _, _ in stored_items))
+        return results
+
+    async def _write_chunks(
+        self,
+        items: Iterable[tuple[str, bytes]],
+        time_to_live: timedelta | None,
+    ) -> list[tuple[str, bytes, list[str]]]:
+        """Write the chunks of the large values in a single pipeline, see the synchronous `RedisBackend`."""
+        chunk_size = self._value_chunk_size
+        assert chunk_size is not None
+        stored_items: list[tuple[str, bytes, list[str]]] = []
+        chunk_pipeline = self._client.pipeline(transaction=False)
+        for key, value in items:
+            chunk_keys: list[str] = []
+            if ValueManifest.is_required(value, chunk_size):
+                manifest = ValueManifest.new(len(value), chunk_size)
+                chunk_keys = manifest.make_chunk_keys(key)
+                view = memoryview(value)
+                for offset, chunk_key in zip(range(0, len(value), chunk_size), chunk_keys):
+                    chunk_pipeline.set(chunk_key, view[offset : offset + chunk_size], px=time_to_live)
+                value = manifest.pack()
+            stored_items.append((key, value, chunk_keys))
+        if len(chunk_pipeline):
+            await chunk_pipeline.execute()
+        return stored_items
+
+    async def _delete_chunks(self, heads: Iterable[tuple[str, bytes | None]]) -> None:
+        """Delete the chunks of the manifests, given the keys and the leading bytes of their former values."""
+        chunk_keys = [
+            chunk_key
+            for key, head in heads
+            if (manifest := ValueManifest.unpack(head)) is not None
+            for chunk_key in manifest.make_chunk_keys(key)
+        ]
+        if chunk_keys:
+            await self._client.unlink(*chunk_keys)
+
+    async def _expire(self, key: str, command: str, *args: Any) -> None:
+        """Apply the expiration command to the key and, if the value is chunked, to its chunks."""
+        self._discard(key)
+        if self._value_chunk_size is None:
+            await self._client.execute_command(command, key, *args)
+            return
+        transaction = self._client.pipeline(transaction=True)
+        transaction.getrange(key, 0, MANIFEST_SIZE - 1)
+        transaction.execute_command(command, key, *args)
+        head, _ = await transaction.execute()
+        if (manifest := ValueManifest.unpack(head)) is not None:
+            pipeline = self._client.pipeline(transaction=False)
+            for chunk_key in manifest.make_chunk_keys(key):
+                pipeline.execute_command(command, chunk_key, *args)
+            await pipeline.execute()
+
+    def _discard(self, *keys: str) -> None:
+        """Drop the local copies of the keys modified by this client, see the synchronous `RedisBackend`."""
+        if self._near_cache is not None:
+            self._near_cache.discard(keys)
+
+
+class _GetBatcher:
+    """Collects the concurrently requested keys into batches, and fetches each batch with a single `MGET`."""
+
+    __slots__ = ("_client", "_listener", "_max_size", "_window", "_pending", "_flush_handle", "_tasks")
+
+    def __init__(
+        self,
+        client: Redis,  # type: ignore[type-arg]
+        listener: _InvalidationListener | None,
+        max_size: int,
+        window: float,
+    ) -> None:
+        self._client = client
+        self._listener = listener
+        self._max_size = max_size
+        self._window = window
+        # Each future resolves to the value, and whether the key is tracked, see `RedisBackend._fetch()`:
+        self._pending: dict[str, asyncio.Future[tuple[bytes | None, bool]]] = {}
+        self._flush_handle: asyncio.Handle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()  # strong references to the running batches
+
+    def get(self, key: str) -> asyncio.Future[tuple[bytes | None, bool]]:
+        """Schedule the key to be fetched with the next batch, and return its future."""
+        if (future := self._pending.get(key)) is not None:
+            return future  # the same key requested twice within a batch is fetched once
+        loop = asyncio.get_running_loop()
+        self._pending[key] = future = loop.create_future()
+        if len(self._pending) >= self._max_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = (
+                loop.call_later(self._window, self._flush) if self._window > 0.0 else loop.call_soon(self._flush)
+            )
+        return future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        task = asyncio.get_running_loop().create_task(self._fetch_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fetch_batch(self, batch: dict[str, asyncio.Future[tuple[bytes | None, bool]]]) -> None:
+        try:
+            if self._listener is not None:
+                values, is_tracked = await self._listener.execute("MGET", *batch)
+            else:
+                values, is_tracked = await self._client.mget(list(batch)), False
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for future, value in zip(batch.values(), values):
+                if not future.done():
+                    future.set_result((value, is_tracked))
+
+
+class _MeteredConnectionPool(ConnectionPool):
+    """Connection pool which counts the connections and measures the checkout time."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.metrics = PoolMetrics()  # the parent constructor already calls `reset()`
+        super().__init__(*args, **kwargs)
+
+    def reset(self) -> None:
+        self.metrics.reset()
+        super().reset()
+
+    def make_connection(self) -> Any:
+        self.metrics.on_created()
+        return super().make_connection()
+
+    async def get_connection(self, *args: Any, **kwargs: Any) -> Any:
+        started_at = asyncio.get_running_loop().time()
+        try:
+            connection = await super().get_connection(*args, **kwargs)
+        except BaseException:
+            self.metrics.on_failed(asyncio.get_running_loop().time() - started_at)
+            raise
+        self.metrics.on_acquired(connection, asyncio.get_running_loop().time() - started_at)
+        return connection
+
+    async def release(self, connection: Any) -> None:
+        self.metrics.on_released(connection)
+        await super().release(connection)
+
+
+class _MeteredBlockingConnectionPool(_MeteredConnectionPool, BlockingConnectionPool):
+    """Blocking connection pool, which counts the connections and measures the checkout time."""
+
+
+class _InvalidationListener:
+    """
+    Receives the invalidation messages in a background task, and applies them to the near cache.
+
+    See the synchronous `_InvalidationListener` for the details.
+    """
+
+    __slots__ = ("_data_pool", "_pool", "_near_cache", "_prefixes", "_task", "_client_id", "_tracked_ids")
+
+    def __init__(self, data_pool: ConnectionPool, near_cache: NearCache, prefixes: Collection[str]) -> None:
+        self._data_pool = data_pool
+        # Separate pool, so that the listener connection does not get the tracking enabled.
+        self._pool = ConnectionPool(connection_class=data_pool.connection_class, **data_pool.connection_kwargs)
+        self._near_cache = near_cache
+        self._prefixes = prefixes
+        # Current listener connection ID, `None` while the listener is not subscribed:
+        self._client_id: int | None = None
+        # Listener connection IDs, to which the data connections redirect the invalidations:
+        self._tracked_ids: WeakKeyDictionary[AbstractConnection, int] = WeakKeyDictionary()
+        data_pool.connection_kwargs["redis_connect_func"] = self._connect
+        self._task: asyncio.Task[None] | None = None
+
+    def ensure_started(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self._client_id = None
+        self._near_cache.disable()
+        await self._pool.disconnect()
+
+    async def execute(self, *args: Any) -> tuple[Any, bool]:
+        """Execute the read command on a data connection, see the synchronous `_InvalidationListener.execute()`."""
+        connection = await self._data_pool.get_connection(*GET_CONNECTION_ARGS)
+        try:
+            is_tracked = await self.ensure_tracking(connection)
+            await connection.send_command(*args)
+            response = await connection.read_response()
+        except BaseException:
+            await connection.disconnect()
+            raise
+        finally:
+            await self._data_pool.release(connection)
+        return response, is_tracked
+
+    async def ensure_tracking(self, connection: AbstractConnection) -> bool:
+        """See the synchronous `_InvalidationListener.ensure_tracking()`."""
+        if (client_id := self._client_id) is None:
+            return False
+        if self._tracked_ids.get(connection) == client_id:
+            return True
+        connection.redis_connect_func = self._connect
+        await connection.disconnect()
+        await connection.connect()
+        return self._tracked_ids.get(connection) == client_id
+
+    async def _connect(self, connection: AbstractConnection) -> None:
+        self._tracked_ids.pop(connection, None)
+        await connection.on_connect()
+        if (client_id := self._client_id) is None:
+            return
+        await connection.send_command(*make_tracking_command(client_id, self._prefixes))
+        try:
+            await connection.read_response()
+        except ResponseError:
+            return  # the listener connection is gone meanwhile, the data connection stays untracked
+        self._tracked_ids[connection] = client_id
+
+    async def _run(self) -> None:
+        while True:
+            pubsub = Redis(connection_pool=self._pool).pubsub()
+            try:
+                await self._subscribe(pubsub)
+                while True:
+                    self._handle(await pubsub.get_message(timeout=_POLL_INTERVAL))
+            except RedisError:
+                self._client_id = None
+                self._near_cache.disable()
+                await asyncio.sleep(_RECONNECT_INTERVAL)
+            finally:
+                await pubsub.reset()
+
+    async def _subscribe(self, pubsub: PubSub) -> None:
+        await pubsub.execute_command("CLIENT", "ID")
+        client_id = await pubsub.parse_response()
+        await pubsub.subscribe(INVALIDATION_CHANNEL)
+        # The data connections switch to the new listener connection as they get checked out:
+        self._near_cache.clear()
+        self._client_id = client_id
+        self._near_cache.enable()
+
+    def _handle(self, message: dict[str, Any] | None) -> None:
+        if message is None or message["type"] != "message":
+            return
+        if (keys := decode_invalidated_keys(message["data"])) is not None:
+            self._near_cache.discard(keys)
+        else:
+            self._near_cache.clear()
+
+
+_POLL_INTERVAL = 1.0
+_RECONNECT_INTERVAL = 1.0
+
+
+def _retrieve_exception(task: asyncio.Future[Any]) -> None:
+    if not task.cancelled():
+        task.exception()
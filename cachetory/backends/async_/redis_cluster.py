@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import itertools
+from collections.abc import AsyncIterable, Iterable
+from datetime import datetime, timedelta
+from types import TracebackType
+
+from redis.asyncio.cluster import RedisCluster
+
+from cachetory.interfaces.backends.async_ import AsyncBackend
+from cachetory.private.redis import SCAN_BATCH_SIZE, group_by_slot, make_hash_tag, make_match_pattern
+
+
+class RedisClusterBackend(AsyncBackend[bytes]):
+    """
+    Asynchronous Redis Cluster backend.
+
+    The multi-key operations group the keys by slot, and the pipeline sends the per-node batches concurrently.
+    See also the synchronous `RedisClusterBackend`.
+    """
+
+    __slots__ = ("_client",)
+
+    @classmethod
+    def from_url(cls, url: str) -> RedisClusterBackend:
+        """
+        Instantiate a backend from the URL.
+
+        Accepts the same URL as the synchronous `RedisClusterBackend`.
+        """
+        scheme, rest = url.split("://", 1)
+        return cls(RedisCluster.from_url(f"{scheme.removesuffix('+cluster')}://{rest}"))
+
+    def __init__(self, client: RedisCluster) -> None:
+        """
+        Instantiate a backend using the Redis Cluster client.
+
+        Args:
+            client: Redis Cluster client
+        """
+        self._client = client
+
+    @staticmethod
+    def hash_tag(prefix: str) -> str:
+        """Turn the cache prefix into a hash tag, see the synchronous `RedisClusterBackend.hash_tag()`."""
+        return make_hash_tag(prefix)
+
+    async def get(self, key: str) -> bytes:
+        if (data := await self._client.get(key)) is not None:
+            return data  # type: ignore[return-value]
+        raise KeyError(key)
+
+    async def get_many(self, *keys: str) -> AsyncIterable[tuple[str, bytes]]:
+        if not keys:
+            return
+        groups = group_by_slot(keys)
+        pipeline = self._client.pipeline()
+        for slot_keys in groups.values():
+            pipeline.execute_command("MGET", *slot_keys)
+        results = await pipeline.execute()
+        values = dict(zip(itertools.chain.from_iterable(groups.values()), itertools.chain(*results)))
+        for key in keys:
+            if (value := values.get(key)) is not None:
+                yield key, value
+
+    async def expire_at(self, key: str, deadline: datetime | None) -> None:
+        if deadline:
+            await self._client.pexpireat(key, int(deadline.timestamp() * 1000.0))
+        else:
+            await self._client.persist(key)
+
+    async def expire_in(self, key: str, time_to_live: timedelta | None = None) -> None:
+        if time_to_live:
+            await self._client.pexpire(key, time_to_live)
+        else:
+            await self._client.persist(key)
+
+    async def set(  # noqa: A003
+        self,
+        key: str,
+        value: bytes,
+        *,
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> bool:
+        return bool(await self._client.set(key, value, px=time_to_live, nx=if_not_exists))
+
+    async def set_many(
+        self,
+        items: Iterable[tuple[str, bytes]],
+        *,
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> list[bool]:
+        items = list(items)
+        if not items:
+            return []
+        pipeline = self._client.pipeline()
+        if time_to_live is None and not if_not_exists:
+            values = dict(items)
+            for slot_keys in group_by_slot(values).values():
+                arguments: list[str | bytes] = []
+                for key in slot_keys:
+                    arguments.extend((key, values[key]))
+                pipeline.execute_command("MSET", *arguments)
+            await pipeline.execute()
+            return [True] * len(items)
+        for key, value in items:
+            pipeline.set(key, value, px=time_to_live, nx=if_not_exists)
+        return [bool(result) for result in await pipeline.execute()]
+
+    async def delete(self, key: str) -> bool:
+        return bool(await self._client.delete(key))
+
+    async def delete_many(self, *keys: str) -> None:
+        if not keys:
+            return
+        pipeline = self._client.pipeline()
+        for slot_keys in group_by_slot(keys).values():
+            pipeline.execute_command("UNLINK", *slot_keys)
+        await pipeline.execute()
+
+    async def clear(self) -> None:
+        await self._client.flushdb(asynchronous=True, target_nodes=RedisCluster.PRIMARIES)
+
+    async def clear_prefix(self, prefix: str) -> None:
+        """Delete the keys which start with the prefix, scanning all the primary nodes."""
+        batch: list[str] = []
+        async for key in self._client.scan_iter(match=make_match_pattern(prefix), count=SCAN_BATCH_SIZE):
+            batch.append(key.decode())
+            if len(batch) >= SCAN_BATCH_SIZE:
+                await self.delete_many(*batch)
+                batch.clear()
+        await self.delete_many(*batch)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self._client.__aexit__(exc_type, exc_value, traceback)
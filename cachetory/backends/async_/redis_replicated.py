@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import itertools
+from collections.abc import AsyncIterable, Iterable, Sequence
+from datetime import datetime, timedelta
+from types import TracebackType
+
+from redis import RedisError
+from redis.asyncio.sentinel import Sentinel
+
+from cachetory.backends.async_.redis import RedisBackend
+from cachetory.interfaces.backends.async_ import AsyncBackend
+from cachetory.private.redis import (
+    RecentWrites,
+    make_replica_urls,
+    parse_sentinel_url,
+    split_replication_url,
+    split_url,
+)
+
+
+class RedisReplicatedBackend(AsyncBackend[bytes]):
+    """
+    Asynchronous Redis backend, which sends the writes to the primary, and balances the reads across the replicas.
+
+    See the synchronous `RedisReplicatedBackend` for the details.
+    """
+
+    __slots__ = ("_primary", "_replicas", "_recent_writes", "_counter")
+
+    @classmethod
+    def from_url(cls, url: str) -> RedisReplicatedBackend:
+        """
+        Instantiate a backend from the URL.
+
+        Accepts the same URL as the synchronous `RedisReplicatedBackend`.
+        """
+        url, replication_params = split_replication_url(url)
+        read_your_writes = (
+            timedelta(milliseconds=replication_params.read_your_writes_ms)
+            if replication_params.read_your_writes_ms is not None
+            else None
+        )
+        scheme, rest = url.split("://", 1)
+        if scheme == "redis+sentinel":
+            url, params = split_url(url)
+            if params.blocking_pool:
+                raise ValueError("`blocking-pool` is not supported with Sentinel")
+            sentinels, service_name, connection_kwargs = parse_sentinel_url(url)
+            sentinel = Sentinel(sentinels, **connection_kwargs, **params.make_pool_kwargs())
+            return cls(
+                RedisBackend._from_params(sentinel.master_for(service_name), params),
+                # The Sentinel replica client balances the reads across the replicas on its own:
+                [RedisBackend._from_params(sentinel.slave_for(service_name), params)],
+                read_your_writes=read_your_writes,
+            )
+        # Turning `redis+replicas://` into `redis://` and `rediss+replicas://` into `rediss://`:
+        primary_url = f"{scheme.removesuffix('+replicas')}://{rest}"
+        return cls(
+            RedisBackend.from_url(primary_url),
+            [
+                RedisBackend.from_url(replica_url)
+                for replica_url in make_replica_urls(primary_url, replication_params.replicas)
+            ],
+            read_your_writes=read_your_writes,
+        )
+
+    def __init__(
+        self,
+        primary: RedisBackend,
+        replicas: Sequence[RedisBackend],
+        *,
+        read_your_writes: timedelta | None = None,
+    ) -> None:
+        """
+        Instantiate a backend using the primary and replica backends.
+
+        The parameters are the same as of the synchronous `RedisReplicatedBackend`.
+        """
+        self._primary = primary
+        self._replicas = replicas
+        self._recent_writes = RecentWrites(read_your_writes) if read_your_writes is not None else None
+        self._counter = itertools.count()
+
+    async def get(self, key: str) -> bytes:
+        if (replica := self._choose_replica(key)) is not None:
+            try:
+                return await replica.get(key)
+            except RedisError:
+                pass  # failing over to the primary
+        return await self._primary.get(key)
+
+    async def get_many(self, *keys: str) -> AsyncIterable[tuple[str, bytes]]:
+        primary_keys, replica_keys = self._split_keys(keys)
+        if replica_keys:
+            replica = self._replicas[next(self._counter) % len(self._replicas)]
+            fetched_keys: set[str] = set()
+            try:
+                async for key, value in replica.get_many(*replica_keys):
+                    fetched_keys.add(key)
+                    yield key, value
+            except RedisError:
+                primary_keys.extend(key for key in replica_keys if key not in fetched_keys)
+        if primary_keys:
+            async for item in self._primary.get_many(*primary_keys):
+                yield item
+
+    async def expire_in(self, key: str, time_to_live: timedelta | None = None) -> None:
+        try:
+            await self._primary.expire_in(key, time_to_live)
+        finally:
+            self._mark_written(key)
+
+    async def expire_at(self, key: str, deadline: datetime | None) -> None:
+        try:
+            await self._primary.expire_at(key, deadline)
+        finally:
+            self._mark_written(key)
+
+    async def set(  # noqa: A003
+        self,
+        key: str,
+        value: bytes,
+        *,
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> bool:
+        try:
+            return await self._primary.set(key, value, time_to_live=time_to_live, if_not_exists=if_not_exists)
+        finally:
+            self._mark_written(key)
+
+    async def set_many(
+        self,
+        items: Iterable[tuple[str, bytes]],
+        *,
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> list[bool]:
+        items = list(items)
+        try:
+            return await self._primary.set_many(items, time_to_live=time_to_live, if_not_exists=if_not_exists)
+        finally:
+            self._mark_written(*(key for key, _ in items))
+
+    async def delete(self, key: str) -> bool:
+        try:
+            return await self._primary.delete(key)
+        finally:
+            self._mark_written(key)
+
+    async def delete_many(self, *keys: str) -> None:
+        try:
+            await self._primary.delete_many(*keys)
+        finally:
+            self._mark_written(*keys)
+
+    async def clear(self) -> None:
+        try:
+            await self._primary.clear()
+        finally:
+            if self._recent_writes is not None:
+                self._recent_writes.add_everything()
+
+    async def clear_prefix(self, prefix: str) -> None:
+        try:
+            await self._primary.clear_prefix(prefix)
+        finally:
+            if self._recent_writes is not None:
+                self._recent_writes.add_everything()
+
+    async def get_or_lease(self, key: str, lease_time_to_live: timedelta) -> tuple[bytes | None, str | None]:
+        """Get the value or try to acquire the lease on the primary, see `RedisBackend.get_or_lease()`."""
+        return await self._primary.get_or_lease(key, lease_time_to_live)
+
+    async def fill(self, key: str, value: bytes, token: str, *, time_to_live: timedelta | None = None) -> bool:
+        """Set the value and release the lease on the primary, see the synchronous `RedisBackend.fill()`."""
+        try:
+            return await self._primary.fill(key, value, token, time_to_live=time_to_live)
+        finally:
+            self._mark_written(key)
+
+    async def release(self, key: str, token: str) -> None:
+        """Release the lease on the primary, see the synchronous `RedisBackend.release()`."""
+        await self._primary.release(key, token)
+
+    async def wait_for_fill(self, key: str, timeout: timedelta) -> bytes:
+        """Wait until the lease holder fills the value on the primary, see `RedisBackend.wait_for_fill()`."""
+        return await self._primary.wait_for_fill(key, timeout)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        for replica in self._replicas:
+            await replica.__aexit__(exc_type, exc_value, traceback)
+        await self._primary.__aexit__(exc_type, exc_value, traceback)
+
+    def _choose_replica(self, key: str) -> RedisBackend | None:
+        """Choose the next replica to read the key from, or `None` to read it from the primary."""
+        if not self._replicas or (self._recent_writes is not None and key in self._recent_writes):
+            return None
+        return self._replicas[next(self._counter) % len(self._replicas)]
+
+    def _split_keys(self, keys: Sequence[str]) -> tuple[list[str], Sequence[str]]:
+        """Split the keys into the ones to read from the primary, and the ones to read from a replica."""
+        if not self._replicas:
+            return list(keys), ()
+        if (recent_writes := self._recent_writes) is None:
+            return [], keys
+        primary_keys: list[str] = []
+        replica_keys: list[str] = []
+        for key in keys:
+            (primary_keys if key in recent_writes else replica_keys).append(key)
+        return primary_keys, replica_keys
+
+    def _mark_written(self, *keys: str) -> None:
+        if self._recent_writes is not None:
+            self._recent_writes.add(keys)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterable, Iterable
+from datetime import datetime, timedelta
+from types import TracebackType
+
+from cachetory.backends.sync.shm import SharedMemoryBackend as SyncSharedMemoryBackend
+from cachetory.interfaces.backends.async_ import AsyncBackend
+
+
+class SharedMemoryBackend(AsyncBackend[bytes]):
+    """
+    Asynchronous version of the shared memory backend.
+
+    The calls are made directly from the event loop: the operations only touch a memory-mapped table,
+    and they only wait for the lock when another process is working on the same set of slots.
+    """
+
+    __slots__ = ("_inner",)
+
+    @classmethod
+    def from_url(cls, url: str) -> SharedMemoryBackend:
+        """
+        Instantiate a backend from the URL.
+
+        Accepts the same URL as the synchronous `SharedMemoryBackend`.
+        """
+        backend = cls.__new__(cls)
+        backend._inner = SyncSharedMemoryBackend.from_url(url)
+        return backend
+
+    def __init__(self, name: str, *, slots: int = 8192, slot_size: int = 4096, ways: int = 8) -> None:
+        """
+        Create or open the shared table.
+
+        The parameters are the same as of the synchronous `SharedMemoryBackend`.
+        """
+        self._inner = SyncSharedMemoryBackend(name, slots=slots, slot_size=slot_size, ways=ways)
+
+    async def get(self, key: str) -> bytes:
+        return self._inner.get(key)
+
+    async def get_many(self, *keys: str) -> AsyncIterable[tuple[str, bytes]]:
+        for item in self._inner.get_many(*keys):
+            yield item
+
+    async def expire_in(self, key: str, time_to_live: timedelta | None = None) -> None:
+        self._inner.expire_in(key, time_to_live)
+
+    async def expire_at(self, key: str, deadline: datetime | None) -> None:
+        self._inner.expire_at(key, deadline)
+
+    async def set(  # noqa: A003
+        self,
+        key: str,
+        value: bytes,
+        *,
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> bool:
+        return self._inner.set(key, value, time_to_live=time_to_live, if_not_exists=if_not_exists)
+
+    async def set_many(
+        self,
+        items: Iterable[tuple[str, bytes]],
+        *,
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> list[bool]:
+        return self._inner.set_many(items, time_to_live=time_to_live, if_not_exists=if_not_exists)
+
+    async def delete(self, key: str) -> bool:
+        return self._inner.delete(key)
+
+    async def delete_many(self, *keys: str) -> None:
+        self._inner.delete_many(*keys)
+
+    async def clear(self) -> None:
+        self._inner.clear()
+
+    async def clear_prefix(self, prefix: str) -> None:
+        self._inner.clear_prefix(prefix)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._inner.close()
+
+    def unlink(self) -> None:
+        """Delete the table file, the processes which have already opened the table may keep using it."""
+        self._inner.unlink()
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import tempfile
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from hashlib import blake2b
+from math import inf
+from os import PathLike, pread  # `pread()` is POSIX-only: the import fails on the other platforms
+from pathlib import Path
+from time import time
+from typing import Annotated, Optional
+from urllib.parse import parse_qsl, unquote, urlparse
+
+from pydantic import BaseModel, Field
+
+from cachetory.interfaces.backends.sync import SyncBackend
+
+
+class DiskBackend(SyncBackend[bytes]):
+    """
+    Backend that stores each entry in its own file under the specified directory.
+
+    Writes are atomic: an entry is written into a temporary file, which then replaces the entry file.
+    Large values are read through `mmap`, which copies them into `bytes` with a single memory copy.
+
+    Notes:
+        - The directory may be shared by multiple processes on the same host.
+        - Expired entries are not deleted by reads. They get evicted along with the others
+          when the size cap is exceeded, or by an explicit `delete_expired()` call.
+    """
+
+    __slots__ = ("_directory", "_max_bytes", "_mmap_threshold", "_nbytes")
+
+    @classmethod
+    def from_url(cls, url: str) -> DiskBackend:
+        """
+        Instantiate a backend from the URL.
+
+        The URL path is the cache directory, for example: `disk:///var/cache/my-app?max-bytes=1073741824`.
+
+        # URL parameters
+
+        | Parameter        |                                                                  |
+        |------------------|------------------------------------------------------------------|
+        | `max-bytes`      | approximate maximum total size of the entry files                |
+        | `mmap-threshold` | minimal value size in bytes, starting from which reads use `mmap` |
+        """
+        parsed_url = urlparse(url)
+        params = _UrlParams.model_validate(dict(parse_qsl(parsed_url.query)))
+        return cls(
+            unquote(parsed_url.netloc + parsed_url.path),
+            max_bytes=params.max_bytes,
+            mmap_threshold=params.mmap_threshold,
+        )
+
+    def __init__(
+        self,
+        directory: str | PathLike[str],
+        *,
+        max_bytes: int | None = None,
+        mmap_threshold: int = 65536,
+    ) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            directory: cache directory, it gets created if it does not exist
+            max_bytes:
+                Approximate maximum total size of the entry files. When exceeded, the least recently
+                used files are deleted until the total size drops below 90% of the cap.
+                `None` means unbounded.
+            mmap_threshold:
+                Values of this size or larger are copied out of a memory mapping instead of being read by `pread()`.
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._mmap_threshold = mmap_threshold
+
+        # The estimate only accounts for the writes of this process,
+        # it gets synchronized with the actual total size on each eviction.
+        self._nbytes = sum(size for _, size, _ in self._scan()) if max_bytes is not None else 0
+
+    def get(self, key: str) -> bytes:
+        encoded_key = key.encode()
+        try:
+            fd = os.open(self._make_path(encoded_key), os.O_RDONLY)
+        except FileNotFoundError:
+            raise KeyError(key) from None
+        try:
+            if (deadline := self._read_deadline(fd, encoded_key)) is None or deadline <= time():
+                raise KeyError(key)
+            value_offset = _HEADER.size + len(encoded_key)
+            value_size = os.fstat(fd).st_size - value_offset
+            if self._max_bytes is not None:
+                os.utime(fd)  # the modification time is used to evict the least recently used files
+            if value_size < self._mmap_threshold:
+                return pread(fd, value_size, value_offset)
+            # Slicing copies the value out, so that neither the mapping nor the file outlives the call:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapping:
+                return mapping[value_offset:]
+        finally:
+            os.close(fd)
+
+    def expire_at(self, key: str, deadline: datetime | None) -> None:
+        self._expire(key, deadline.timestamp() if deadline is not None else inf)
+
+    def expire_in(self, key: str, time_to_live: timedelta | None = None) -> None:
+        self._expire(key, time() + time_to_live.total_seconds() if time_to_live is not None else inf)
+
+    def set(  # noqa: A003
+        self,
+        key: str,
+        value: bytes,
+        *,
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> bool:
+        encoded_key = key.encode()
+        path = self._make_path(encoded_key)
+        if if_not_exists and self._is_live(path, encoded_key):
+            return False
+
+        path.parent.mkdir(exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(prefix=_TEMP_PREFIX, dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as temp_file:
+                deadline = time() + time_to_live.total_seconds() if time_to_live is not None else inf
+                temp_file.write(_HEADER.pack(_MAGIC, deadline, len(encoded_key)))
+                temp_file.write(encoded_key)
+                temp_file.write(value)
+            if if_not_exists:
+                try:
+                    # Unlike the replacement, hard link fails if another process has just created the entry.
+                    os.link(temp_name, path)
+                except FileExistsError:
+                    if self._is_live(path, encoded_key):
+                        return False
+                    Path(temp_name).replace(path)
+            else:
+                Path(temp_name).replace(path)
+        finally:
+            Path(temp_name).unlink(missing_ok=True)
+
+        if self._max_bytes is not None:
+            self._nbytes += _HEADER.size + len(encoded_key) + len(value)
+            if self._nbytes > self._max_bytes:
+                self._evict(self._max_bytes)
+        return True
+
+    def delete(self, key: str) -> bool:
+        try:
+            self._make_path(key.encode()).unlink()
+        except FileNotFoundError:
+            return False
+        else:
+            return True
+
+    def delete_many(self, *keys: str) -> None:
+        for key in keys:
+            self.delete(key)
+
+    def clear(self) -> None:
+        for _, _, path in self._scan():
+            path.unlink(missing_ok=True)
+        self._nbytes = 0
+
+    def clear_prefix(self, prefix: str) -> None:
+        # The file names are hashes, so the keys have to be read from the file headers.
+        encoded_prefix = prefix.encode()
+        for _, size, path in self._scan():
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except FileNotFoundError:
+                continue
+            try:
+                header = pread(fd, _HEADER.size, 0)
+                if len(header) != _HEADER.size:
+                    continue
+                magic, _, key_length = _HEADER.unpack(header)
+                if magic != _MAGIC or key_length < len(encoded_prefix):
+                    continue
+                if pread(fd, len(encoded_prefix), _HEADER.size) != encoded_prefix:
+                    continue
+            finally:
+                os.close(fd)
+            path.unlink(missing_ok=True)
+            self._nbytes = max(self._nbytes - size, 0)
+
+    def delete_expired(self) -> int:
+        """
+        Delete all the expired entries.
+
+        Returns:
+            Number of the deleted entries.
+        """
+        n_deleted = 0
+        now = time()
+        for _, _, path in self._scan():
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except FileNotFoundError:
+                continue
+            try:
+                header = pread(fd, _HEADER.size, 0)
+            finally:
+                os.close(fd)
+            if len(header) == _HEADER.size and _HEADER.unpack(header)[1] <= now:
+                path.unlink(missing_ok=True)
+                n_deleted += 1
+        return n_deleted
+
+    def _make_path(self, encoded_key: bytes) -> Path:
+        digest = blake2b(encoded_key, digest_size=16).hexdigest()
+        return self._directory / digest[:2] / digest[2:]
+
+    @staticmethod
+    def _read_deadline(fd: int, encoded_key: bytes) -> float | None:
+        """Read the entry deadline, or return `None` if the file does not belong to the key."""
+        head = pread(fd, _HEADER.size + len(encoded_key), 0)
+        if len(head) != _HEADER.size + len(encoded_key):
+            return None
+        magic, deadline, key_length = _HEADER.unpack_from(head)
+        if magic != _MAGIC or key_length != len(encoded_key) or head[_HEADER.size :] != encoded_key:
+            return None
+        return deadline  # type: ignore[no-any-return]
+
+    def _is_live(self, path: Path, encoded_key: bytes) -> bool:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except FileNotFoundError:
+            return False
+        try:
+            return (deadline := self._read_deadline(fd, encoded_key)) is not None and deadline > time()
+        finally:
+            os.close(fd)
+
+    def _expire(self, key: str, deadline: float) -> None:
+        encoded_key = key.encode()
+        try:
+            fd = os.open(self._make_path(encoded_key), os.O_RDWR)
+        except FileNotFoundError:
+            return
+        try:
+            if (current_deadline := self._read_deadline(fd, encoded_key)) is not None and current_deadline > time():
+                os.pwrite(fd, _DEADLINE.pack(deadline), _DEADLINE_OFFSET)
+        finally:
+            os.close(fd)
+
+    def _scan(self) -> Iterator[tuple[float, int, Path]]:
+        """Yield modification time, size, and path of each entry file."""
+        for subdirectory in os.scandir(self._directory):
+            if not subdirectory.is_dir():
+                continue
+            for entry in os.scandir(subdirectory.path):
+                if entry.name.startswith(_TEMP_PREFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                yield stat.st_mtime, stat.st_size, Path(entry.path)
+
+    def _evict(self, max_bytes: int) -> None:
+        """Delete the least recently used entries, until the total size drops below the low watermark."""
+        entries = sorted(self._scan())
+        nbytes = sum(size for _, size, _ in entries)
+        low_watermark = max_bytes * _LOW_WATERMARK
+        for _, size, path in entries:
+            if nbytes <= low_watermark:
+                break
+            path.unlink(missing_ok=True)
+            nbytes -= size
+        self._nbytes = nbytes
+
+
+_MAGIC = b"CTDISK01"
+_HEADER = struct.Struct("<8sdI")
+"""Magic, deadline (wall-clock timestamp), key length. The header is followed by the key and the value."""
+
+_DEADLINE_OFFSET = 8
+_DEADLINE = struct.Struct("<d")
+
+_TEMP_PREFIX = ".tmp-"
+_LOW_WATERMARK = 0.9
+
+
+class _UrlParams(BaseModel):
+    max_bytes: Annotated[Optional[int], Field(ge=0)] = Field(None, alias="max-bytes")  # noqa: UP045
+    mmap_threshold: Annotated[int, Field(ge=0)] = Field(65536, alias="mmap-threshold")
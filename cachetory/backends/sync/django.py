@@ -51,8 +51,19 @@ class DjangoBackend(SyncBackend[WireT], Generic[WireT]):
             self._cache.set(key, value, timeout)
             return True
 
-    def set_many(self, items: Iterable[tuple[str, WireT]]) -> None:
-        self._cache.set_many(dict(items))
+    def set_many(
+        self,
+        items: Iterable[tuple[str, WireT]],
+        *,
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> list[bool]:
+        timeout = self._to_timeout(time_to_live)
+        if if_not_exists:
+            return [bool(self._cache.add(key, value, timeout)) for key, value in items]
+        items = list(items)
+        failed_keys = set(self._cache.set_many(dict(items), timeout))
+        return [key not in failed_keys for key, _ in items]
 
     def delete(self, key: str) -> bool:
         return self._cache.delete(key)  # type: ignore[no-any-return]
@@ -63,6 +74,9 @@ class DjangoBackend(SyncBackend[WireT], Generic[WireT]):
     def clear(self) -> None:
         self._cache.clear()
 
+    def clear_prefix(self, prefix: str) -> None:
+        raise NotImplementedError("Django cache does not support deleting keys by prefix")
+
     def expire_in(self, key: str, time_to_live: timedelta | None = None) -> None:
         self._cache.touch(key, self._to_timeout(time_to_live))
 
@@ -37,8 +37,14 @@ class DummyBackend(SyncBackend[WireT], Generic[WireT]):
     ) -> bool:  # pragma: no cover
         return True
 
-    def set_many(self, items: Iterable[tuple[str, WireT]]) -> None:  # pragma: no cover
-        return None
+    def set_many(
+        self,
+        items: Iterable[tuple[str, WireT]],
+        *,
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> list[bool]:  # pragma: no cover
+        return [True for _ in items]
 
     def delete(self, key: str) -> bool:  # pragma: no cover
         return False  # has never been there
@@ -48,3 +54,6 @@ class DummyBackend(SyncBackend[WireT], Generic[WireT]):
 
     def clear(self) -> None:  # pragma: no cover
         return None  # already perfectly clean
+
+    def clear_prefix(self, prefix: str) -> None:  # pragma: no cover
+        return None
@@ -1,35 +1,175 @@
 from __future__ import annotations
 
+import os
+import pickle
+import struct
+import sys
+import tempfile
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timedelta, timezone
-from typing import Generic
+from heapq import heapify, heappop, heappush
+from math import inf
+from os import PathLike
+from pathlib import Path
+from threading import Lock
+from time import monotonic, time
+from types import TracebackType
+from typing import Annotated, Any, Callable, Generic, Literal, Optional
+from urllib.parse import parse_qsl, urlparse
+
+from pydantic import BaseModel, Field
 
 from cachetory.interfaces.backends.private import WireT
 from cachetory.interfaces.backends.sync import SyncBackend
-from cachetory.private.datetime import make_deadline
+from cachetory.private.sketch import FrequencySketch
+
+Policy = Literal["lru", "tinylfu"]
+"""Eviction policy of a bounded `MemoryBackend`."""
 
 
 class MemoryBackend(SyncBackend[WireT], Generic[WireT]):
-    """Memory backend that stores everything in a local dictionary."""
+    """
+    Memory backend that stores everything in a local dictionary.
+
+    This backend is **not** thread-safe, consider `ShardedMemoryBackend` for multi-threaded applications.
+    """
 
-    __slots__ = ("_entries",)
+    __slots__ = (
+        "_entries",
+        "_max_entries",
+        "_max_bytes",
+        "_weigh",
+        "_nbytes",
+        "_is_bounded",
+        "_deadlines",
+        "_expire_batch_size",
+        "_window",
+        "_window_capacity",
+        "_sketch",
+        "_snapshot",
+    )
 
     @classmethod
-    def from_url(cls, _url: str) -> MemoryBackend[WireT]:
-        return MemoryBackend()
+    def from_url(cls, url: str) -> MemoryBackend[WireT]:
+        """
+        Instantiate a backend from the URL.
+
+        # URL parameters
+
+        | Parameter           |                                                     |
+        |---------------------|-----------------------------------------------------|
+        | `max-entries`       | maximum number of the least recently used entries   |
+        | `max-bytes`         | maximum total size of the stored values             |
+        | `expire-batch-size` | maximum number of expired entries deleted per write |
+        | `policy`            | eviction policy: `lru` (default) or `tinylfu`       |
+        | `snapshot`          | snapshot file path, see `snapshot` below            |
+        """
+        params = _UrlParams.model_validate(dict(parse_qsl(urlparse(url).query)))
+        return cls(**params.model_dump())
+
+    def __init__(
+        self,
+        *,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        weigh: Callable[[WireT], int] | None = None,
+        expire_batch_size: int = 20,
+        policy: Policy = "lru",
+        snapshot: str | PathLike[str] | None = None,
+    ) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            max_entries:
+                If set, the backend keeps at most this number of entries
+                and evicts the least recently used ones on overflow.
+                By default, the backend is unbounded.
+            max_bytes:
+                If set, the backend evicts the least recently used entries
+                until the total size of the stored values fits the budget.
+                A value larger than the entire budget is not stored, and `set()` returns `False`.
+            weigh:
+                Callable which returns a stored value size, used for `max_bytes` and `nbytes`.
+                By default, it is `len()` for `bytes` and `str`, and `sys.getsizeof()` for anything else.
+            expire_batch_size:
+                Maximum number of expired entries which get deleted on each write,
+                so that the expired entries are freed even if they are never read again.
+                `0` disables the active expiration, leaving it to `delete_expired()` and reads.
+            policy:
+                Eviction policy of the bounded backend. `lru` evicts the least recently used entries.
+                `tinylfu` (W-TinyLFU) puts new entries into a small LRU window, and admits
+                an entry evicted from the window only if it is accessed more frequently than
+                the main segment's eviction victim. This protects the popular entries from one-off scans.
+                `tinylfu` requires `max_entries`.
+            snapshot:
+                Snapshot file path. If set, the backend loads the snapshot on initialization, if the file exists,
+                and dumps the live entries into the file on exit from the context manager.
+        """
+        # Keys are kept in the least-to-most recently used order, the order is only maintained when bounded.
+        self._entries: OrderedDict[str, _Entry[WireT]] = OrderedDict()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._weigh: Callable[[WireT], int] = weigh if weigh is not None else _weigh
+        self._nbytes = 0
+        self._is_bounded = max_entries is not None or max_bytes is not None
 
-    def __init__(self) -> None:
-        self._entries: dict[str, _Entry[WireT]] = {}
+        # Min-heap of `(deadline, key)` pairs. It may contain outdated pairs of overwritten
+        # and deleted entries, these get discarded when popped.
+        self._deadlines: list[tuple[float, str]] = []
+        self._expire_batch_size = expire_batch_size
+
+        # W-TinyLFU window keys, in the least-to-most recently used order. The window entries themselves
+        # are stored in `_entries` along with the main segment entries, so that lookups remain the same.
+        self._window: OrderedDict[str, None] | None = None
+        self._window_capacity = 0
+        self._sketch: FrequencySketch | None = None
+        if policy == "tinylfu":
+            if max_entries is None:
+                raise ValueError("`tinylfu` policy requires `max_entries`")
+            self._window = OrderedDict()
+            self._window_capacity = max(max_entries // 100, 1)
+            self._sketch = FrequencySketch(max_entries)
+
+        self._snapshot = snapshot
+        if snapshot is not None and Path(snapshot).exists():
+            self.load(snapshot)
 
     def get(self, key: str) -> WireT:
-        return self._get_entry(key).value
+        if self._sketch is not None:
+            self._sketch.increment(key)
+        entry = self._get_entry(key)
+        if self._is_bounded:
+            self._entries.move_to_end(key)
+            if self._window is not None and key in self._window:
+                self._window.move_to_end(key)
+        return entry.value
+
+    def get_many(self, *keys: str) -> Iterable[tuple[str, WireT]]:
+        entries = self._entries
+        now = monotonic()
+        items = []
+        for key in keys:
+            if self._sketch is not None:
+                self._sketch.increment(key)
+            if (entry := entries.get(key)) is None:
+                continue
+            if entry.deadline <= now:
+                self._pop_entry(key)
+                continue
+            if self._is_bounded:
+                entries.move_to_end(key)
+                if self._window is not None and key in self._window:
+                    self._window.move_to_end(key)
+            items.append((key, entry.value))
+        return items
+
+    def expire_in(self, key: str, time_to_live: timedelta | None = None) -> None:
+        self._expire(key, _make_deadline(time_to_live))
 
     def expire_at(self, key: str, deadline: datetime | None) -> None:
-        try:
-            entry = self._get_entry(key)
-        except KeyError:
-            pass
-        else:
-            entry.deadline = deadline
+        self._expire(key, _from_datetime(deadline))
 
     def set(  # noqa: A003
         self,
@@ -39,46 +179,525 @@ class MemoryBackend(SyncBackend[WireT], Generic[WireT]):
         time_to_live: timedelta | None = None,
         if_not_exists: bool = False,
     ) -> bool:
-        entry = _Entry[WireT](value, make_deadline(time_to_live))
-        if if_not_exists:
-            return self._entries.setdefault(key, entry) is entry
-        else:
-            self._entries[key] = _Entry[WireT](value, make_deadline(time_to_live))
-            return True
+        if if_not_exists and self._has_live_entry(key):
+            return False
+        entry = _Entry(value, _make_deadline(time_to_live), self._weigh(value))
+        if not self._fits(entry):
+            self._pop_entry(key)  # the previous value is outdated anyway
+            return False
+        self._insert_entry(key, entry)
+        if entry.deadline != _ETERNAL:
+            self._push_deadline(entry.deadline, key)
+        self._delete_expired(self._expire_batch_size)
+        self._evict()
+        return True
+
+    def set_many(
+        self,
+        items: Iterable[tuple[str, WireT]],
+        *,
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> list[bool]:
+        deadline = _make_deadline(time_to_live)
+        results = []
+        for key, value in items:
+            if if_not_exists and self._has_live_entry(key):
+                results.append(False)
+                continue
+            entry = _Entry(value, deadline, self._weigh(value))
+            if not self._fits(entry):
+                self._pop_entry(key)
+                results.append(False)
+                continue
+            self._insert_entry(key, entry)
+            if deadline != _ETERNAL:
+                self._push_deadline(deadline, key)
+            results.append(True)
+        self._delete_expired(self._expire_batch_size)
+        self._evict()
+        return results
 
     def delete(self, key: str) -> bool:
-        return self._entries.pop(key, _SENTINEL) is not _SENTINEL
+        return self._pop_entry(key) is not None
 
     def delete_many(self, *keys: str) -> None:
         for key in keys:
-            self._entries.pop(key, None)
+            self._pop_entry(key)
 
     def clear(self) -> None:
         self._entries.clear()
+        self._deadlines.clear()
+        if self._window is not None:
+            self._window.clear()
+        self._nbytes = 0
+
+    def clear_prefix(self, prefix: str) -> None:
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            self._pop_entry(key)
+
+    def delete_expired(self) -> int:
+        """
+        Delete all the expired entries.
+
+        Normally, the expired entries get deleted on reads and, in small batches, on writes.
+        One may call this method periodically to free memory of a backend which is rarely written to.
+
+        Returns:
+            Number of the deleted entries.
+        """
+        return self._delete_expired(None)
+
+    def dump(self, path: str | PathLike[str]) -> int:
+        """
+        Write the live entries with their remaining time-to-live into the snapshot file.
+
+        The file gets replaced atomically. The values which are not `bytes` get pickled.
+
+        Returns:
+            Number of the dumped entries.
+        """
+        return _dump_snapshot(path, self._entries.items())
+
+    def load(self, path: str | PathLike[str]) -> int:
+        """
+        Load the entries from the snapshot file.
+
+        The file is read entry by entry, and the limits are enforced while loading,
+        so that a large snapshot does not require extra memory. The entries which have expired
+        since the dump are skipped, and so are the values which exceed `max_bytes` on their own,
+        like `set()` refuses them.
+
+        Returns:
+            Number of the loaded entries.
+        """
+        n_loaded = 0
+        for key, value, time_to_live in _load_snapshot(path):
+            entry = _Entry(value, monotonic() + time_to_live, self._weigh(value))
+            if not self._fits(entry):
+                continue
+            self._insert_entry(key, entry)
+            if entry.deadline != _ETERNAL:
+                self._push_deadline(entry.deadline, key)
+            self._evict()
+            n_loaded += 1
+        return n_loaded
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._snapshot is not None:
+            self.dump(self._snapshot)
 
     def _get_entry(self, key: str) -> _Entry[WireT]:
         entry = self._entries[key]
-        if entry.deadline is not None and entry.deadline <= datetime.now(timezone.utc):
-            self._entries.pop(key, None)  # might get popped by another thread
+        if entry.deadline <= monotonic():
+            self._pop_entry(key)
             raise KeyError(f"`{key}` has expired")
         return entry
 
+    def _has_live_entry(self, key: str) -> bool:
+        try:
+            self._get_entry(key)  # an expired entry does not count, and gets deleted here
+        except KeyError:
+            return False
+        else:
+            return True
+
+    def _expire(self, key: str, deadline: float) -> None:
+        try:
+            entry = self._get_entry(key)
+        except KeyError:
+            pass
+        else:
+            entry.deadline = deadline
+            if deadline != _ETERNAL:
+                self._push_deadline(deadline, key)
+            self._delete_expired(self._expire_batch_size)
+
+    def _fits(self, entry: _Entry[WireT]) -> bool:
+        """Check whether the entry may be stored at all, without getting evicted right away."""
+        return self._max_bytes is None or entry.weight <= self._max_bytes
+
+    def _insert_entry(self, key: str, entry: _Entry[WireT]) -> None:
+        self._pop_entry(key)  # re-inserting moves the key to the most recently used end
+        self._entries[key] = entry
+        self._nbytes += entry.weight
+        if self._sketch is not None and self._window is not None:
+            self._sketch.increment(key)
+            self._window[key] = None
+
+    def _pop_entry(self, key: str) -> _Entry[WireT] | None:
+        if (entry := self._entries.pop(key, None)) is not None:
+            self._nbytes -= entry.weight
+            if self._window is not None:
+                self._window.pop(key, None)
+        return entry
+
+    def _pop_least_recently_used(self) -> None:
+        key, entry = self._entries.popitem(last=False)
+        self._nbytes -= entry.weight
+        if self._window is not None:
+            self._window.pop(key, None)
+
+    def _push_deadline(self, deadline: float, key: str) -> None:
+        heappush(self._deadlines, (deadline, key))
+        if len(self._deadlines) > 2 * len(self._entries) + _MIN_DEADLINES_TO_COMPACT:
+            # Too many outdated pairs, rebuild the heap from scratch. This happens rarely enough to be amortized.
+            self._deadlines = [
+                (entry.deadline, key_) for key_, entry in self._entries.items() if entry.deadline != _ETERNAL
+            ]
+            heapify(self._deadlines)
+
+    def _delete_expired(self, limit: int | None) -> int:
+        """
+        Delete the expired entries, in the order of their deadlines.
+
+        Args:
+            limit: maximum number of the heap pairs to inspect, `None` means «until nothing is expired»
+        """
+        deadlines = self._deadlines
+        if not deadlines or limit == 0:
+            return 0
+        now = monotonic()
+        n_inspected = n_deleted = 0
+        while deadlines and deadlines[0][0] <= now and (limit is None or n_inspected < limit):
+            deadline, key = heappop(deadlines)
+            n_inspected += 1
+            entry = self._entries.get(key)
+            if entry is not None and entry.deadline == deadline:
+                self._pop_entry(key)
+                n_deleted += 1
+        return n_deleted
+
+    def _evict(self) -> None:
+        """Evict the least recently used entries until the backend fits the limits."""
+        if self._window is not None and self._sketch is not None and self._max_entries is not None:
+            self._evict_window(self._window, self._sketch, self._max_entries)
+        if self._max_entries is not None:
+            while len(self._entries) > self._max_entries:
+                self._pop_least_recently_used()
+        if self._max_bytes is not None:
+            while self._nbytes > self._max_bytes:
+                self._pop_least_recently_used()
+
+    def _evict_window(self, window: OrderedDict[str, None], sketch: FrequencySketch, max_entries: int) -> None:
+        """Move the overflowing window entries to the main segment, if they pass the TinyLFU admission."""
+        while len(window) > self._window_capacity:
+            candidate, _ = window.popitem(last=False)
+            if len(self._entries) <= max_entries:
+                # The main segment is not full yet, admit unconditionally.
+                self._entries.move_to_end(candidate)
+                continue
+            # The main segment victim is its least recently used entry. The window entries are recent,
+            # so normally they are at the end of `_entries`, and the search does not go far.
+            victim = next((key for key in self._entries if key not in window and key != candidate), None)
+            if victim is not None and sketch.frequency(candidate) > sketch.frequency(victim):
+                self._pop_entry(victim)
+                self._entries.move_to_end(candidate)
+            else:
+                self._pop_entry(candidate)
+
     @property
     def size(self) -> int:
+        """Number of the stored entries, including the expired ones which have not been evicted yet."""
         return len(self._entries)
 
+    @property
+    def nbytes(self) -> int:
+        """Total size of the stored values, as measured by the weigher."""
+        return self._nbytes
+
+
+class ShardedMemoryBackend(SyncBackend[WireT], Generic[WireT]):
+    """
+    Thread-safe memory backend that splits the keys between independently locked `MemoryBackend` shards.
+
+    Each shard has its own lock, limits, eviction and expiration, so that threads working on different shards
+    do not contend with each other.
+    """
+
+    __slots__ = ("_shards", "_locks", "_snapshot")
+
+    @classmethod
+    def from_url(cls, url: str) -> ShardedMemoryBackend[WireT]:
+        """
+        Instantiate a backend from the URL.
+
+        Accepts the same URL parameters as `MemoryBackend`, plus:
+
+        | Parameter |                  |
+        |-----------|------------------|
+        | `shards`  | number of shards |
+        """
+        params = _ShardedUrlParams.model_validate(dict(parse_qsl(urlparse(url).query)))
+        return cls(**params.model_dump())
+
+    def __init__(
+        self,
+        *,
+        shards: int = 16,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        weigh: Callable[[WireT], int] | None = None,
+        expire_batch_size: int = 20,
+        policy: Policy = "lru",
+        snapshot: str | PathLike[str] | None = None,
+    ) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            shards: number of the independently locked shards
+            max_entries: total limit, which is split between the shards, see `MemoryBackend`
+            max_bytes: total limit, which is split between the shards, see `MemoryBackend`
+            weigh: see `MemoryBackend`
+            expire_batch_size: see `MemoryBackend`
+            policy: see `MemoryBackend`
+            snapshot: see `MemoryBackend`, the shards share the single snapshot file
+        """
+        self._shards = [
+            MemoryBackend[WireT](
+                max_entries=shard_max_entries,
+                max_bytes=shard_max_bytes,
+                weigh=weigh,
+                expire_batch_size=expire_batch_size,
+                policy=policy,
+            )
+            for shard_max_entries, shard_max_bytes in zip(
+                _split_limit("max_entries", max_entries, shards),
+                _split_limit("max_bytes", max_bytes, shards),
+            )
+        ]
+        self._locks = [Lock() for _ in range(shards)]
+        self._snapshot = snapshot
+        if snapshot is not None and Path(snapshot).exists():
+            self.load(snapshot)
+
+    def get(self, key: str) -> WireT:
+        index = hash(key) % len(self._shards)
+        with self._locks[index]:
+            return self._shards[index].get(key)
+
+    def expire_in(self, key: str, time_to_live: timedelta | None = None) -> None:
+        index = hash(key) % len(self._shards)
+        with self._locks[index]:
+            self._shards[index].expire_in(key, time_to_live)
+
+    def expire_at(self, key: str, deadline: datetime | None) -> None:
+        index = hash(key) % len(self._shards)
+        with self._locks[index]:
+            self._shards[index].expire_at(key, deadline)
+
+    def set(  # noqa: A003
+        self,
+        key: str,
+        value: WireT,
+        *,
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> bool:
+        index = hash(key) % len(self._shards)
+        with self._locks[index]:
+            return self._shards[index].set(key, value, time_to_live=time_to_live, if_not_exists=if_not_exists)
+
+    def delete(self, key: str) -> bool:
+        index = hash(key) % len(self._shards)
+        with self._locks[index]:
+            return self._shards[index].delete(key)
+
+    def delete_many(self, *keys: str) -> None:
+        for key in keys:
+            self.delete(key)
+
+    def clear(self) -> None:
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                shard.clear()
+
+    def clear_prefix(self, prefix: str) -> None:
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                shard.clear_prefix(prefix)
+
+    def delete_expired(self) -> int:
+        """
+        Delete all the expired entries, shard by shard.
+
+        Returns:
+            Number of the deleted entries.
+        """
+        n_deleted = 0
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                n_deleted += shard.delete_expired()
+        return n_deleted
+
+    def dump(self, path: str | PathLike[str]) -> int:
+        """
+        Write the live entries of all the shards into the snapshot file, see `MemoryBackend.dump()`.
+
+        Each shard is locked only while its own entries are being written.
+        """
+
+        def iter_entries() -> Iterator[tuple[str, _Entry[WireT]]]:
+            for lock, shard in zip(self._locks, self._shards):
+                with lock:
+                    yield from shard._entries.items()
+
+        return _dump_snapshot(path, iter_entries())
+
+    def load(self, path: str | PathLike[str]) -> int:
+        """Load the entries from the snapshot file into their shards, see `MemoryBackend.load()`."""
+        n_loaded = 0
+        for key, value, time_to_live in _load_snapshot(path):
+            remaining = timedelta(seconds=time_to_live) if time_to_live != _ETERNAL else None
+            n_loaded += self.set(key, value, time_to_live=remaining)
+        return n_loaded
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._snapshot is not None:
+            self.dump(self._snapshot)
+
+    @property
+    def size(self) -> int:
+        """Number of the stored entries in all the shards."""
+        return sum(shard.size for shard in self._shards)
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the stored values in all the shards."""
+        return sum(shard.nbytes for shard in self._shards)
+
+
+def _split_limit(name: str, limit: int | None, shards: int) -> list[int | None]:
+    """
+    Split the total limit between the shards, so that the shard limits sum up exactly to the total.
+
+    The remainder goes to the first shards, one unit each.
+    """
+    if limit is None:
+        return [None] * shards
+    if limit < shards:
+        raise ValueError(f"`{name}` must not be less than `shards`")
+    quotient, remainder = divmod(limit, shards)
+    return [quotient + (index < remainder) for index in range(shards)]
+
 
 class _Entry(Generic[WireT]):
-    """`mypy` doesn't support generic named tuples, thus defining this little one."""
+    """
+    `mypy` doesn't support generic named tuples, thus defining this little one.
+
+    The deadline is a `time.monotonic()` timestamp, which is much cheaper to obtain and compare
+    than an aware `datetime`. Eternal entries have the infinite deadline, so that checking
+    the expiration is always a single float comparison.
+    """
 
     value: WireT
-    deadline: datetime | None
+    deadline: float
+    weight: int
 
-    __slots__ = ("value", "deadline")
+    __slots__ = ("value", "deadline", "weight")
 
-    def __init__(self, value: WireT, deadline: datetime | None) -> None:
+    def __init__(self, value: WireT, deadline: float, weight: int) -> None:
         self.value = value
         self.deadline = deadline
+        self.weight = weight
+
+
+_ETERNAL = inf
+_MIN_DEADLINES_TO_COMPACT = 64
+
+
+def _make_deadline(time_to_live: timedelta | None) -> float:
+    return monotonic() + time_to_live.total_seconds() if time_to_live is not None else _ETERNAL
+
+
+def _from_datetime(deadline: datetime | None) -> float:
+    """Convert the wall-clock deadline into the monotonic one."""
+    if deadline is None:
+        return _ETERNAL
+    return monotonic() + (deadline - datetime.now(timezone.utc)).total_seconds()
+
+
+def _dump_snapshot(path: str | PathLike[str], entries: Iterable[tuple[str, _Entry[Any]]]) -> int:
+    path = Path(path)
+    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    n_dumped = 0
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(_SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, time()))
+            now = monotonic()
+            for key, entry in entries:
+                if (time_to_live := entry.deadline - now) <= 0.0:
+                    continue
+                if isinstance(entry.value, bytes):
+                    flags, value = 0, entry.value
+                else:
+                    flags, value = _FLAG_PICKLED, pickle.dumps(entry.value, pickle.HIGHEST_PROTOCOL)
+                encoded_key = key.encode()
+                file.write(_SNAPSHOT_RECORD.pack(flags, len(encoded_key), time_to_live, len(value)))
+                file.write(encoded_key)
+                file.write(value)
+                n_dumped += 1
+        Path(temp_name).replace(path)
+    finally:
+        Path(temp_name).unlink(missing_ok=True)
+    return n_dumped
+
+
+def _load_snapshot(path: str | PathLike[str]) -> Iterator[tuple[str, Any, float]]:
+    """Read the snapshot record by record, and yield the keys, values, and remaining time-to-live in seconds."""
+    with Path(path).open("rb") as file:
+        header = file.read(_SNAPSHOT_HEADER.size)
+        if len(header) != _SNAPSHOT_HEADER.size or not header.startswith(_SNAPSHOT_MAGIC):
+            raise ValueError(f"`{path}` is not a memory backend snapshot")
+        _, dumped_at = _SNAPSHOT_HEADER.unpack(header)
+        elapsed = max(time() - dumped_at, 0.0)
+        while record := file.read(_SNAPSHOT_RECORD.size):
+            if len(record) != _SNAPSHOT_RECORD.size:
+                raise ValueError(f"`{path}` is truncated")
+            flags, key_length, time_to_live, value_length = _SNAPSHOT_RECORD.unpack(record)
+            encoded_key = file.read(key_length)
+            value = file.read(value_length)
+            if len(encoded_key) != key_length or len(value) != value_length:
+                raise ValueError(f"`{path}` is truncated")
+            if (time_to_live := time_to_live - elapsed) <= 0.0:
+                continue
+            yield encoded_key.decode(), pickle.loads(value) if flags & _FLAG_PICKLED else value, time_to_live
+
+
+_SNAPSHOT_MAGIC = b"CTMEMSN1"
+_SNAPSHOT_HEADER = struct.Struct("<8sd")
+"""Magic and the dump wall-clock timestamp."""
+
+_SNAPSHOT_RECORD = struct.Struct("<BIdI")
+"""Flags, key length, remaining time-to-live in seconds, value length. Followed by the key and the value."""
+
+_FLAG_PICKLED = 1
+
+
+def _weigh(value: Any) -> int:
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+class _UrlParams(BaseModel):
+    max_entries: Annotated[Optional[int], Field(ge=1)] = Field(None, alias="max-entries")  # noqa: UP045
+    max_bytes: Annotated[Optional[int], Field(ge=0)] = Field(None, alias="max-bytes")  # noqa: UP045
+    expire_batch_size: Annotated[int, Field(ge=0)] = Field(20, alias="expire-batch-size")
+    policy: Policy = "lru"
+    snapshot: Optional[str] = None  # noqa: UP045
 
 
-_SENTINEL = object()
+class _ShardedUrlParams(_UrlParams):
+    shards: Annotated[int, Field(ge=1)] = 16
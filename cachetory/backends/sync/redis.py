@@ -1,55 +1,188 @@
 from __future__ import annotations
 
 import itertools
-from collections.abc import Iterable
+import secrets
+from collections.abc import Collection, Generator, Iterable, Sequence
+from contextlib import suppress
 from datetime import datetime, timedelta
+from threading import Event, Lock, Thread
+from time import monotonic
 from types import TracebackType
+from typing import Any
+from weakref import WeakKeyDictionary
 
-from redis import Redis
+from redis import BlockingConnectionPool, ConnectionPool, Redis, RedisError, ResponseError
+from redis.client import PubSub
+from redis.connection import AbstractConnection
 
 from cachetory.interfaces.backends.sync import SyncBackend
+from cachetory.private.redis import (
+    FILL_SCRIPT,
+    GET_CONNECTION_ARGS,
+    GET_OR_LEASE_SCRIPT,
+    INVALIDATION_CHANNEL,
+    LEASE_GRANTED,
+    LEASE_HIT,
+    MANIFEST_SIZE,
+    RELEASE_SCRIPT,
+    SCAN_BATCH_SIZE,
+    NearCache,
+    PoolMetrics,
+    PoolStats,
+    UrlParams,
+    ValueManifest,
+    decode_invalidated_keys,
+    make_fill_channel,
+    make_lease_key,
+    make_match_pattern,
+    make_tracking_command,
+    split_into_chunks,
+    split_url,
+)
 
 
 class RedisBackend(SyncBackend[bytes]):
     """Synchronous Redis backend."""
 
-    __slots__ = ("_client",)
+    __slots__ = (
+        "_client",
+        "_near_cache",
+        "_listener",
+        "_chunk_size",
+        "_value_chunk_size",
+        "_get_or_lease_script",
+        "_fill_script",
+        "_release_script",
+    )
 
     @classmethod
     def from_url(cls, url: str) -> RedisBackend:
-        """Instantiate a backend from the URL."""
+        """
+        Instantiate a backend from the URL.
+
+        # URL parameters
+
+        Besides the client's own parameters:
+
+        | Parameter             |                                                           |
+        |-----------------------|-----------------------------------------------------------|
+        | `near-cache-size`     | enables the near cache of the specified number of entries |
+        | `near-cache-prefixes` | comma-separated key prefixes to track in broadcast mode   |
+        | `chunk-size`          | maximum number of keys in a single `MGET` or `DEL`        |
+        | `value-chunk-size`    | values larger than this are split into chunks of the size |
+
+        The connection pool parameters:
+
+        | Parameter                |                                                                  |
+        |--------------------------|------------------------------------------------------------------|
+        | `blocking-pool`          | `true` makes a checkout wait for a free connection, if none left |
+        | `pool-size`              | maximum number of connections                                    |
+        | `pool-timeout`           | seconds to wait for a free connection, requires `blocking-pool`  |
+        | `socket-timeout`         | seconds to wait for a response                                   |
+        | `socket-connect-timeout` | seconds to wait for a connection to establish                    |
+        | `socket-keepalive`       | `true` enables the TCP keepalive                                 |
+        | `health-check-interval`  | seconds of idling, after which a connection gets checked         |
+        """
         if url.startswith("redis+"):
             url = url[6:]
-        return cls(Redis.from_url(url))
+        url, params = split_url(url)
+        pool_class = _MeteredBlockingConnectionPool if params.blocking_pool else _MeteredConnectionPool
+        client = Redis(connection_pool=pool_class.from_url(url, **params.make_pool_kwargs()))
+        client.auto_close_connection_pool = True  # like `Redis.from_url()` does
+        return cls._from_params(client, params)
+
+    @classmethod
+    def _from_params(cls, client: Redis, params: UrlParams) -> RedisBackend:  # type: ignore[type-arg]
+        """Instantiate a backend using the client and the parsed URL parameters."""
+        return cls(
+            client,
+            near_cache_size=params.near_cache_size,
+            near_cache_prefixes=params.near_cache_prefixes,
+            chunk_size=params.chunk_size,
+            value_chunk_size=params.value_chunk_size,
+        )
+
+    def __init__(
+        self,
+        client: Redis,  # type: ignore[type-arg]
+        *,
+        near_cache_size: int | None = None,
+        near_cache_prefixes: Collection[str] = (),
+        chunk_size: int | None = None,
+        value_chunk_size: int | None = None,
+    ) -> None:
+        """
+        Instantiate a backend using the Redis client.
 
-    def __init__(self, client: Redis) -> None:  # type: ignore[type-arg]
-        """Instantiate a backend using the Redis client."""
+        Args:
+            client: Redis client
+            near_cache_size:
+                If set, the backend keeps a local copy of up to this number of the recently read values,
+                and relies on the server-assisted client-side caching (`CLIENT TRACKING`) to drop
+                the local copies once the keys get modified by anyone.
+            near_cache_prefixes:
+                If set, the server tracks these key prefixes in the broadcast mode, instead of tracking
+                the individual keys read by the client. This saves the server memory at the cost
+                of more invalidation messages.
+            chunk_size:
+                If set, `get_many()` and `delete_many()` split the keys into chunks of this size,
+                so that a huge batch does not block the server with a single command.
+                `get_many()` then yields the values chunk by chunk, as the caller consumes them.
+                Note, that the operation is then only atomic within each chunk.
+            value_chunk_size:
+                If set, values larger than this are stored in chunks of this size under the derived keys,
+                and the value key holds a manifest, which refers to the chunks. This keeps each command small,
+                so that huge values do not block the server. See the Redis backend docs for the details.
+        """
         self._client = client
+        self._chunk_size = chunk_size
+        self._value_chunk_size = value_chunk_size
+        self._get_or_lease_script = client.register_script(GET_OR_LEASE_SCRIPT)
+        self._fill_script = client.register_script(FILL_SCRIPT)
+        self._release_script = client.register_script(RELEASE_SCRIPT)
+        self._near_cache: NearCache | None = None
+        self._listener: _InvalidationListener | None = None
+        if near_cache_size is not None:
+            self._near_cache = NearCache(near_cache_size)
+            self._listener = _InvalidationListener(client.connection_pool, self._near_cache, near_cache_prefixes)
 
     def get(self, key: str) -> bytes:
-        data: bytes | None = self._client.get(key)
-        if data is not None:
-            return data
+        if (near_cache := self._near_cache) is not None:
+            if (value := near_cache.get(key)) is not None:
+                return value
+            token = near_cache.reserve(key)
+            data: bytes | None = None
+            is_tracked = False
+            try:
+                data, is_tracked = self._listener.execute("GET", key)  # type: ignore[union-attr]
+            finally:
+                near_cache.fill(key, token, data if is_tracked else None)
+        else:
+            data = self._client.get(key)
+        if data is not None and (value := self._join_chunks(key, data)) is not None:
+            return value
         raise KeyError(key)
 
     def get_many(self, *keys: str) -> Iterable[tuple[str, bytes]]:
-        for key, value in zip(keys, self._client.mget(*keys)):
-            if value is not None:
+        if not keys:
+            return
+        for key, data in self._get_chunks(split_into_chunks(keys, self._chunk_size)):
+            if (value := self._join_chunks(key, data)) is not None:
                 yield key, value
 
     def expire_at(self, key: str, deadline: datetime | None) -> None:
         if deadline:
             # One can pass `datetime` directly to `pexpireat`, but the latter
             # incorrectly converts datetime into timestamp.
-            self._client.pexpireat(key, int(deadline.timestamp() * 1000.0))
+            self._expire(key, "PEXPIREAT", int(deadline.timestamp() * 1000.0))
         else:
-            self._client.persist(key)
+            self._expire(key, "PERSIST")
 
     def expire_in(self, key: str, time_to_live: timedelta | None = None) -> None:
         if time_to_live:
-            self._client.pexpire(key, time_to_live)
+            self._expire(key, "PEXPIRE", int(time_to_live.total_seconds() * 1000.0))
         else:
-            self._client.persist(key)
+            self._expire(key, "PERSIST")
 
     def set(  # noqa: A003
         self,
@@ -59,20 +192,194 @@ class RedisBackend(SyncBackend[bytes]):
         time_to_live: timedelta | None = None,
         if_not_exists: bool = False,
     ) -> bool:
-        return bool(self._client.set(key, value, px=time_to_live, nx=if_not_exists))
+        if self._value_chunk_size is not None:
+            return self._set_chunked([(key, value)], time_to_live, if_not_exists)[0]
+        is_set = bool(self._client.set(key, value, px=time_to_live, nx=if_not_exists))
+        self._discard(key)
+        return is_set
 
-    def set_many(self, items: Iterable[tuple[str, bytes]]) -> None:
-        self._client.execute_command("MSET", *itertools.chain.from_iterable(items))
+    def set_many(
+        self,
+        items: Iterable[tuple[str, bytes]],
+        *,
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> list[bool]:
+        items = list(items)
+        if not items:
+            return []
+        if self._value_chunk_size is not None:
+            return self._set_chunked(items, time_to_live, if_not_exists)
+        if time_to_live is None and not if_not_exists:
+            # Plain `MSET` is a single atomic command.
+            self._client.execute_command("MSET", *itertools.chain.from_iterable(items))
+            results = [True] * len(items)
+        else:
+            # `MSET` can carry neither expiration, nor per-key `NX`, thus sending `SET`'s in a single round trip.
+            pipeline = self._client.pipeline(transaction=False)
+            for key, value in items:
+                pipeline.set(key, value, px=time_to_live, nx=if_not_exists)
+            results = [bool(result) for result in pipeline.execute()]
+        self._discard(*(key for key, _ in items))
+        return results
 
     def delete(self, key: str) -> bool:
-        return bool(self._client.delete(key))
+        if self._value_chunk_size is not None:
+            transaction = self._client.pipeline(transaction=True)
+            transaction.getrange(key, 0, MANIFEST_SIZE - 1)
+            transaction.delete(key)
+            head, n_deleted = transaction.execute()
+            self._delete_chunks([(key, head)])
+            is_deleted = bool(n_deleted)
+        else:
+            is_deleted = bool(self._client.delete(key))
+        self._discard(key)
+        return is_deleted
 
     def delete_many(self, *keys: str) -> None:
-        if keys:
+        if not keys:
+            return
+        if self._value_chunk_size is not None:
+            # Each manifest is read right before its key gets deleted.
+            pipeline = self._client.pipeline(transaction=False)
+            for key in keys:
+                pipeline.getrange(key, 0, MANIFEST_SIZE - 1)
+                pipeline.delete(key)
+            self._delete_chunks(zip(keys, pipeline.execute()[::2]))
+        elif len(chunks := split_into_chunks(keys, self._chunk_size)) == 1:
             self._client.delete(*keys)
+        else:
+            # Sending the chunks in a single round trip, each of them being a separate command.
+            pipeline = self._client.pipeline(transaction=False)
+            for chunk in chunks:
+                pipeline.delete(*chunk)
+            pipeline.execute()
+        self._discard(*keys)
 
     def clear(self) -> None:
-        self._client.flushdb()
+        # Freeing the memory in background, so that the server keeps responding.
+        self._client.flushdb(asynchronous=True)
+        if self._near_cache is not None:
+            self._near_cache.clear()
+
+    def clear_prefix(self, prefix: str) -> None:
+        """
+        Delete the keys which start with the prefix.
+
+        The keys are iterated with `SCAN` and deleted with `UNLINK` in bounded batches, so that neither command
+        blocks the server for long. The keys which are created during the iteration may survive.
+        """
+        cursor = 0
+        while True:
+            cursor, keys = self._client.scan(cursor, match=make_match_pattern(prefix), count=SCAN_BATCH_SIZE)
+            if keys:
+                self._client.unlink(*keys)
+            if cursor == 0:
+                break
+        if self._near_cache is not None:
+            self._near_cache.clear()
+
+    def get_or_lease(self, key: str, lease_time_to_live: timedelta) -> tuple[bytes | None, str | None]:
+        """
+        Get the value or, if it is missing, try to acquire the lease to compute it, in a single round trip.
+
+        Only one caller at a time gets the lease, so that the other callers could wait for the value
+        instead of computing it in parallel.
+
+        Args:
+            key: cache key
+            lease_time_to_live:
+                The lease expires after this time, so that another caller could acquire it,
+                if the holder has failed to fill the value.
+
+        Returns:
+            Either the value and `None`, or `None` and the lease token, which is then required to `fill()`
+            the value. `None` and `None` means that someone else is holding the lease: then, consider
+            calling `wait_for_fill()`.
+        """
+        token = secrets.token_hex(16)
+        args: list[str | int | bytes] = [token, max(int(lease_time_to_live.total_seconds() * 1000.0), 1)]
+        while True:
+            status, *payload = self._get_or_lease_script(keys=[key, make_lease_key(key)], args=args)
+            if status != LEASE_HIT:
+                break
+            if (value := self._join_chunks(key, payload[0])) is not None:
+                return value, None
+            # Some chunks have been evicted: treating the value as missing, and dropping the rest of its chunks.
+            if (manifest := ValueManifest.unpack(payload[0])) is not None:
+                self._client.delete(*manifest.make_chunk_keys(key))
+            args = [*args[:2], payload[0]]
+        if status == LEASE_GRANTED:
+            return None, token
+        return None, None
+
+    def fill(self, key: str, value: bytes, token: str, *, time_to_live: timedelta | None = None) -> bool:
+        """
+        Set the value and release the lease, if the lease is still held with the token.
+
+        The callers which are waiting in `wait_for_fill()` get notified.
+
+        Returns:
+            `True` if the value has been set, `False` if the lease has expired or has been taken over.
+        """
+        chunk_keys: list[str] = []
+        if self._value_chunk_size is not None:
+            ((_, value, chunk_keys),) = self._write_chunks([(key, value)], time_to_live)
+        result = self._fill_script(
+            keys=[key, make_lease_key(key)],
+            args=[
+                token,
+                value,
+                int(time_to_live.total_seconds() * 1000.0) if time_to_live is not None else "",
+                make_fill_channel(key),
+                MANIFEST_SIZE,
+            ],
+        )
+        self._discard(key)
+        if result is None:
+            if chunk_keys:
+                self._client.unlink(*chunk_keys)
+            return False
+        self._delete_chunks([(key, result[0])])
+        return True
+
+    def release(self, key: str, token: str) -> None:
+        """Release the lease without filling the value, for example, when the computation has failed."""
+        self._release_script(keys=[make_lease_key(key)], args=[token, make_fill_channel(key)])
+
+    def wait_for_fill(self, key: str, timeout: timedelta) -> bytes:
+        """
+        Wait until the lease holder fills the value.
+
+        Raises:
+            KeyError:
+                the value has not been filled within the timeout, or the lease has been released
+                without filling the value – then, consider calling `get_or_lease()` again
+        """
+        with self._client.pubsub(ignore_subscribe_messages=True) as pubsub:
+            # Subscribing before checking the value, so that a fill in between is not missed.
+            pubsub.subscribe(make_fill_channel(key))
+            deadline = monotonic() + timeout.total_seconds()
+            is_notified = False
+            while True:
+                with suppress(KeyError):
+                    return self.get(key)
+                if is_notified or (remaining := deadline - monotonic()) <= 0.0:
+                    raise KeyError(key)
+                is_notified = pubsub.get_message(timeout=remaining) is not None
+
+    def pool_stats(self) -> PoolStats | None:
+        """
+        Get the connection pool statistics.
+
+        Returns:
+            The statistics, or `None` if the client has not been created by `from_url()`
+            and thus its pool is not metered.
+        """
+        pool = self._client.connection_pool
+        if not isinstance(pool, _MeteredConnectionPool):
+            return None
+        return pool.metrics.snapshot(pool.max_connections)
 
     def __exit__(
         self,
@@ -80,4 +387,360 @@ class RedisBackend(SyncBackend[bytes]):
         exc_value: BaseException | None,
         traceback: TracebackType | None,
     ) -> None:
+        if self._listener is not None:
+            self._listener.stop()
         return self._client.__exit__(exc_type, exc_value, traceback)
+
+    def _get_chunks(self, chunks: Sequence[Sequence[str]]) -> Iterable[tuple[str, bytes]]:
+        """Fetch the chunks of keys with pipelined `MGET`s, yielding the items as each reply arrives."""
+        near_cache = self._near_cache
+        # Looking up the near cache first, so that only the missing keys are requested:
+        batches: list[tuple[Sequence[str], dict[str, bytes], list[str]]] = []
+        for chunk in chunks:
+            local_items: dict[str, bytes] = {}
+            if near_cache is not None:
+                for key in chunk:
+                    if (value := near_cache.get(key)) is not None:
+                        local_items[key] = value
+            batches.append((chunk, local_items, [key for key in chunk if key not in local_items]))
+        requests = [missing_keys for _, _, missing_keys in batches if missing_keys]
+        tokens = [[near_cache.reserve(key) for key in keys] for keys in requests] if near_cache is not None else []
+
+        replies = self._mget_pipelined(requests)
+        n_replies = 0
+        try:
+            for chunk, local_items, missing_keys in batches:
+                if missing_keys:
+                    values, is_tracked = next(replies)
+                    if near_cache is not None:
+                        for key, token, value in zip(missing_keys, tokens[n_replies], values):
+                            near_cache.fill(key, token, value if is_tracked else None)
+                    n_replies += 1
+                    local_items.update((key, value) for key, value in zip(missing_keys, values) if value is not None)
+                for key in chunk:
+                    if (value := local_items.get(key)) is not None:
+                        yield key, value
+        finally:
+            replies.close()
+            if near_cache is not None:
+                # Releasing the reservations of the replies which have not been read:
+                for keys, request_tokens in zip(requests[n_replies:], tokens[n_replies:]):
+                    for key, token in zip(keys, request_tokens):
+                        near_cache.fill(key, token, None)
+
+    def _mget_pipelined(
+        self,
+        requests: Sequence[Sequence[str]],
+    ) -> Generator[tuple[list[bytes | None], bool], None, None]:
+        """
+        Send all the `MGET`s at once, and read their replies one by one, as the caller iterates.
+
+        Unlike `Pipeline.execute()`, this does not wait for all the replies before returning the first one.
+        Each reply comes with the flag, which tells whether the keys are tracked for the near cache.
+        """
+        if len(requests) <= 1 and self._listener is None:
+            # No need in pipelining, and the client's own `MGET` retries on connection errors.
+            for keys in requests:
+                yield self._client.mget(*keys), False
+            return
+        pool = self._client.connection_pool
+        connection = pool.get_connection(*GET_CONNECTION_ARGS)
+        n_replies = 0
+        try:
+            is_tracked = self._listener is not None and self._listener.ensure_tracking(connection)
+            connection.send_packed_command(connection.pack_commands([("MGET", *keys) for keys in requests]))
+            for _ in requests:
+                reply = connection.read_response()
+                n_replies += 1
+                yield reply, is_tracked
+        finally:
+            if n_replies != len(requests):
+                # The unread replies would be received by the next command on this connection.
+                connection.disconnect()
+            pool.release(connection)
+
+    def _join_chunks(self, key: str, data: bytes) -> bytes | None:
+        """Fetch the chunks if the data is a manifest, `None` means that some of the chunks are missing."""
+        if self._value_chunk_size is None or (manifest := ValueManifest.unpack(data)) is None:
+            return data
+        # Separate `GET`'s, so that no single command (and reply) is larger than a chunk.
+        pipeline = self._client.pipeline(transaction=False)
+        for chunk_key in manifest.make_chunk_keys(key):
+            pipeline.get(chunk_key)
+        return manifest.join(pipeline.execute())
+
+    def _set_chunked(
+        self,
+        items: Iterable[tuple[str, bytes]],
+        time_to_live: timedelta | None,
+        if_not_exists: bool,
+    ) -> list[bool]:
+        """
+        Set the values, splitting the large ones into chunks.
+
+        The chunks are written first, and only then the manifests replace the values, so that a reader
+        never gets a manifest of incomplete chunks. The chunks of the replaced values get deleted afterwards.
+        """
+        stored_items = self._write_chunks(items, time_to_live)
+        transaction = self._client.pipeline(transaction=True)
+        for key, value, _ in stored_items:
+            transaction.getrange(key, 0, MANIFEST_SIZE - 1)
+            transaction.set(key, value, px=time_to_live, nx=if_not_exists)
+        responses = transaction.execute()
+        results = [bool(is_set) for is_set in responses[1::2]]
+
+        # Deleting the chunks of the replaced values, and the new chunks which have not been referred to.
+        self._delete_chunks(
+            (key, head) for (key, _, _), head, is_set in zip(stored_items, responses[::2], results) if is_set
+        )
+        if unused_chunk_keys := [
+            chunk_key
+            for (_, _, chunk_keys), is_set in zip(stored_items, results)
+            if not is_set
+            for chunk_key in chunk_keys
+        ]:
+            self._client.unlink(*unused_chunk_keys)
+        self._discard(*(key for key, _, _ in stored_items))
+        return results
+
+    def _write_chunks(
+        self,
+        items: Iterable[tuple[str, bytes]],
+        time_to_live: timedelta | None,
+    ) -> list[tuple[str, bytes, list[str]]]:
+        """
+        Write the chunks of the large values in a single pipeline.
+
+        Returns:
+            Keys, values to store under the keys (either the original values or the manifests), and chunk keys.
+        """
+        chunk_size = self._value_chunk_size
+        assert chunk_size is not None
+        stored_items: list[tuple[str, bytes, list[str]]] = []
+        chunk_pipeline = self._client.pipeline(transaction=False)
+        for key, value in items:
+            chunk_keys: list[str] = []
+            if ValueManifest.is_required(value, chunk_size):
+                manifest = ValueManifest.new(len(value), chunk_size)
+                chunk_keys = manifest.make_chunk_keys(key)
+                view = memoryview(value)
+                for offset, chunk_key in zip(range(0, len(value), chunk_size), chunk_keys):
+                    chunk_pipeline.set(chunk_key, view[offset : offset + chunk_size], px=time_to_live)
+                value = manifest.pack()
+            stored_items.append((key, value, chunk_keys))
+        if len(chunk_pipeline):
+            chunk_pipeline.execute()
+        return stored_items
+
+    def _delete_chunks(self, heads: Iterable[tuple[str, bytes | None]]) -> None:
+        """Delete the chunks of the manifests, given the keys and the leading bytes of their former values."""
+        chunk_keys = [
+            chunk_key
+            for key, head in heads
+            if (manifest := ValueManifest.unpack(head)) is not None
+            for chunk_key in manifest.make_chunk_keys(key)
+        ]
+        if chunk_keys:
+            self._client.unlink(*chunk_keys)
+
+    def _expire(self, key: str, command: str, *args: Any) -> None:
+        """Apply the expiration command to the key and, if the value is chunked, to its chunks."""
+        self._discard(key)
+        if self._value_chunk_size is None:
+            self._client.execute_command(command, key, *args)
+            return
+        transaction = self._client.pipeline(transaction=True)
+        transaction.getrange(key, 0, MANIFEST_SIZE - 1)
+        transaction.execute_command(command, key, *args)
+        head, _ = transaction.execute()
+        if (manifest := ValueManifest.unpack(head)) is not None:
+            pipeline = self._client.pipeline(transaction=False)
+            for chunk_key in manifest.make_chunk_keys(key):
+                pipeline.execute_command(command, chunk_key, *args)
+            pipeline.execute()
+
+    def _discard(self, *keys: str) -> None:
+        """
+        Drop the local copies of the keys modified by this client.
+
+        The server would send the invalidation anyway, but this makes the writes
+        immediately visible to the subsequent reads from the same backend.
+        """
+        if self._near_cache is not None:
+            self._near_cache.discard(keys)
+
+
+class _MeteredConnectionPool(ConnectionPool):
+    """Connection pool which counts the connections and measures the checkout time."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.metrics = PoolMetrics()  # the parent constructor already calls `reset()`
+        super().__init__(*args, **kwargs)
+
+    def reset(self) -> None:
+        self.metrics.reset()
+        super().reset()
+
+    def make_connection(self) -> Any:
+        self.metrics.on_created()
+        return super().make_connection()
+
+    def get_connection(self, *args: Any, **kwargs: Any) -> Any:
+        started_at = monotonic()
+        try:
+            connection = super().get_connection(*args, **kwargs)
+        except BaseException:
+            self.metrics.on_failed(monotonic() - started_at)
+            raise
+        self.metrics.on_acquired(connection, monotonic() - started_at)
+        return connection
+
+    def release(self, connection: Any) -> None:
+        self.metrics.on_released(connection)
+        super().release(connection)
+
+
+class _MeteredBlockingConnectionPool(_MeteredConnectionPool, BlockingConnectionPool):
+    """Blocking connection pool, which counts the connections and measures the checkout time."""
+
+
+class _InvalidationListener:
+    """
+    Receives the invalidation messages in a daemon thread, and applies them to the near cache.
+
+    The listener subscribes to the invalidation channel on its own connection, and makes each data connection
+    redirect its tracking invalidations to the listener connection. When the listener connection is lost,
+    the near cache gets disabled until the listener re-subscribes.
+
+    The near cache is only filled through the data connections which are confirmed to redirect
+    the invalidations to the current listener connection, see `ensure_tracking()`.
+    """
+
+    __slots__ = (
+        "_data_pool",
+        "_pool",
+        "_near_cache",
+        "_prefixes",
+        "_is_stopped",
+        "_thread",
+        "_pubsub",
+        "_client_id",
+        "_tracked_ids",
+        "_lock",
+    )
+
+    def __init__(self, data_pool: ConnectionPool, near_cache: NearCache, prefixes: Collection[str]) -> None:
+        self._data_pool = data_pool
+        # Separate pool, so that the listener connection does not get the tracking enabled.
+        self._pool = ConnectionPool(connection_class=data_pool.connection_class, **data_pool.connection_kwargs)
+        self._near_cache = near_cache
+        self._prefixes = prefixes
+        # Current listener connection ID, `None` while the listener is not subscribed:
+        self._client_id: int | None = None
+        # Listener connection IDs, to which the data connections redirect the invalidations:
+        self._tracked_ids: WeakKeyDictionary[AbstractConnection, int] = WeakKeyDictionary()
+        self._lock = Lock()
+        # Installing the hook once, so that the data connections read the current listener connection ID
+        # whenever they (re-)connect:
+        data_pool.connection_kwargs["redis_connect_func"] = self._connect
+        self._pubsub: PubSub | None = None
+        self._is_stopped = Event()
+        self._thread = Thread(target=self._run, name="cachetory-redis-invalidation", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._is_stopped.set()
+        self._thread.join()
+        self._client_id = None
+        self._near_cache.disable()
+        self._pool.disconnect()
+
+    def execute(self, *args: Any) -> tuple[Any, bool]:
+        """
+        Execute the read command on a data connection.
+
+        Returns:
+            The response, and whether the keys are tracked, that is, whether the response may be stored
+            in the near cache.
+        """
+        connection = self._data_pool.get_connection(*GET_CONNECTION_ARGS)
+        try:
+            is_tracked = self.ensure_tracking(connection)
+            connection.send_command(*args)
+            response = connection.read_response()
+        except BaseException:
+            connection.disconnect()
+            raise
+        finally:
+            self._data_pool.release(connection)
+        return response, is_tracked
+
+    def ensure_tracking(self, connection: AbstractConnection) -> bool:
+        """
+        Check whether the checked out data connection redirects the invalidations to the current listener connection.
+
+        The connection gets re-established if it redirects the invalidations to a previous listener connection,
+        or if it has been established before the listener subscribed, or even before the listener got created.
+        """
+        if (client_id := self._client_id) is None:
+            return False
+        with self._lock:
+            if self._tracked_ids.get(connection) == client_id:
+                return True
+        connection.redis_connect_func = self._connect  # type: ignore[assignment]
+        connection.disconnect()
+        connection.connect()
+        with self._lock:
+            return self._tracked_ids.get(connection) == client_id
+
+    def _connect(self, connection: AbstractConnection) -> None:
+        """Establish the data connection, and make it redirect the invalidations to the current listener connection."""
+        with self._lock:
+            self._tracked_ids.pop(connection, None)
+        connection.on_connect()
+        if (client_id := self._client_id) is None:
+            return
+        connection.send_command(*make_tracking_command(client_id, self._prefixes))
+        try:
+            connection.read_response()
+        except ResponseError:
+            return  # the listener connection is gone meanwhile, the data connection stays untracked
+        with self._lock:
+            self._tracked_ids[connection] = client_id
+
+    def _run(self) -> None:
+        while not self._is_stopped.is_set():
+            try:
+                self._subscribe()
+                while not self._is_stopped.is_set():
+                    self._handle(self._pubsub.get_message(timeout=_POLL_INTERVAL))  # type: ignore[union-attr]
+            except RedisError:
+                self._client_id = None
+                self._near_cache.disable()
+                self._is_stopped.wait(_RECONNECT_INTERVAL)
+            finally:
+                if self._pubsub is not None:
+                    self._pubsub.close()
+                    self._pubsub = None
+
+    def _subscribe(self) -> None:
+        self._pubsub = pubsub = Redis(connection_pool=self._pool).pubsub()
+        pubsub.execute_command("CLIENT", "ID")
+        client_id = pubsub.parse_response()
+        pubsub.subscribe(INVALIDATION_CHANNEL)
+        # The data connections switch to the new listener connection as they get checked out:
+        self._near_cache.clear()
+        self._client_id = client_id
+        self._near_cache.enable()
+
+    def _handle(self, message: dict[str, Any] | None) -> None:
+        if message is None or message["type"] != "message":
+            return
+        if (keys := decode_invalidated_keys(message["data"])) is not None:
+            self._near_cache.discard(keys)
+        else:
+            self._near_cache.clear()
+
+
+_POLL_INTERVAL = 1.0
+_RECONNECT_INTERVAL = 1.0
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import itertools
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from types import TracebackType
+
+from redis.cluster import RedisCluster
+
+from cachetory.interfaces.backends.sync import SyncBackend
+from cachetory.private.redis import SCAN_BATCH_SIZE, group_by_slot, make_hash_tag, make_match_pattern
+
+
+class RedisClusterBackend(SyncBackend[bytes]):
+    """
+    Synchronous Redis Cluster backend.
+
+    Multi-key commands are only allowed within a single hash slot, thus the multi-key operations group the keys
+    by slot and send one command per slot. All the commands are sent in a single pipeline, which writes them
+    to all the involved nodes first, and only then reads the responses: the nodes handle them concurrently.
+    """
+
+    __slots__ = ("_client",)
+
+    @classmethod
+    def from_url(cls, url: str) -> RedisClusterBackend:
+        """
+        Instantiate a backend from the URL.
+
+        The URL points to any of the cluster nodes, for example: `redis+cluster://localhost:7000`.
+        The rest of the nodes get discovered from that one.
+        """
+        # Turning `redis+cluster://` into `redis://` and `rediss+cluster://` into `rediss://`:
+        scheme, rest = url.split("://", 1)
+        return cls(RedisCluster.from_url(f"{scheme.removesuffix('+cluster')}://{rest}"))
+
+    def __init__(self, client: RedisCluster) -> None:
+        """
+        Instantiate a backend using the Redis Cluster client.
+
+        Args:
+            client: Redis Cluster client
+        """
+        self._client = client
+
+    @staticmethod
+    def hash_tag(prefix: str) -> str:
+        """
+        Turn the cache prefix into a hash tag, so that all the keys of the cache map onto the same slot.
+
+        The multi-key operations on such a cache then take a single command. Note, that a hot prefix
+        concentrates its entire load on a single node.
+
+        Examples:
+            >>> Cache(serializer=..., backend=backend, prefix=RedisClusterBackend.hash_tag("user:42:"))
+        """
+        return make_hash_tag(prefix)
+
+    def get(self, key: str) -> bytes:
+        if (data := self._client.get(key)) is not None:
+            return data  # type: ignore[return-value]
+        raise KeyError(key)
+
+    def get_many(self, *keys: str) -> Iterable[tuple[str, bytes]]:
+        if not keys:
+            return
+        groups = group_by_slot(keys)
+        pipeline = self._client.pipeline()
+        for slot_keys in groups.values():
+            pipeline.execute_command("MGET", *slot_keys)
+        values = dict(zip(itertools.chain.from_iterable(groups.values()), itertools.chain(*pipeline.execute())))
+        for key in keys:
+            if (value := values.get(key)) is not None:
+                yield key, value
+
+    def expire_at(self, key: str, deadline: datetime | None) -> None:
+        if deadline:
+            self._client.pexpireat(key, int(deadline.timestamp() * 1000.0))
+        else:
+            self._client.persist(key)
+
+    def expire_in(self, key: str, time_to_live: timedelta | None = None) -> None:
+        if time_to_live:
+            self._client.pexpire(key, time_to_live)
+        else:
+            self._client.persist(key)
+
+    def set(  # noqa: A003
+        self,
+        key: str,
+        value: bytes,
+        *,
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> bool:
+        return bool(self._client.set(key, value, px=time_to_live, nx=if_not_exists))
+
+    def set_many(
+        self,
+        items: Iterable[tuple[str, bytes]],
+        *,
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> list[bool]:
+        items = list(items)
+        if not items:
+            return []
+        pipeline = self._client.pipeline()
+        if time_to_live is None and not if_not_exists:
+            values = dict(items)
+            for slot_keys in group_by_slot(values).values():
+                arguments: list[str | bytes] = []
+                for key in slot_keys:
+                    arguments.extend((key, values[key]))
+                pipeline.execute_command("MSET", *arguments)
+            pipeline.execute()
+            return [True] * len(items)
+        for key, value in items:
+            pipeline.set(key, value, px=time_to_live, nx=if_not_exists)
+        return [bool(result) for result in pipeline.execute()]
+
+    def delete(self, key: str) -> bool:
+        return bool(self._client.delete(key))
+
+    def delete_many(self, *keys: str) -> None:
+        if not keys:
+            return
+        pipeline = self._client.pipeline()
+        for slot_keys in group_by_slot(keys).values():
+            pipeline.execute_command("UNLINK", *slot_keys)
+        pipeline.execute()
+
+    def clear(self) -> None:
+        self._client.flushdb(asynchronous=True, target_nodes=RedisCluster.PRIMARIES)
+
+    def clear_prefix(self, prefix: str) -> None:
+        """
+        Delete the keys which start with the prefix, scanning all the primary nodes.
+
+        See also `RedisBackend.clear_prefix()`.
+        """
+        keys = (key.decode() for key in self._client.scan_iter(match=make_match_pattern(prefix), count=SCAN_BATCH_SIZE))
+        while batch := list(itertools.islice(keys, SCAN_BATCH_SIZE)):
+            self.delete_many(*batch)
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._client.__exit__(exc_type, exc_value, traceback)
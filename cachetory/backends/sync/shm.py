@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import fcntl
+import mmap
+import os
+import struct
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from hashlib import blake2b
+from math import inf
+from pathlib import Path
+from threading import Lock
+from time import time
+from types import TracebackType
+from typing import Annotated
+from urllib.parse import parse_qsl, urlparse
+
+from pydantic import BaseModel, Field
+
+from cachetory.interfaces.backends.sync import SyncBackend
+
+
+class SharedMemoryBackend(SyncBackend[bytes]):
+    """
+    Backend that stores entries in a memory-mapped file, shared by all the processes on the host.
+
+    The file contains a fixed-capacity set-associative hash table: each key is hashed onto a set of `ways` slots,
+    and each set is locked independently with a POSIX byte-range lock, so that processes and threads
+    working on different sets do not contend with each other. When a set is full, the least recently used
+    entry of the set gets evicted.
+
+    Warning:
+        This backend is only available on POSIX systems.
+    """
+
+    __slots__ = ("_path", "_n_sets", "_ways", "_slot_size", "_set_size", "_table", "_fd", "_map", "_thread_locks")
+
+    @classmethod
+    def from_url(cls, url: str) -> SharedMemoryBackend:
+        """
+        Instantiate a backend from the URL.
+
+        The URL host is the table name, for example: `shm://my-app?slots=65536&slot-size=1024`.
+        All the processes which use the same name must use the same parameters.
+
+        # URL parameters
+
+        | Parameter   |                                                    |
+        |-------------|----------------------------------------------------|
+        | `slots`     | total number of slots, that is the maximum entries |
+        | `slot-size` | slot size in bytes, including the key and the value |
+        | `ways`      | number of slots in each set                        |
+        """
+        parsed_url = urlparse(url)
+        params = _UrlParams.model_validate(dict(parse_qsl(parsed_url.query)))
+        return cls(
+            parsed_url.hostname or "default",
+            slots=params.slots,
+            slot_size=params.slot_size,
+            ways=params.ways,
+        )
+
+    def __init__(self, name: str, *, slots: int = 8192, slot_size: int = 4096, ways: int = 8) -> None:
+        """
+        Create or open the shared table.
+
+        Args:
+            name:
+                Table name: the file is created in `/dev/shm` (or in the temporary directory if there's no `/dev/shm`).
+                Alternatively, an absolute path to the file.
+            slots: total number of slots, it is rounded up to a multiple of `ways`
+            slot_size:
+                Slot size in bytes. Each slot fits one entry, so the key and the value must fit
+                the slot size minus the 32-byte slot header, otherwise `set()` returns `False`.
+            ways: number of slots in each set, this is also the number of candidates for the eviction
+        """
+        self._path = (Path(name) if Path(name).is_absolute() else _SHM_DIRECTORY / f"cachetory-{name}").resolve()
+        self._n_sets = max(-(-slots // ways), 1)
+        self._ways = ways
+        self._slot_size = slot_size
+        self._set_size = ways * slot_size
+        if slot_size <= _SLOT_HEADER.size:
+            raise ValueError(f"slot size must be greater than {_SLOT_HEADER.size}")
+
+        # POSIX locks are held by a process, and closing any descriptor of the file releases all of them.
+        # Thus, the instances within the process share the single descriptor and the in-process locks:
+        with _TABLES_LOCK:
+            if (table := _TABLES.get(self._path)) is None:
+                table = _TABLES[self._path] = _Table.open(self._path, self._n_sets, ways, slot_size)
+            elif table.layout != (self._n_sets, ways, slot_size):
+                raise ValueError(f"`{self._path}` exists and has a different layout")
+            table.n_references += 1
+        self._table: _Table | None = table
+        self._fd = table.fd
+        self._map = table.map
+        self._thread_locks = table.thread_locks
+
+    def get(self, key: str) -> bytes:
+        encoded_key = key.encode()
+        hash_ = _hash(encoded_key)
+        with self._lock_set(hash_) as offset:
+            if (slot_offset := self._find(offset, hash_, encoded_key, time())) is None:
+                raise KeyError(key)
+            _, key_length, value_length, _, _, _ = _SLOT_HEADER.unpack_from(self._map, slot_offset)
+            _SLOT_HEADER_LAST_ACCESS.pack_into(self._map, slot_offset + _LAST_ACCESS_OFFSET, time())
+            value_offset = slot_offset + _SLOT_HEADER.size + key_length
+            return self._map[value_offset : value_offset + value_length]
+
+    def expire_at(self, key: str, deadline: datetime | None) -> None:
+        self._expire(key, deadline.timestamp() if deadline is not None else inf)
+
+    def expire_in(self, key: str, time_to_live: timedelta | None = None) -> None:
+        self._expire(key, time() + time_to_live.total_seconds() if time_to_live is not None else inf)
+
+    def set(  # noqa: A003
+        self,
+        key: str,
+        value: bytes,
+        *,
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> bool:
+        encoded_key = key.encode()
+        if _SLOT_HEADER.size + len(encoded_key) + len(value) > self._slot_size:
+            if not if_not_exists:
+                self.delete(key)  # the previous value is outdated anyway
+            return False
+        hash_ = _hash(encoded_key)
+        now = time()
+        deadline = now + time_to_live.total_seconds() if time_to_live is not None else inf
+        with self._lock_set(hash_) as offset:
+            if (slot_offset := self._find(offset, hash_, encoded_key, now)) is not None:
+                if if_not_exists:
+                    return False
+            else:
+                slot_offset = self._find_victim(offset, now)
+            data_offset = slot_offset + _SLOT_HEADER.size
+            self._map[data_offset : data_offset + len(encoded_key) + len(value)] = encoded_key + value
+            # Header goes last, so that the slot is never marked as used with incomplete data.
+            _SLOT_HEADER.pack_into(
+                self._map,
+                slot_offset,
+                _STATE_USED,
+                len(encoded_key),
+                len(value),
+                hash_,
+                deadline,
+                now,
+            )
+        return True
+
+    def delete(self, key: str) -> bool:
+        encoded_key = key.encode()
+        hash_ = _hash(encoded_key)
+        with self._lock_set(hash_) as offset:
+            if (slot_offset := self._find(offset, hash_, encoded_key, time())) is None:
+                return False
+            self._map[slot_offset] = _STATE_EMPTY
+            return True
+
+    def delete_many(self, *keys: str) -> None:
+        for key in keys:
+            self.delete(key)
+
+    def clear(self) -> None:
+        for thread_lock in self._thread_locks:
+            thread_lock.acquire()
+        try:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, self._n_sets * self._set_size, _TABLE_HEADER.size)
+            try:
+                for slot_offset in range(_TABLE_HEADER.size, len(self._map), self._slot_size):
+                    self._map[slot_offset] = _STATE_EMPTY
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, self._n_sets * self._set_size, _TABLE_HEADER.size)
+        finally:
+            for thread_lock in self._thread_locks:
+                thread_lock.release()
+
+    def clear_prefix(self, prefix: str) -> None:
+        encoded_prefix = prefix.encode()
+        for index in range(self._n_sets):
+            # Locking set by set, so that the other processes are never blocked for the whole scan.
+            with self._lock_set(index) as offset:
+                for slot_offset in range(offset, offset + self._set_size, self._slot_size):
+                    state, key_length, _, _, _, _ = _SLOT_HEADER.unpack_from(self._map, slot_offset)
+                    key_offset = slot_offset + _SLOT_HEADER.size
+                    if (
+                        state == _STATE_USED
+                        and key_length >= len(encoded_prefix)
+                        and self._map[key_offset : key_offset + len(encoded_prefix)] == encoded_prefix
+                    ):
+                        self._map[slot_offset] = _STATE_EMPTY
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Detach from the table file, which gets unmapped and closed once no instance in the process uses it.
+
+        The table itself stays on the host.
+        """
+        if (table := self._table) is None:
+            return
+        self._table = None
+        with _TABLES_LOCK:
+            table.n_references -= 1
+            if table.n_references == 0:
+                if _TABLES.get(self._path) is table:
+                    del _TABLES[self._path]
+                table.map.close()
+                os.close(table.fd)
+
+    def unlink(self) -> None:
+        """Delete the table file, the processes which have already opened the table may keep using it."""
+        with _TABLES_LOCK:
+            # The new instances must create the new file, as the other processes do:
+            _TABLES.pop(self._path, None)
+            self._path.unlink(missing_ok=True)
+
+    @contextmanager
+    def _lock_set(self, hash_: int) -> Iterator[int]:
+        """Lock the set which the key hash belongs to, and yield the set offset."""
+        index = hash_ % self._n_sets
+        offset = _TABLE_HEADER.size + index * self._set_size
+        with self._thread_locks[index % len(self._thread_locks)]:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, self._set_size, offset)
+            try:
+                yield offset
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, self._set_size, offset)
+
+    def _find(self, set_offset: int, hash_: int, encoded_key: bytes, now: float) -> int | None:
+        """Find the live slot of the key within the locked set, and free it if it has expired."""
+        for slot_offset in range(set_offset, set_offset + self._set_size, self._slot_size):
+            state, key_length, _, slot_hash, deadline, _ = _SLOT_HEADER.unpack_from(self._map, slot_offset)
+            if state != _STATE_USED or slot_hash != hash_ or key_length != len(encoded_key):
+                continue
+            key_offset = slot_offset + _SLOT_HEADER.size
+            if self._map[key_offset : key_offset + key_length] != encoded_key:
+                continue
+            if deadline <= now:
+                self._map[slot_offset] = _STATE_EMPTY
+                return None
+            return slot_offset
+        return None
+
+    def _find_victim(self, set_offset: int, now: float) -> int:
+        """Find an empty or expired slot within the locked set, or else the least recently used one."""
+        victim_offset = set_offset
+        victim_last_access = inf
+        for slot_offset in range(set_offset, set_offset + self._set_size, self._slot_size):
+            state, _, _, _, deadline, last_access = _SLOT_HEADER.unpack_from(self._map, slot_offset)
+            if state != _STATE_USED or deadline <= now:
+                return slot_offset
+            if last_access < victim_last_access:
+                victim_offset, victim_last_access = slot_offset, last_access
+        return victim_offset
+
+    def _expire(self, key: str, deadline: float) -> None:
+        encoded_key = key.encode()
+        hash_ = _hash(encoded_key)
+        with self._lock_set(hash_) as offset:
+            if (slot_offset := self._find(offset, hash_, encoded_key, time())) is not None:
+                _SLOT_HEADER_DEADLINE.pack_into(self._map, slot_offset + _DEADLINE_OFFSET, deadline)
+
+
+class _Table:
+    """Table file, which is opened once per process and shared by the backend instances."""
+
+    __slots__ = ("layout", "fd", "map", "thread_locks", "n_references")
+
+    @classmethod
+    def open(cls, path: Path, n_sets: int, ways: int, slot_size: int) -> _Table:  # noqa: A003
+        """Open the table file, creating and initializing it if needed."""
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            total_size = _TABLE_HEADER.size + n_sets * ways * slot_size
+            fcntl.lockf(fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(fd).st_size == 0:
+                    os.ftruncate(fd, total_size)
+                    os.pwrite(fd, _TABLE_HEADER.pack(_MAGIC, n_sets, ways, slot_size), 0)
+                elif _TABLE_HEADER.unpack(os.pread(fd, _TABLE_HEADER.size, 0)) != (_MAGIC, n_sets, ways, slot_size):
+                    raise ValueError(f"`{path}` exists and has a different layout")
+            finally:
+                fcntl.lockf(fd, fcntl.LOCK_UN)
+            return cls((n_sets, ways, slot_size), fd, mmap.mmap(fd, total_size))
+        except BaseException:
+            os.close(fd)
+            raise
+
+    def __init__(self, layout: tuple[int, int, int], fd: int, map_: mmap.mmap) -> None:
+        self.layout = layout
+        self.fd = fd
+        self.map = map_
+        self.thread_locks = [Lock() for _ in range(min(layout[0], _N_THREAD_LOCKS))]
+        self.n_references = 0
+
+
+def _hash(encoded_key: bytes) -> int:
+    """Hash the key in the same way in all the processes, unlike the built-in `hash()`."""
+    return int.from_bytes(blake2b(encoded_key, digest_size=8).digest(), "little")
+
+
+_TABLES: dict[Path, _Table] = {}
+"""Tables opened by this process, by their paths."""
+
+_TABLES_LOCK = Lock()
+
+_SHM_DIRECTORY = Path("/dev/shm") if Path("/dev/shm").is_dir() else Path(tempfile.gettempdir())
+_N_THREAD_LOCKS = 64
+
+_MAGIC = b"CACHETORY-SHM-01"
+_TABLE_HEADER = struct.Struct("<16sIII4x")
+"""Magic, number of sets, ways, slot size."""
+
+_SLOT_HEADER = struct.Struct("<BxHIQdd")
+"""State, key length, value length, key hash, deadline (wall-clock timestamp), last access timestamp."""
+
+_DEADLINE_OFFSET = 16
+_SLOT_HEADER_DEADLINE = struct.Struct("<d")
+_LAST_ACCESS_OFFSET = 24
+_SLOT_HEADER_LAST_ACCESS = struct.Struct("<d")
+
+_STATE_EMPTY = 0
+_STATE_USED = 1
+
+
+class _UrlParams(BaseModel):
+    slots: Annotated[int, Field(ge=1)] = 8192
+    slot_size: Annotated[int, Field(gt=_SLOT_HEADER.size)] = Field(4096, alias="slot-size")
+    ways: Annotated[int, Field(ge=1)] = 8
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from asyncio import get_running_loop
-from collections.abc import Iterable, Mapping
+from collections.abc import AsyncIterator, Iterable, Mapping
 from concurrent.futures import Executor
 from contextlib import AbstractAsyncContextManager
 from datetime import timedelta
 from types import TracebackType
 from typing import Generic
+from warnings import warn
 
 from cachetory.caches.private import DefaultT
 from cachetory.interfaces.backends.async_ import AsyncBackend
@@ -81,9 +82,25 @@ class Cache(
             >>> await memory_cache.set("foo", 42)
             >>> assert await memory_cache.get_many("foo", "bar") == {"foo": 42}
         """
-        return {
-            f"{self._prefix}{key}": await self._deserialize(data) async for key, data in self._backend.get_many(*keys)
-        }
+        return {key: value async for key, value in self.aiter_many(*keys)}
+
+    async def aiter_many(self, *keys: str) -> AsyncIterator[tuple[str, ValueT]]:
+        """
+        Retrieve many values from the cache, deserializing each one as soon as the backend yields it.
+
+        Unlike `get_many()`, this does not hold all the values at once, provided that the backend
+        streams them (for example, Redis backend with `chunk_size`).
+
+        Returns:
+            Asynchronous iterator over the existing key-value pairs. Missing keys are omitted.
+
+        Examples:
+            >>> await memory_cache.set("foo", 42)
+            >>> assert [item async for item in memory_cache.aiter_many("foo", "bar")] == [("foo", 42)]
+        """
+        prefix_length = len(self._prefix)
+        async for key, data in self._backend.get_many(*(f"{self._prefix}{key}" for key in keys)):
+            yield key[prefix_length:], await self._deserialize(data)
 
     async def expire_in(self, key: str, time_to_live: timedelta | None = None) -> None:
         """
@@ -118,16 +135,30 @@ class Cache(
             if_not_exists=if_not_exists,
         )
 
-    async def set_many(self, items: Iterable[tuple[str, ValueT]] | Mapping[str, ValueT]) -> None:
+    async def set_many(
+        self,
+        items: Iterable[tuple[str, ValueT]] | Mapping[str, ValueT],
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> None:
         """
         Set many cache items at once.
 
+        Args:
+            items: key-value pairs or mapping
+            time_to_live: time to live of the items, or `None` for eternal caching
+            if_not_exists: only set the items which do not already exist
+
         Examples:
             >>> await cache.set_many({"foo": 42, "bar": 100500})
         """
         if isinstance(items, Mapping):
             items = items.items()
-        await self._backend.set_many([(f"{self._prefix}{key}", await self._serialize(value)) for key, value in items])
+        await self._backend.set_many(
+            [(f"{self._prefix}{key}", await self._serialize(value)) for key, value in items],
+            time_to_live=time_to_live,
+            if_not_exists=if_not_exists,
+        )
 
     async def delete(self, key: str) -> bool:
         """
@@ -143,7 +174,22 @@ class Cache(
         await self._backend.delete_many(*(f"{self._prefix}{key}" for key in keys))
 
     async def clear(self) -> None:
-        """Delete all cache items."""
+        """
+        Delete all cache items.
+
+        If the cache has a prefix, only the keys with the prefix are deleted,
+        otherwise the entire backend storage is cleared. The entire storage is cleared as well
+        if the backend cannot delete the keys by prefix, in which case a `RuntimeWarning` is issued.
+        """
+        if self._prefix:
+            try:
+                return await self._backend.clear_prefix(self._prefix)
+            except NotImplementedError:
+                warn(
+                    f"{type(self._backend).__name__} cannot delete the keys by prefix, clearing the entire storage",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
         return await self._backend.clear()
 
     async def __aexit__(
@@ -1,8 +1,9 @@
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from contextlib import AbstractContextManager
 from datetime import timedelta
 from types import TracebackType
 from typing import Generic, Optional, Union
+from warnings import warn
 
 from cachetory.caches.private import DefaultT
 from cachetory.interfaces.backends.private import WireT
@@ -78,9 +79,25 @@ class Cache(
             >>> cache["key"] = 42
             >>> assert cache.get_many("key", "missing") == {"key": 42}
         """
-        return {
-            f"{self._prefix}{key}": self._serializer.deserialize(data) for key, data in self._backend.get_many(*keys)
-        }
+        return dict(self.iter_many(*keys))
+
+    def iter_many(self, *keys: str) -> Iterator[tuple[str, ValueT]]:
+        """
+        Retrieve many values from the cache, deserializing each one as soon as the backend yields it.
+
+        Unlike `get_many()`, this does not hold all the values at once, provided that the backend
+        streams them (for example, Redis backend with `chunk_size`).
+
+        Returns:
+            Iterator over the existing key-value pairs. Missing keys are omitted.
+
+        Examples:
+            >>> cache["key"] = 42
+            >>> assert list(cache.iter_many("key", "missing")) == [("key", 42)]
+        """
+        prefix_length = len(self._prefix)
+        for key, data in self._backend.get_many(*(f"{self._prefix}{key}" for key in keys)):
+            yield key[prefix_length:], self._serializer.deserialize(data)
 
     def expire_in(self, key: str, time_to_live: Optional[timedelta] = None) -> None:
         """
@@ -119,16 +136,30 @@ class Cache(
             if_not_exists=if_not_exists,
         )
 
-    def set_many(self, items: Union[Iterable[tuple[str, ValueT]], Mapping[str, ValueT]]) -> None:
+    def set_many(
+        self,
+        items: Union[Iterable[tuple[str, ValueT]], Mapping[str, ValueT]],
+        time_to_live: Optional[timedelta] = None,
+        if_not_exists: bool = False,
+    ) -> None:
         """
         Set many cache items at once.
 
+        Args:
+            items: key-value pairs or mapping
+            time_to_live: time to live of the items, or `None` for eternal caching
+            if_not_exists: only set the items which do not already exist
+
         Examples:
             >>> cache.set_many({"foo": 42, "bar": 100500})
         """
         if isinstance(items, Mapping):
             items = items.items()
-        self._backend.set_many((f"{self._prefix}{key}", self._serializer.serialize(value)) for key, value in items)
+        self._backend.set_many(
+            ((f"{self._prefix}{key}", self._serializer.serialize(value)) for key, value in items),
+            time_to_live=time_to_live,
+            if_not_exists=if_not_exists,
+        )
 
     def delete(self, key: str) -> bool:
         """
@@ -144,7 +175,22 @@ class Cache(
         self._backend.delete_many(*(f"{self._prefix}{key}" for key in keys))
 
     def clear(self) -> None:
-        """Delete all cache items."""
+        """
+        Delete all cache items.
+
+        If the cache has a prefix, only the keys with the prefix are deleted,
+        otherwise the entire backend storage is cleared. The entire storage is cleared as well
+        if the backend cannot delete the keys by prefix, in which case a `RuntimeWarning` is issued.
+        """
+        if self._prefix:
+            try:
+                return self._backend.clear_prefix(self._prefix)
+            except NotImplementedError:
+                warn(
+                    f"{type(self._backend).__name__} cannot delete the keys by prefix, clearing the entire storage",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
         return self._backend.clear()
 
     def __delitem__(self, key: str) -> None:
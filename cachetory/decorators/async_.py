@@ -1,21 +1,27 @@
 from __future__ import annotations
 
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Hashable, Iterable, Mapping
 from datetime import timedelta
-from functools import wraps
-from typing import Callable, Protocol
+from functools import partial, wraps
+from time import perf_counter
+from typing import Callable, Protocol, TypeVar
 
-from typing_extensions import ParamSpec
+from typing_extensions import Concatenate, ParamSpec
 
 from cachetory.caches.async_ import Cache
 from cachetory.decorators import shared
 from cachetory.interfaces.backends.private import WireT
 from cachetory.interfaces.serializers import ValueT, ValueT_co
+from cachetory.private.asyncio import SingleFlight
+from cachetory.private.envelope import make_envelope, open_envelope
 from cachetory.private.functools import into_async_callable
 
 P = ParamSpec("P")
 """Original wrapped function parameter specification."""
 
+IdT = TypeVar("IdT", bound=Hashable)
+"""Identifier of an item, which `cached_many` caches under its own key."""
+
 
 def cached(
     cache: Cache[ValueT, WireT]
@@ -27,6 +33,9 @@ def cached(
     time_to_live: timedelta | Callable[..., timedelta | None] | Callable[..., Awaitable[timedelta]] | None = None,
     if_not_exists: bool = False,
     exclude: Callable[[str, ValueT], bool] | Callable[[str, ValueT], Awaitable[bool]] | None = None,
+    single_flight: bool = False,
+    refresh_after: timedelta | None = None,
+    early_recompute: float | None = None,
 ) -> Callable[[Callable[P, Awaitable[ValueT]]], _CachedCallable[P, Awaitable[ValueT]]]:
     """
     Apply memoization to the wrapped callable.
@@ -44,6 +53,20 @@ def cached(
             compute the expiration time.
         if_not_exists: controls concurrent sets: if `True` – avoids overwriting a cached value.
         exclude: Optional callable to prevent a key-value pair from being cached if the callable returns true.
+        single_flight:
+            If `True`, concurrent misses of the same key await a single call of the wrapped callable
+            and share its result or exception. A cancelled caller does not cancel the call for the others.
+            `purge()` makes the next callers start a new call, and the result of the purged call is not cached.
+        refresh_after:
+            If set, enables stale-while-revalidate: the value is cached along with its soft expiration time,
+            and `time_to_live` becomes the hard one. Past the soft expiration, the callers get the stale value
+            immediately, while a single background task refreshes it.
+        early_recompute:
+            If set, enables the probabilistic early recomputation (XFetch) with this β, `1.0` being
+            the usual choice. The computation time is cached along with the value, and a caller may recompute
+            the value before it expires, with a probability which rises as the expiration approaches.
+            Higher β means earlier recomputation. Combined with `refresh_after`, the early refresh runs
+            in background before the soft expiration.
     """
 
     def wrap(callable_: Callable[P, Awaitable[ValueT]], /) -> _CachedCallable[P, Awaitable[ValueT]]:
@@ -53,24 +76,80 @@ def cached(
             into_async_callable(exclude) if exclude is not None else None
         )
 
+        # The background refreshes are flights too, so that a miss may join a refresh and vice versa:
+        flights: SingleFlight[ValueT] | None = SingleFlight() if single_flight or refresh_after is not None else None
+        with_envelope = refresh_after is not None or early_recompute is not None
+        beta = early_recompute if early_recompute is not None else 0.0
+
         @wraps(callable_)
         async def cached_callable(*args: P.args, **kwargs: P.kwargs) -> ValueT:
             cache_ = await get_cache(callable_, *args, **kwargs)
             key_ = make_key(callable_, *args, **kwargs)
 
-            if cache_ is not None:
-                value = await cache_.get(key_)
-            else:
-                value = None
+            if cache_ is None:
+                return await callable_(*args, **kwargs)
+            if (cached_value := await cache_.get(key_)) is not None:
+                if not with_envelope:
+                    return cached_value
+                value, is_stale = open_envelope(cached_value, beta)
+                if not is_stale:
+                    return value
+                if refresh_after is not None:
+                    assert flights is not None
+                    flights.start(key_, partial(refresh, cache_, key_, *args, **kwargs))
+                    return value
+                if flights is None:
+                    return await refresh(cache_, key_, *args, **kwargs)
+                return await flights.run(key_, partial(refresh, cache_, key_, *args, **kwargs))
+            if flights is None or not single_flight:
+                return await call_and_set(cache_, key_, *args, **kwargs)
+            return await flights.run(key_, partial(call_and_set_in_flight, cache_, key_, *args, **kwargs))
 
-            if value is None:
-                value = await callable_(*args, **kwargs)
-                if cache_ is not None and (exclude_ is None or not await exclude_(key_, value)):
-                    time_to_live_ = await get_time_to_live(key=key_)
-                    await cache_.set(key_, value, time_to_live=time_to_live_, if_not_exists=if_not_exists)
+        async def call_and_set(cache_: Cache[ValueT, WireT], key_: str, *args: P.args, **kwargs: P.kwargs) -> ValueT:
+            value, duration = await timed_call(*args, **kwargs)
+            await set_(cache_, key_, value, duration, if_not_exists_=if_not_exists)
+            return value
+
+        async def call_and_set_in_flight(
+            cache_: Cache[ValueT, WireT],
+            key_: str,
+            *args: P.args,
+            **kwargs: P.kwargs,
+        ) -> ValueT:
+            assert flights is not None
+            value, duration = await timed_call(*args, **kwargs)
+            if flights.is_current(key_):  # otherwise, purged while being computed
+                await set_(cache_, key_, value, duration, if_not_exists_=if_not_exists)
+            return value
 
+        async def refresh(cache_: Cache[ValueT, WireT], key_: str, *args: P.args, **kwargs: P.kwargs) -> ValueT:
+            value, duration = await timed_call(*args, **kwargs)
+            if flights is None or flights.is_current(key_):
+                # The refreshed value has to overwrite the stale one:
+                await set_(cache_, key_, value, duration, if_not_exists_=False)
             return value
 
+        async def timed_call(*args: P.args, **kwargs: P.kwargs) -> tuple[ValueT, float]:
+            start_time = perf_counter()
+            value = await callable_(*args, **kwargs)
+            return value, perf_counter() - start_time
+
+        async def set_(
+            cache_: Cache[ValueT, WireT],
+            key_: str,
+            value: ValueT,
+            duration: float,
+            *,
+            if_not_exists_: bool,
+        ) -> None:
+            if exclude_ is None or not await exclude_(key_, value):
+                time_to_live_ = await get_time_to_live(key=key_)
+                if with_envelope:
+                    # Stale-while-revalidate goes stale after the soft expiration, and XFetch alone – the hard one:
+                    stale_after = refresh_after if refresh_after is not None else time_to_live_
+                    value = make_envelope(value, stale_after, duration)  # type: ignore[assignment]
+                await cache_.set(key_, value, time_to_live=time_to_live_, if_not_exists=if_not_exists_)
+
         async def purge(*args: P.args, **kwargs: P.kwargs) -> bool:
             """
             Delete the value that was cached using the same call arguments.
@@ -80,6 +159,8 @@ def cached(
             """
             if (cache := await get_cache(callable_, *args, **kwargs)) is not None:
                 key = make_key(callable_, *args, **kwargs)
+                if flights is not None:
+                    flights.forget(key)
                 return await cache.delete(key)
             else:
                 return False
@@ -90,6 +171,89 @@ def cached(
     return wrap
 
 
+def cached_many(
+    cache: Cache[ValueT, WireT]
+    | Callable[..., Cache[ValueT, WireT] | None]
+    | Callable[..., Awaitable[Cache[ValueT, WireT] | None]]
+    | None,
+    *,
+    make_key: Callable[..., str] = shared.make_default_key,  # no way to use `P` here
+    time_to_live: timedelta | None = None,
+    if_not_exists: bool = False,
+) -> Callable[
+    [Callable[Concatenate[list[IdT], P], Awaitable[Mapping[IdT, ValueT]]]],
+    _CachedManyCallable[IdT, P, ValueT],
+]:
+    """
+    Apply per-item memoization to the wrapped callable, which loads a batch of items by their identifiers.
+
+    The wrapped callable accepts a list of identifiers as the first argument, and returns a mapping
+    from the identifiers to the items. Each item gets cached under its own key, so that overlapping
+    batches share the cached items. On a call, the hits are fetched with a single `get_many()`,
+    only the missing identifiers are passed to the wrapped callable, and the results are cached
+    with a single `set_many()`. The identifiers, which the wrapped callable omits, are not cached,
+    and they are omitted from the result.
+
+    Args:
+        cache:
+            `Cache` instance or a callable (sync or async) that returns a `Cache` instance for each function call.
+            In the latter case the specific callable gets called with a wrapped function as the first argument,
+            and the rest of the arguments next to it.
+            If the callable returns `None`, the cache is skipped.
+        make_key:
+            callable to generate a custom cache key per each item. It gets called with the wrapped function,
+            the item identifier, and the rest of the arguments.
+        time_to_live: cached items expiration time
+        if_not_exists: controls concurrent sets: if `True` – avoids overwriting the cached items.
+
+    Examples:
+        >>> @cached_many(cache)
+        >>> async def load_users(ids: list[int]) -> dict[int, User]:
+        >>>     ...
+    """
+
+    def wrap(
+        callable_: Callable[Concatenate[list[IdT], P], Awaitable[Mapping[IdT, ValueT]]],
+        /,
+    ) -> _CachedManyCallable[IdT, P, ValueT]:
+        get_cache = into_async_callable(cache)
+
+        @wraps(callable_)
+        async def cached_callable(ids: Iterable[IdT], /, *args: P.args, **kwargs: P.kwargs) -> dict[IdT, ValueT]:
+            ids = list(dict.fromkeys(ids))  # deduplicating while preserving the order
+            cache_ = await get_cache(callable_, ids, *args, **kwargs)
+
+            if cache_ is None:
+                return dict(await callable_(ids, *args, **kwargs))
+            if not ids:
+                return {}
+            keys = {id_: make_key(callable_, id_, *args, **kwargs) for id_ in ids}
+            cached_values = await cache_.get_many(*keys.values())
+            values = {id_: cached_values[key] for id_, key in keys.items() if key in cached_values}
+            if missing_ids := [id_ for id_ in ids if id_ not in values]:
+                loaded = await callable_(missing_ids, *args, **kwargs)
+                # Ignoring the identifiers, which have not been asked for:
+                loaded_values = {id_: loaded[id_] for id_ in missing_ids if id_ in loaded}
+                if loaded_values:
+                    await cache_.set_many(
+                        {keys[id_]: value for id_, value in loaded_values.items()},
+                        time_to_live=time_to_live,
+                        if_not_exists=if_not_exists,
+                    )
+                values.update(loaded_values)
+            return {id_: values[id_] for id_ in ids if id_ in values}
+
+        async def purge(ids: Iterable[IdT], /, *args: P.args, **kwargs: P.kwargs) -> None:
+            ids = list(ids)
+            if (cache_ := await get_cache(callable_, ids, *args, **kwargs)) is not None:
+                await cache_.delete_many(*(make_key(callable_, id_, *args, **kwargs) for id_ in ids))
+
+        cached_callable.purge = purge  # type: ignore[attr-defined]
+        return cached_callable  # type: ignore[return-value]
+
+    return wrap
+
+
 class _CachedCallable(Protocol[P, ValueT_co]):
     """Protocol of the wrapped callable."""
 
@@ -102,3 +266,12 @@ class _CachedCallable(Protocol[P, ValueT_co]):
         Returns:
             whether a cached value existed
         """
+
+
+class _CachedManyCallable(Protocol[IdT, P, ValueT]):
+    """Protocol of the callable wrapped by `cached_many`."""
+
+    async def __call__(self, ids: Iterable[IdT], /, *args: P.args, **kwargs: P.kwargs) -> dict[IdT, ValueT]: ...
+
+    async def purge(self, ids: Iterable[IdT], /, *args: P.args, **kwargs: P.kwargs) -> None:
+        """Delete the items that were cached using the same identifiers and the rest of the call arguments."""
@@ -1,21 +1,29 @@
 from __future__ import annotations
 
+from collections.abc import Hashable, Iterable, Mapping
+from concurrent.futures import Executor
 from contextlib import suppress
 from datetime import timedelta
-from functools import wraps
-from typing import Callable
+from functools import partial, wraps
+from time import perf_counter
+from typing import Callable, TypeVar
 
-from typing_extensions import ParamSpec, Protocol
+from typing_extensions import Concatenate, ParamSpec, Protocol
 
 from cachetory.caches.sync import Cache
 from cachetory.decorators import shared
 from cachetory.interfaces.backends.private import WireT
 from cachetory.interfaces.serializers import ValueT, ValueT_co
+from cachetory.private.envelope import make_envelope, open_envelope
 from cachetory.private.functools import into_callable
+from cachetory.private.threading import BackgroundCalls, KeyLocks
 
 P = ParamSpec("P")
 """Original wrapped function parameter specification."""
 
+IdT = TypeVar("IdT", bound=Hashable)
+"""Identifier of an item, which `cached_many` caches under its own key."""
+
 
 def cached(
     cache: Cache[ValueT, WireT] | Callable[..., Cache[ValueT, WireT] | None] | None,  # no way to use `P` here
@@ -24,6 +32,11 @@ def cached(
     time_to_live: timedelta | Callable[..., timedelta | None] | None = None,
     if_not_exists: bool = False,
     exclude: Callable[[str, ValueT], bool] | None = None,
+    single_flight: bool = False,
+    wait_timeout: timedelta | None = None,
+    refresh_after: timedelta | None = None,
+    refresh_executor: Executor | None = None,
+    early_recompute: float | None = None,
 ) -> Callable[[Callable[P, ValueT]], _CachedCallable[P, ValueT]]:
     """
     Apply memoization to the wrapped callable.
@@ -41,31 +54,120 @@ def cached(
             compute the expiration time.
         if_not_exists: controls concurrent sets: if `True` – avoids overwriting a cached value.
         exclude: Optional callable to prevent a key-value pair from being cached if the callable returns true.
+        single_flight:
+            If `True`, concurrent threads which miss the same key call the wrapped callable one at a time,
+            under a per-key lock. Once the first thread has cached the value, the others read it from the cache.
+        wait_timeout:
+            How long a thread waits for the per-key lock in the single-flight mode. On timeout, the thread
+            calls the wrapped callable on its own. `None` means waiting forever.
+        refresh_after:
+            If set, enables stale-while-revalidate: the value is cached along with its soft expiration time,
+            and `time_to_live` becomes the hard one. Past the soft expiration, the callers get the stale value
+            immediately, while a single background job refreshes it.
+        refresh_executor:
+            Executor to run the background refreshes in, defaults to a thread pool shared by the decorators.
+        early_recompute:
+            If set, enables the probabilistic early recomputation (XFetch) with this β, `1.0` being
+            the usual choice. The computation time is cached along with the value, and a caller may recompute
+            the value before it expires, with a probability which rises as the expiration approaches.
+            Higher β means earlier recomputation. Combined with `refresh_after`, the early refresh runs
+            in background before the soft expiration.
     """
 
     def wrap(callable_: Callable[P, ValueT], /) -> _CachedCallable[P, ValueT]:
         get_cache = into_callable(cache)
         get_time_to_live = into_callable(time_to_live)
 
+        key_locks = KeyLocks() if single_flight else None
+        lock_timeout = wait_timeout.total_seconds() if wait_timeout is not None else -1.0
+        refreshes = BackgroundCalls(refresh_executor) if refresh_after is not None else None
+
+        with_envelope = refresh_after is not None or early_recompute is not None
+        beta = early_recompute if early_recompute is not None else 0.0
+
         @wraps(callable_)
         def cached_callable(*args: P.args, **kwargs: P.kwargs) -> ValueT:
             cache_ = get_cache(callable_, *args, **kwargs)
             key_ = make_key(callable_, *args, **kwargs)
 
-            if cache_ is not None:
+            if cache_ is None:
+                return callable_(*args, **kwargs)
+            is_expired_early = False
+            with suppress(KeyError):
+                # `KeyError` normally means the value is «non-cached».
+                value, is_expired_early = get_cached(cache_, key_, *args, **kwargs)
+                if not is_expired_early:
+                    return value
+            if is_expired_early:
+                return refresh(cache_, key_, *args, **kwargs)
+            if key_locks is None:
+                return call_and_set(cache_, key_, *args, **kwargs)
+
+            lock = key_locks[key_]
+            if not lock.acquire(timeout=lock_timeout):
+                return call_and_set(cache_, key_, *args, **kwargs)
+            try:
                 with suppress(KeyError):
-                    # `KeyError` normally means the value is «non-cached».
-                    return cache_[key_]
+                    # The value has been cached by another thread while this one was waiting.
+                    return get_cached(cache_, key_, *args, **kwargs)[0]
+                return call_and_set(cache_, key_, *args, **kwargs)
+            finally:
+                lock.release()
+
+        def get_cached(
+            cache_: Cache[ValueT, WireT],
+            key_: str,
+            *args: P.args,
+            **kwargs: P.kwargs,
+        ) -> tuple[ValueT, bool]:
+            # Returns the cached value, and whether the caller has to recompute it early.
+            cached_value = cache_[key_]
+            if not with_envelope:
+                return cached_value, False
+            value, is_stale = open_envelope(cached_value, beta)
+            if is_stale and refreshes is not None:
+                refreshes.start(key_, partial(refresh, cache_, key_, *args, **kwargs))
+                return value, False
+            return value, is_stale
 
+        def call_and_set(cache_: Cache[ValueT, WireT], key_: str, *args: P.args, **kwargs: P.kwargs) -> ValueT:
+            value, duration = timed_call(*args, **kwargs)
+            set_(cache_, key_, value, duration, if_not_exists_=if_not_exists)
+            return value
+
+        def refresh(cache_: Cache[ValueT, WireT], key_: str, *args: P.args, **kwargs: P.kwargs) -> ValueT:
+            value, duration = timed_call(*args, **kwargs)
+            if refreshes is None or refreshes.is_current(key_):  # otherwise, purged while being computed
+                # The refreshed value has to overwrite the stale one:
+                set_(cache_, key_, value, duration, if_not_exists_=False)
+            return value
+
+        def timed_call(*args: P.args, **kwargs: P.kwargs) -> tuple[ValueT, float]:
+            start_time = perf_counter()
             value = callable_(*args, **kwargs)
-            if cache_ is not None and (exclude is None or not exclude(key_, value)):
+            return value, perf_counter() - start_time
+
+        def set_(
+            cache_: Cache[ValueT, WireT],
+            key_: str,
+            value: ValueT,
+            duration: float,
+            *,
+            if_not_exists_: bool,
+        ) -> None:
+            if exclude is None or not exclude(key_, value):
                 time_to_live_ = get_time_to_live(key=key_)
-                cache_.set(key_, value, time_to_live=time_to_live_, if_not_exists=if_not_exists)
-            return value
+                if with_envelope:
+                    # Stale-while-revalidate goes stale after the soft expiration, and XFetch alone – the hard one:
+                    stale_after = refresh_after if refresh_after is not None else time_to_live_
+                    value = make_envelope(value, stale_after, duration)  # type: ignore[assignment]
+                cache_.set(key_, value, time_to_live=time_to_live_, if_not_exists=if_not_exists_)
 
         def purge(*args: P.args, **kwargs: P.kwargs) -> bool:
             if (cache := get_cache(callable_, *args, **kwargs)) is not None:
                 key = make_key(callable_, *args, **kwargs)
+                if refreshes is not None:
+                    refreshes.forget(key)
                 return cache.delete(key)
             else:
                 return False
@@ -76,6 +178,83 @@ def cached(
     return wrap
 
 
+def cached_many(
+    cache: Cache[ValueT, WireT] | Callable[..., Cache[ValueT, WireT] | None] | None,  # no way to use `P` here
+    *,
+    make_key: Callable[..., str] = shared.make_default_key,  # no way to use `P` here
+    time_to_live: timedelta | None = None,
+    if_not_exists: bool = False,
+) -> Callable[[Callable[Concatenate[list[IdT], P], Mapping[IdT, ValueT]]], _CachedManyCallable[IdT, P, ValueT]]:
+    """
+    Apply per-item memoization to the wrapped callable, which loads a batch of items by their identifiers.
+
+    The wrapped callable accepts a list of identifiers as the first argument, and returns a mapping
+    from the identifiers to the items. Each item gets cached under its own key, so that overlapping
+    batches share the cached items. On a call, the hits are fetched with a single `get_many()`,
+    only the missing identifiers are passed to the wrapped callable, and the results are cached
+    with a single `set_many()`. The identifiers, which the wrapped callable omits, are not cached,
+    and they are omitted from the result.
+
+    Args:
+        cache:
+            `Cache` instance or a callable that returns a `Cache` instance for each function call.
+            In the latter case the specified callable gets called with a wrapped function as the first argument,
+            and the rest of the arguments next to it.
+            If the callable returns `None`, the cache is skipped.
+        make_key:
+            callable to generate a custom cache key per each item. It gets called with the wrapped function,
+            the item identifier, and the rest of the arguments.
+        time_to_live: cached items expiration time
+        if_not_exists: controls concurrent sets: if `True` – avoids overwriting the cached items.
+
+    Examples:
+        >>> @cached_many(cache)
+        >>> def load_users(ids: list[int]) -> dict[int, User]:
+        >>>     ...
+    """
+
+    def wrap(
+        callable_: Callable[Concatenate[list[IdT], P], Mapping[IdT, ValueT]],
+        /,
+    ) -> _CachedManyCallable[IdT, P, ValueT]:
+        get_cache = into_callable(cache)
+
+        @wraps(callable_)
+        def cached_callable(ids: Iterable[IdT], /, *args: P.args, **kwargs: P.kwargs) -> dict[IdT, ValueT]:
+            ids = list(dict.fromkeys(ids))  # deduplicating while preserving the order
+            cache_ = get_cache(callable_, ids, *args, **kwargs)
+
+            if cache_ is None:
+                return dict(callable_(ids, *args, **kwargs))
+            if not ids:
+                return {}
+            keys = {id_: make_key(callable_, id_, *args, **kwargs) for id_ in ids}
+            cached_values = cache_.get_many(*keys.values())
+            values = {id_: cached_values[key] for id_, key in keys.items() if key in cached_values}
+            if missing_ids := [id_ for id_ in ids if id_ not in values]:
+                loaded = callable_(missing_ids, *args, **kwargs)
+                # Ignoring the identifiers, which have not been asked for:
+                loaded_values = {id_: loaded[id_] for id_ in missing_ids if id_ in loaded}
+                if loaded_values:
+                    cache_.set_many(
+                        {keys[id_]: value for id_, value in loaded_values.items()},
+                        time_to_live=time_to_live,
+                        if_not_exists=if_not_exists,
+                    )
+                values.update(loaded_values)
+            return {id_: values[id_] for id_ in ids if id_ in values}
+
+        def purge(ids: Iterable[IdT], /, *args: P.args, **kwargs: P.kwargs) -> None:
+            ids = list(ids)
+            if (cache_ := get_cache(callable_, ids, *args, **kwargs)) is not None:
+                cache_.delete_many(*(make_key(callable_, id_, *args, **kwargs) for id_ in ids))
+
+        cached_callable.purge = purge  # type: ignore[attr-defined]
+        return cached_callable  # type: ignore[return-value]
+
+    return wrap
+
+
 class _CachedCallable(Protocol[P, ValueT_co]):
     """Protocol of the wrapped callable."""
 
@@ -88,3 +267,12 @@ class _CachedCallable(Protocol[P, ValueT_co]):
         Returns:
             whether a cached value existed
         """
+
+
+class _CachedManyCallable(Protocol[IdT, P, ValueT]):
+    """Protocol of the callable wrapped by `cached_many`."""
+
+    def __call__(self, ids: Iterable[IdT], /, *args: P.args, **kwargs: P.kwargs) -> dict[IdT, ValueT]: ...
+
+    def purge(self, ids: Iterable[IdT], /, *args: P.args, **kwargs: P.kwargs) -> None:
+        """Delete the items that were cached using the same identifiers and the rest of the call arguments."""
@@ -81,10 +81,24 @@ class SyncBackendWrite(Protocol[WireT_contra]):
         # TODO: just return `None`.
         raise NotImplementedError
 
-    def set_many(self, items: Iterable[tuple[str, WireT_contra]]) -> None:
-        """Put all the specified values to the cache."""
-        for key, value in items:
-            self.set(key, value)
+    def set_many(
+        self,
+        items: Iterable[tuple[str, WireT_contra]],
+        *,
+        time_to_live: timedelta | None = None,
+        if_not_exists: bool = False,
+    ) -> list[bool]:
+        """
+        Put all the specified values to the cache.
+
+        Args:
+            time_to_live: time to live of the items, or `None` for eternal caching
+            if_not_exists: only set the items which do not already exist
+
+        Returns:
+            Whether each item has been set, in the order of the items.
+        """
+        return [self.set(key, value, time_to_live=time_to_live, if_not_exists=if_not_exists) for key, value in items]
 
     def delete(self, key: str) -> bool:  # pragma: no cover
         """
@@ -102,6 +116,15 @@ class SyncBackendWrite(Protocol[WireT_contra]):
         """Clear the backend storage."""
         raise NotImplementedError
 
+    def clear_prefix(self, prefix: str) -> None:  # pragma: no cover
+        """
+        Delete all the keys which start with the prefix.
+
+        This is what a prefixed cache calls instead of `clear()`,
+        so that it does not wipe the keys of the other caches sharing the storage.
+        """
+        raise NotImplementedError
+
 
 class SyncBackend(
     AbstractContextManager,  # type: ignore[type-arg]
@@ -1,11 +1,107 @@
-from typing import Callable, TypeVar
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable
+from functools import partial
+from logging import getLogger
+from typing import Callable, Generic, TypeVar
 
 from typing_extensions import ParamSpec
 
 P = ParamSpec("P")
 R = TypeVar("R")
 
+logger = getLogger(__name__)
+
 
 async def postpone(f: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
     """Postpones `f` until awaited and forwards the value back to the caller."""
     return f(*args, **kwargs)
+
+
+class SingleFlight(Generic[R]):
+    """
+    Coalesces the concurrent calls for the same key into a single in-flight call.
+
+    The first caller starts the call in a separate task, and the concurrent callers await the same task:
+    they all receive its result or its exception. A cancelled caller does not affect the others,
+    and the call gets cancelled only once all its callers have been cancelled.
+    """
+
+    __slots__ = ("_flights", "_background_tasks")
+
+    def __init__(self) -> None:
+        self._flights: dict[str, _Flight[R]] = {}
+        self._background_tasks: set[asyncio.Task[R]] = set()
+
+    async def run(self, key: str, call: Callable[[], Awaitable[R]]) -> R:
+        """Join the in-flight call for the key, or start the new one."""
+        loop = asyncio.get_running_loop()
+        flight = self._flights.get(key)
+        if flight is None or flight.task.get_loop() is not loop:
+            # Each event loop has its own flights, since a task may only be awaited in its own loop.
+            flight = self._start(loop, key, call)
+        flight.n_callers += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.n_callers -= 1
+            if flight.n_callers == 0 and not flight.task.done():
+                # Nobody is interested in the result anymore. The next callers must not join the dying call:
+                self._discard(key, flight)
+                flight.task.cancel()
+
+    def start(self, key: str, call: Callable[[], Awaitable[R]]) -> None:
+        """
+        Start the call for the key in background, unless the key is already in flight.
+
+        Nobody awaits the background call, and it runs to completion even if the joined callers get cancelled.
+        Its exception is passed to the joined callers, if any, and logged as a warning.
+        """
+        loop = asyncio.get_running_loop()
+        flight = self._flights.get(key)
+        if flight is not None and flight.task.get_loop() is loop:
+            return
+        flight = self._start(loop, key, call)
+        flight.n_callers += 1  # the background «caller» never leaves
+        # The event loop only references the tasks weakly:
+        self._background_tasks.add(flight.task)
+        flight.task.add_done_callback(partial(self._on_background_task_done, key))
+
+    def forget(self, key: str) -> None:
+        """
+        Let the next callers start a new call for the key.
+
+        The callers, which have already joined the current call, still receive its result.
+        """
+        self._flights.pop(key, None)
+
+    def is_current(self, key: str) -> bool:
+        """Check whether the running task is the call for the key, which has not been forgotten."""
+        return (flight := self._flights.get(key)) is not None and flight.task is asyncio.current_task()
+
+    def _start(self, loop: asyncio.AbstractEventLoop, key: str, call: Callable[[], Awaitable[R]]) -> _Flight[R]:
+        flight = self._flights[key] = _Flight(loop.create_task(_await(call)))
+        flight.task.add_done_callback(lambda _: self._discard(key, flight))
+        return flight
+
+    def _on_background_task_done(self, key: str, task: asyncio.Task[R]) -> None:
+        self._background_tasks.discard(task)
+        if not task.cancelled() and (exception := task.exception()) is not None:
+            logger.warning("Background call for `%s` has failed", key, exc_info=exception)
+
+    def _discard(self, key: str, flight: _Flight[R]) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+
+class _Flight(Generic[R]):
+    __slots__ = ("task", "n_callers")
+
+    def __init__(self, task: asyncio.Task[R]) -> None:
+        self.task = task
+        self.n_callers = 0
+
+
+async def _await(call: Callable[[], Awaitable[R]]) -> R:
+    return await call()
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from math import log
+from random import random
+from time import time
+from typing import TypeVar, cast
+
+T = TypeVar("T")
+
+ENVELOPE_TAG = "cachetory:envelope:1"
+"""Leading envelope item, which tells the envelope apart from a plain value that happens to look alike."""
+
+
+def make_envelope(value: T, time_to_live: timedelta | None, duration: float) -> tuple[str, float | None, float, T]:
+    """
+    Pack the value together with its deadline, which is a UNIX timestamp, and the duration of its computation.
+
+    The envelope is tagged with `ENVELOPE_TAG`, the version in the tag changes whenever the layout does.
+
+    Args:
+        value: computed value
+        time_to_live: time after which the value is considered stale, `None` means never
+        duration: how long it took to compute the value, in seconds
+    """
+    deadline = time() + time_to_live.total_seconds() if time_to_live is not None else None
+    return ENVELOPE_TAG, deadline, duration, value
+
+
+def open_envelope(envelope: T, beta: float = 0.0) -> tuple[T, bool]:
+    """
+    Unpack the value and check whether it is stale.
+
+    The envelope is typed as the value, since that is what the cache declares to contain.
+    Serializers may turn the tuple into a list, thus both are accepted. Anything else, including an envelope
+    of another version, is considered a value cached without the envelope, and it is treated as stale,
+    so that it gets recomputed.
+
+    Args:
+        envelope: cached envelope
+        beta:
+            XFetch parameter: with a positive `beta`, the value randomly becomes stale before its deadline,
+            and the probability rises as the deadline approaches. The longer the computation,
+            and the higher the `beta`, the earlier it happens. Zero means no early expiration.
+    """
+    if isinstance(envelope, (tuple, list)) and len(envelope) == 4 and envelope[0] == ENVELOPE_TAG:
+        _, deadline, duration, value = envelope
+        if deadline is None:
+            return cast(T, value), False
+        # `1.0 - random()` is never zero, and `-log()` of it is exponentially distributed:
+        return cast(T, value), time() - duration * beta * log(1.0 - random()) >= deadline
+    return envelope, True
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+_N_ROWS = 4
+_MAX_COUNT = 15
+_MASK_64 = (1 << 64) - 1
+_SEEDS = (0xC3A5C85C97CB3127, 0xB492B66FBE98F273, 0x9AE16A3B2F90404F, 0xCBF29CE484222325)
+
+
+class FrequencySketch:
+    """
+    Count-min sketch with 4-bit saturating counters and periodic aging, as used by TinyLFU.
+
+    Once the number of increments reaches the sample size, all the counters get halved,
+    so that the sketch forgets the history and adapts to the changing popularity.
+    """
+
+    __slots__ = ("_table", "_mask", "_sample_size", "_n_increments")
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initialize the sketch.
+
+        Args:
+            capacity: expected number of distinct keys of interest, usually the cache capacity
+        """
+        # Like in Caffeine, there are 16 counters per each key of interest in total.
+        width = 16
+        while width < 4 * capacity:
+            width <<= 1
+        self._table = bytearray(_N_ROWS * width)
+        self._mask = width - 1
+        self._sample_size = 10 * max(capacity, 1)
+        self._n_increments = 0
+
+    def frequency(self, key: str) -> int:
+        """Estimate the number of the key occurrences since the last aging."""
+        table = self._table
+        index_0, index_1, index_2, index_3 = self._indices(key)
+        return min(table[index_0], table[index_1], table[index_2], table[index_3])
+
+    def increment(self, key: str) -> None:
+        """Record an occurrence of the key."""
+        table = self._table
+        for index in self._indices(key):
+            if table[index] < _MAX_COUNT:
+                table[index] += 1
+        self._n_increments += 1
+        if self._n_increments >= self._sample_size:
+            self._age()
+
+    def _indices(self, key: str) -> tuple[int, int, int, int]:
+        """Map the key onto one counter in each row, using an independently seeded hash per row."""
+        mask = self._mask
+        width = mask + 1
+        hash_ = hash(key)
+        seed_0, seed_1, seed_2, seed_3 = _SEEDS
+        # Every row mixes the whole hash, so that keys colliding in one row rarely collide in the others.
+        hash_0 = ((hash_ + seed_0) * seed_0) & _MASK_64
+        hash_1 = ((hash_ + seed_1) * seed_1) & _MASK_64
+        hash_2 = ((hash_ + seed_2) * seed_2) & _MASK_64
+        hash_3 = ((hash_ + seed_3) * seed_3) & _MASK_64
+        return (
+            (hash_0 ^ (hash_0 >> 32)) & mask,
+            width + ((hash_1 ^ (hash_1 >> 32)) & mask),
+            2 * width + ((hash_2 ^ (hash_2 >> 32)) & mask),
+            3 * width + ((hash_3 ^ (hash_3 >> 32)) & mask),
+        )
+
+    def _age(self) -> None:
+        self._table = bytearray(count >> 1 for count in self._table)
+        self._n_increments //= 2
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import partial
+from logging import getLogger
+from threading import Lock, local
+from weakref import WeakValueDictionary
+
+logger = getLogger(__name__)
+
+_default_executor: ThreadPoolExecutor | None = None
+_default_executor_lock = Lock()
+
+
+def get_default_executor() -> ThreadPoolExecutor:
+    """Get the shared executor for the background calls, which is created on first use."""
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(thread_name_prefix="cachetory")
+        return _default_executor
+
+
+class KeyLocks:
+    """
+    Per-key locks, which only exist while they are in use.
+
+    The table references the locks weakly: a lock is gone as soon as no thread holds or waits for it.
+    Thus, the table size is bounded by the number of keys being processed concurrently,
+    no matter how many distinct keys pass through it.
+    """
+
+    __slots__ = ("_locks", "_lock")
+
+    def __init__(self) -> None:
+        self._locks: WeakValueDictionary[str, Lock] = WeakValueDictionary()
+        self._lock = Lock()
+
+    def __getitem__(self, key: str) -> Lock:
+        """Get the lock of the key. The caller must keep the reference for as long as it uses the lock."""
+        with self._lock:
+            if (lock := self._locks.get(key)) is None:
+                lock = self._locks[key] = Lock()
+            return lock
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+
+class BackgroundCalls:
+    """
+    Runs at most one background call per key in the executor.
+
+    A call for the key is not submitted while the previous one is pending or running.
+    The exceptions are not propagated anywhere, since the caller is not waiting for the result.
+    Instead, they are logged as warnings.
+    """
+
+    __slots__ = ("_executor", "_calls", "_lock", "_local")
+
+    def __init__(self, executor: Executor | None = None) -> None:
+        """
+        Instantiate the background calls.
+
+        Args:
+            executor: executor to run the calls in, defaults to the shared thread pool
+        """
+        self._executor = executor
+        self._calls: dict[str, object] = {}
+        self._lock = Lock()
+        self._local = local()
+
+    def start(self, key: str, call: Callable[[], object]) -> None:
+        """Submit the call for the key, unless the key already has a call pending or running."""
+        with self._lock:
+            if key in self._calls:
+                return
+            token = self._calls[key] = object()
+        try:
+            future = (self._executor or get_default_executor()).submit(self._run, key, token, call)
+        except BaseException:
+            self._discard(key, token)
+            raise
+        future.add_done_callback(partial(_log_exception, key))
+
+    def forget(self, key: str) -> None:
+        """Let the next call for the key start, even though the current one is still running."""
+        with self._lock:
+            self._calls.pop(key, None)
+
+    def is_current(self, key: str) -> bool:
+        """Check whether the running thread is making the call for the key, which has not been forgotten."""
+        token = getattr(self._local, "token", None)
+        with self._lock:
+            return token is not None and self._calls.get(key) is token
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def _run(self, key: str, token: object, call: Callable[[], object]) -> None:
+        self._local.token = token
+        try:
+            call()
+        finally:
+            self._local.token = None
+            self._discard(key, token)
+
+    def _discard(self, key: str, token: object) -> None:
+        with self._lock:
+            if self._calls.get(key) is token:
+                del self._calls[key]
+
+
+def _log_exception(key: str, future: Future[None]) -> None:
+    if not future.cancelled() and (exception := future.exception()) is not None:
+        logger.warning("Background call for `%s` has failed", key, exc_info=exception)
@@ -1,11 +1,12 @@
 from asyncio import sleep
 from collections.abc import AsyncIterable
 from datetime import timedelta
+from pathlib import Path
 from typing import cast
 
 import pytest
 
-from cachetory.backends.async_ import DjangoBackend, MemoryBackend, RedisBackend
+from cachetory.backends.async_ import DiskBackend, DjangoBackend, MemoryBackend, RedisBackend, SharedMemoryBackend
 from cachetory.backends.sync import from_url
 from cachetory.interfaces.backends.async_ import AsyncBackend
 from cachetory.private.datetime import make_deadline
@@ -39,7 +40,19 @@ async def redis_backend(request: pytest.FixtureRequest) -> AsyncIterable[RedisBa
             await backend.clear()
 
 
-@pytest.fixture(params=["memory_backend", "django_backend", "redis_backend"])
+@pytest.fixture
+async def shm_backend(tmp_path: Path) -> AsyncIterable[SharedMemoryBackend]:
+    async with SharedMemoryBackend(str(tmp_path / "shm"), slots=64, slot_size=256) as backend:
+        yield backend
+
+
+@pytest.fixture
+async def disk_backend(tmp_path: Path) -> AsyncIterable[DiskBackend]:
+    async with DiskBackend(tmp_path) as backend:
+        yield backend
+
+
+@pytest.fixture(params=["memory_backend", "django_backend", "redis_backend", "shm_backend", "disk_backend"])
 def backend(request: pytest.FixtureRequest) -> AsyncBackend[bytes]:
     return cast(AsyncBackend[bytes], request.getfixturevalue(request.param))
 
@@ -99,6 +112,19 @@ async def test_set_get_many(backend: AsyncBackend[bytes]) -> None:
     ]
 
 
+async def test_set_many_with_ttl(backend: AsyncBackend[bytes]) -> None:
+    assert await backend.set_many([("foo", b"1"), ("bar", b"2")], time_to_live=timedelta(seconds=0.1)) == [True, True]
+    assert len([entry async for entry in backend.get_many("foo", "bar")]) == 2
+    await sleep(0.2)
+    assert [entry async for entry in backend.get_many("foo", "bar")] == []
+
+
+async def test_set_many_if_not_exists(backend: AsyncBackend[bytes]) -> None:
+    await backend.set("foo", b"1")
+    assert await backend.set_many([("foo", b"2"), ("bar", b"3")], if_not_exists=True) == [False, True]
+    assert [entry async for entry in backend.get_many("foo", "bar")] == [("foo", b"1"), ("bar", b"3")]
+
+
 async def test_set_with_ttl(backend: AsyncBackend[bytes]) -> None:
     await backend.set("foo", b"bar", time_to_live=timedelta(seconds=0.1))
     assert await backend.get("foo") == b"bar"
@@ -132,6 +158,21 @@ async def test_clear(backend: AsyncBackend[bytes]) -> None:
         await backend.get("foo")
 
 
+async def test_clear_prefix(backend: AsyncBackend[bytes]) -> None:
+    if isinstance(backend, DjangoBackend):
+        with pytest.raises(NotImplementedError):
+            await backend.clear_prefix("foo:")
+        return
+    await backend.set_many([("foo:1", b"1"), ("foo:2", b"2"), ("foo*bar", b"3"), ("bar:1", b"4")])
+    await backend.clear_prefix("foo:")
+    assert [item async for item in backend.get_many("foo:1", "foo:2", "foo*bar", "bar:1")] == [
+        ("foo*bar", b"3"),
+        ("bar:1", b"4"),
+    ]
+    await backend.clear_prefix("foo*")
+    assert [item async for item in backend.get_many("foo*bar", "bar:1")] == [("bar:1", b"4")]
+
+
 async def test_get_empty_value(backend: AsyncBackend[bytes]) -> None:
     await backend.set("foo", b"")
     assert await backend.get("foo") == b""
@@ -0,0 +1,68 @@
+import os
+from datetime import timedelta
+from pathlib import Path
+from time import sleep
+
+import pytest
+
+from cachetory.backends import async_ as async_backends
+from cachetory.backends import sync as sync_backends
+from cachetory.backends.sync import DiskBackend
+
+
+def test_large_value_is_memory_mapped(tmp_path: Path) -> None:
+    backend = DiskBackend(tmp_path, mmap_threshold=4)
+    backend.set("small", b"123")
+    backend.set("large", b"1234")
+    assert isinstance(backend.get("small"), bytes)
+    value = backend.get("large")
+    assert isinstance(value, bytes), "the mapped value must be copied out"
+    assert value == b"1234"
+
+
+def test_max_bytes_evicts_least_recently_used(tmp_path: Path) -> None:
+    backend = DiskBackend(tmp_path, max_bytes=300)
+    backend.set("foo", bytes(100))
+    backend.set("bar", bytes(100))
+    foo_path = next(path for _, _, path in backend._scan() if path.read_bytes().endswith(b"foo" + bytes(100)))
+    os.utime(foo_path, (0, 0))  # `foo` is now the least recently used
+    backend.set("qux", bytes(100))
+
+    assert dict(backend.get_many("foo", "bar", "qux")).keys() == {"bar", "qux"}
+
+
+def test_delete_expired(tmp_path: Path) -> None:
+    backend = DiskBackend(tmp_path)
+    backend.set("foo", b"1", time_to_live=timedelta(seconds=0.01))
+    backend.set("bar", b"2")
+    sleep(0.02)
+    assert backend.delete_expired() == 1
+    assert dict(backend.get_many("foo", "bar")) == {"bar": b"2"}
+
+
+def test_set_if_not_exists_overwrites_expired_entry(tmp_path: Path) -> None:
+    backend = DiskBackend(tmp_path)
+    backend.set("foo", b"1", time_to_live=timedelta(seconds=0.01))
+    sleep(0.02)
+    assert backend.set("foo", b"2", if_not_exists=True)
+    assert not backend.set("foo", b"3", if_not_exists=True)
+    assert backend.get("foo") == b"2"
+
+
+def test_from_url(tmp_path: Path) -> None:
+    backend = sync_backends.from_url(f"disk://{tmp_path}?max-bytes=1000&mmap-threshold=0")
+    assert isinstance(backend, DiskBackend)
+    backend.set("foo", b"bar")
+    assert backend.get("foo") == b"bar"
+
+
+def test_persists_between_instances(tmp_path: Path) -> None:
+    DiskBackend(tmp_path).set("foo", b"bar")
+    assert DiskBackend(tmp_path).get("foo") == b"bar"
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 100])
+async def test_async_get_many_in_batches(tmp_path: Path, batch_size: int) -> None:
+    backend = async_backends.DiskBackend(tmp_path, batch_size=batch_size)
+    await backend.set_many([("foo", b"1"), ("bar", b"2"), ("qux", b"3")])
+    assert [item async for item in backend.get_many("foo", "missing", "qux")] == [("foo", b"1"), ("qux", b"3")]
@@ -0,0 +1,316 @@
+from datetime import timedelta
+from math import inf
+from pathlib import Path
+from threading import Thread
+from time import monotonic, sleep
+
+import pytest
+
+from cachetory.backends import async_ as async_backends
+from cachetory.backends import sync as sync_backends
+
+
+def test_max_entries_evicts_least_recently_used() -> None:
+    backend = sync_backends.MemoryBackend[int](max_entries=2)
+    backend.set("foo", 1)
+    backend.set("bar", 2)
+    assert backend.get("foo") == 1  # `bar` is now the least recently used
+    backend.set("qux", 3)
+
+    assert backend.size == 2
+    assert backend.get("foo") == 1
+    assert backend.get("qux") == 3
+    with pytest.raises(KeyError):
+        backend.get("bar")
+
+
+def test_max_entries_overwrite_refreshes_entry() -> None:
+    backend = sync_backends.MemoryBackend[int](max_entries=2)
+    backend.set("foo", 1)
+    backend.set("bar", 2)
+    backend.set("foo", 3)
+    backend.set("qux", 4)
+
+    assert dict(backend.get_many("foo", "bar", "qux")) == {"foo": 3, "qux": 4}
+
+
+def test_max_entries_from_url() -> None:
+    backend = sync_backends.from_url("memory://?max-entries=1")
+    backend.set("foo", 1)
+    backend.set("bar", 2)
+    assert backend.size == 1  # type: ignore[attr-defined]
+
+
+def test_invalid_max_entries_from_url() -> None:
+    with pytest.raises(ValueError):
+        sync_backends.from_url("memory://?max-entries=0")
+
+
+async def test_async_max_entries_from_url() -> None:
+    backend = async_backends.from_url("memory://?max-entries=1")
+    await backend.set("foo", 1)
+    await backend.set("bar", 2)
+    assert backend.size == 1  # type: ignore[attr-defined]
+    assert await backend.get("bar") == 2
+
+
+def test_max_bytes_evicts_least_recently_used() -> None:
+    backend = sync_backends.MemoryBackend[bytes](max_bytes=10)
+    backend.set("foo", b"12345")
+    backend.set("bar", b"1234")
+    assert backend.nbytes == 9
+    backend.get("foo")
+    backend.set("qux", b"123")
+
+    assert backend.nbytes == 8
+    assert dict(backend.get_many("foo", "bar", "qux")) == {"foo": b"12345", "qux": b"123"}
+
+
+def test_nbytes_is_maintained() -> None:
+    backend = sync_backends.MemoryBackend[str]()
+    backend.set("foo", "12345")
+    backend.set("foo", "123")
+    backend.set("bar", "1")
+    assert not backend.set("bar", "12", if_not_exists=True)
+    assert backend.nbytes == 4
+
+    backend.delete("foo")
+    assert backend.nbytes == 1
+    backend.clear()
+    assert backend.nbytes == 0
+
+
+def test_custom_weigh() -> None:
+    backend = sync_backends.MemoryBackend[int](max_bytes=2, weigh=lambda _: 1)
+    backend.set_many([("foo", 1), ("bar", 2), ("qux", 3)])
+    assert backend.size == 2
+    assert backend.nbytes == 2
+
+
+def test_max_bytes_refuses_oversized_value() -> None:
+    backend = sync_backends.MemoryBackend[bytes](max_bytes=4)
+    backend.set("foo", b"1")
+    backend.set("bar", b"2")
+    assert not backend.set("foo", b"12345")
+    assert backend.set_many([("bar", b"12345"), ("qux", b"3")]) == [False, True]
+    assert backend.get_many("foo", "bar", "qux") == [("qux", b"3")]
+    assert backend.nbytes == 1
+
+
+def test_max_bytes_from_url() -> None:
+    backend = sync_backends.from_url("memory://?max-bytes=3")
+    backend.set("foo", b"12")
+    backend.set("bar", b"34")
+    assert backend.nbytes == 2  # type: ignore[attr-defined]
+
+
+def test_writes_delete_expired_entries() -> None:
+    backend = sync_backends.MemoryBackend[int](expire_batch_size=2)
+    backend.set_many((str(i), i) for i in range(3))
+    for i in range(3):
+        backend.expire_in(str(i), timedelta(seconds=0.01))
+    sleep(0.02)
+
+    backend.set("foo", 42)
+    assert backend.size == 2, "exactly 2 entries should be deleted by the write"
+    backend.set("bar", 42)
+    assert backend.size == 2
+
+
+def test_delete_expired() -> None:
+    backend = sync_backends.MemoryBackend[int](expire_batch_size=0)
+    backend.set("foo", 1, time_to_live=timedelta(seconds=0.01))
+    backend.set("bar", 2, time_to_live=timedelta(seconds=0.01))
+    backend.set("bar", 3)  # overwritten with an eternal entry
+    backend.set("qux", 4, time_to_live=timedelta(hours=1))
+    sleep(0.02)
+    assert backend.size == 3
+
+    assert backend.delete_expired() == 1
+    assert dict(backend.get_many("foo", "bar", "qux")) == {"bar": 3, "qux": 4}
+
+
+def test_deadline_heap_is_compacted() -> None:
+    backend = sync_backends.MemoryBackend[int]()
+    for i in range(1000):
+        backend.set("foo", i, time_to_live=timedelta(hours=1))
+    assert len(backend._deadlines) < 100
+
+
+def test_set_if_not_exists_overwrites_expired_entry() -> None:
+    backend = sync_backends.MemoryBackend[int]()
+    backend.set("foo", 1, time_to_live=timedelta(seconds=0.01))
+    sleep(0.02)
+    assert backend.set("foo", 2, if_not_exists=True)
+    assert backend.get("foo") == 2
+
+
+def test_sharded_limits_are_split() -> None:
+    backend = sync_backends.ShardedMemoryBackend[int](shards=4, max_entries=8)
+    backend.set_many((str(i), i) for i in range(1000))
+    assert backend.size <= 8
+    backend.delete_many(*(str(i) for i in range(1000)))
+    assert backend.size == 0
+
+
+@pytest.mark.parametrize("shards", [1, 3, 4, 7])
+def test_sharded_limits_sum_up_to_total(shards: int) -> None:
+    backend = sync_backends.ShardedMemoryBackend[bytes](shards=shards, max_entries=10, max_bytes=30)
+    assert sum(shard._max_entries for shard in backend._shards) == 10  # type: ignore[misc]
+    assert sum(shard._max_bytes for shard in backend._shards) == 30  # type: ignore[misc]
+
+
+def test_sharded_limit_less_than_shards() -> None:
+    with pytest.raises(ValueError, match="max_entries"):
+        sync_backends.ShardedMemoryBackend[int](shards=4, max_entries=3)
+
+
+def test_sharded_from_url() -> None:
+    backend = sync_backends.from_url("memory://?shards=2&max-bytes=8")
+    assert isinstance(backend, sync_backends.ShardedMemoryBackend)
+    backend.set("foo", b"123")
+    assert backend.nbytes == 3
+
+
+def test_sharded_set_if_not_exists_from_threads() -> None:
+    backend = sync_backends.ShardedMemoryBackend[int](shards=4)
+    n_keys = 100
+    winners: list[int] = []
+
+    def run(thread_id: int) -> None:
+        for i in range(n_keys):
+            if backend.set(str(i), thread_id, if_not_exists=True):
+                winners.append(thread_id)
+
+    threads = [Thread(target=run, args=(thread_id,)) for thread_id in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(winners) == n_keys, "exactly one thread must win each key"
+    assert backend.size == n_keys
+
+
+async def test_async_batches() -> None:
+    backend = async_backends.MemoryBackend[int](max_entries=2)
+    await backend.set_many([("foo", 1), ("bar", 2), ("qux", 3)])
+    await backend.expire_in("bar", timedelta(seconds=0.01))
+    sleep(0.02)
+    assert [item async for item in backend.get_many("foo", "bar", "qux")] == [("qux", 3)]
+    assert backend.size == 1
+
+
+def test_tinylfu_protects_frequent_entries_from_scan() -> None:
+    backend = sync_backends.MemoryBackend[int](max_entries=10, policy="tinylfu")
+    hot_keys = [f"hot:{i}" for i in range(5)]
+    backend.set_many((key, 1) for key in hot_keys)
+    for _ in range(3):
+        for key in hot_keys:
+            backend.get(key)
+
+    # The scan stays within one sketch sample (`10 * max_entries` increments), so that the estimates do not age out.
+    for i in range(50):
+        backend.set(f"scan:{i}", 0)
+
+    assert backend.size <= 10
+    assert len(list(backend.get_many(*hot_keys))) == len(hot_keys)
+
+
+def test_tinylfu_requires_max_entries() -> None:
+    with pytest.raises(ValueError):
+        sync_backends.MemoryBackend[int](policy="tinylfu")
+
+
+def test_tinylfu_single_entry() -> None:
+    backend = sync_backends.MemoryBackend[int](max_entries=1, policy="tinylfu")
+    backend.set("foo", 1)
+    backend.set("bar", 2)
+    assert backend.size == 1
+
+
+def test_tinylfu_from_url() -> None:
+    backend = sync_backends.from_url("memory://?max-entries=100&policy=tinylfu")
+    assert backend._sketch is not None  # type: ignore[attr-defined]
+
+
+def test_snapshot_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "snapshot"
+    backend = sync_backends.MemoryBackend[object]()
+    backend.set("bytes", b"1")
+    backend.set("object", {"foo": 42}, time_to_live=timedelta(hours=1))
+    backend.set("expired", b"3", time_to_live=timedelta(seconds=0.01))
+    sleep(0.02)
+    assert backend.dump(path) == 2
+
+    restored = sync_backends.MemoryBackend[object]()
+    assert restored.load(path) == 2
+    assert dict(restored.get_many("bytes", "object", "expired")) == {"bytes": b"1", "object": {"foo": 42}}
+    assert restored._entries["bytes"].deadline == inf
+    assert restored._entries["object"].deadline < monotonic() + 3600
+
+
+def test_snapshot_load_skips_expired_since_dump(tmp_path: Path) -> None:
+    path = tmp_path / "snapshot"
+    backend = sync_backends.MemoryBackend[bytes]()
+    backend.set("foo", b"1", time_to_live=timedelta(seconds=0.05))
+    backend.dump(path)
+    sleep(0.06)
+    assert sync_backends.MemoryBackend[bytes]().load(path) == 0
+
+
+def test_snapshot_load_respects_limits(tmp_path: Path) -> None:
+    path = tmp_path / "snapshot"
+    backend = sync_backends.MemoryBackend[int]()
+    backend.set_many((str(i), i) for i in range(10))
+    backend.dump(path)
+
+    bounded = sync_backends.MemoryBackend[int](max_entries=3)
+    bounded.load(path)
+    assert dict(bounded.get_many(*(str(i) for i in range(10)))) == {"7": 7, "8": 8, "9": 9}
+
+
+def test_snapshot_load_skips_oversized_values(tmp_path: Path) -> None:
+    path = tmp_path / "snapshot"
+    backend = sync_backends.MemoryBackend[bytes]()
+    backend.set_many([("foo", b"1"), ("bar", b"12345"), ("qux", b"2")])
+    backend.dump(path)
+
+    bounded = sync_backends.MemoryBackend[bytes](max_bytes=4)
+    assert bounded.load(path) == 2
+    assert dict(bounded.get_many("foo", "bar", "qux")) == {"foo": b"1", "qux": b"2"}
+
+    sharded = sync_backends.ShardedMemoryBackend[bytes](shards=1, max_bytes=4)
+    assert sharded.load(path) == 2
+
+
+def test_snapshot_invalid_file(tmp_path: Path) -> None:
+    path = tmp_path / "snapshot"
+    path.write_bytes(b"garbage")
+    with pytest.raises(ValueError):
+        sync_backends.MemoryBackend[bytes]().load(path)
+
+
+def test_snapshot_from_url(tmp_path: Path) -> None:
+    url = f"memory://?snapshot={tmp_path / 'snapshot'}"
+    with sync_backends.from_url(url) as backend:
+        backend.set("foo", b"bar")
+    with sync_backends.from_url(url) as backend:
+        assert backend.get("foo") == b"bar"
+
+
+def test_sharded_snapshot(tmp_path: Path) -> None:
+    url = f"memory://?shards=4&snapshot={tmp_path / 'snapshot'}"
+    with sync_backends.from_url(url) as backend:
+        backend.set_many((str(i), i) for i in range(100))
+    with sync_backends.from_url(url) as backend:
+        assert isinstance(backend, sync_backends.ShardedMemoryBackend)
+        assert backend.size == 100
+
+
+async def test_async_snapshot_from_url(tmp_path: Path) -> None:
+    url = f"memory://?snapshot={tmp_path / 'snapshot'}"
+    async with async_backends.from_url(url) as backend:
+        await backend.set("foo", b"bar")
+    async with async_backends.from_url(url) as backend:
+        assert await backend.get("foo") == b"bar"
@@ -0,0 +1,551 @@
+import asyncio
+from collections.abc import Callable, Iterable
+from datetime import timedelta
+from threading import Thread
+from time import monotonic, sleep
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from redis import Connection, Redis, RedisError, ResponseError
+from redis.asyncio import Redis as AsyncRedis
+from redis.connection import Encoder
+
+from cachetory.backends import async_ as async_backends
+from cachetory.backends import sync as sync_backends
+from cachetory.backends.async_ import redis as async_redis
+from cachetory.backends.sync import redis as sync_redis
+from tests.support import if_redis_enabled
+
+_URL = "redis://localhost:6379"
+
+
+@pytest.fixture
+def client() -> Iterable[Redis]:
+    with Redis.from_url(_URL) as client:
+        client.flushdb()
+        yield client
+        client.flushdb()
+
+
+@pytest.fixture
+def other_client() -> Iterable[Redis]:
+    with Redis.from_url(_URL) as client:
+        try:
+            client.execute_command("CLIENT", "TRACKING", "OFF")
+        except ResponseError:
+            pytest.skip("the server does not support client-side caching")
+        client.flushdb()
+        yield client
+        client.flushdb()
+
+
+@if_redis_enabled
+def test_near_cache(other_client: Redis) -> None:
+    other_client.set("foo", b"1")
+    with sync_backends.RedisBackend.from_url(f"{_URL}?near-cache-size=10") as backend:
+        _wait_until(lambda: backend.get("foo") == b"1" and len(backend._near_cache) == 1)
+
+        other_client.set("foo", b"2")
+        _wait_until(lambda: backend.get("foo") == b"2")
+
+
+@if_redis_enabled
+def test_near_cache_broadcast(other_client: Redis) -> None:
+    with sync_backends.RedisBackend.from_url(f"{_URL}?near-cache-size=10&near-cache-prefixes=foo:") as backend:
+        other_client.set("foo:1", b"1")
+        _wait_until(lambda: backend.get("foo:1") == b"1" and len(backend._near_cache) == 1)
+
+        other_client.delete("foo:1")
+        _wait_until(lambda: dict(backend.get_many("foo:1")) == {})
+
+
+@if_redis_enabled
+def test_near_cache_resubscribe(other_client: Redis) -> None:
+    other_client.set("foo", b"1")
+    with sync_backends.RedisBackend.from_url(f"{_URL}?near-cache-size=10") as backend:
+        _wait_until(lambda: backend.get("foo") == b"1" and len(backend._near_cache) == 1)
+        client_id = backend._listener._client_id
+        pool = backend._client.connection_pool
+        connection = pool.get_connection()
+        try:
+            # Break the listener connection, so that the listener re-subscribes:
+            backend._listener._pubsub.connection.disconnect()
+            _wait_until(lambda: backend._listener._client_id not in (None, client_id))
+
+            # The connection is still usable by its holder:
+            connection.send_command("PING")
+            assert connection.read_response() in (b"PONG", "PONG", True)
+        finally:
+            pool.release(connection)
+
+        other_client.set("foo", b"2")
+        _wait_until(lambda: backend.get("foo") == b"2" and len(backend._near_cache) == 1)
+        other_client.set("foo", b"3")
+        _wait_until(lambda: backend.get("foo") == b"3")
+
+
+def test_near_cache_only_fills_through_tracked_connections() -> None:
+    connection = _StubConnection()  # established before the backend, thus without the connect hook
+    with patch.object(sync_redis._InvalidationListener, "_run"):
+        client = Redis(connection_pool=_StubPool(connection))  # type: ignore[arg-type]
+        backend = sync_backends.RedisBackend(client, near_cache_size=10)
+    with backend:
+        listener, near_cache = backend._listener, backend._near_cache
+        assert listener is not None
+        assert near_cache is not None
+        near_cache.enable()
+        assert backend.get("foo") == b"1"
+        assert len(near_cache) == 0, "the listener has not subscribed yet"
+
+        listener._client_id = 1  # as if subscribed
+        assert backend.get("foo") == b"1"
+        assert len(near_cache) == 1
+        assert connection.commands == [("GET", "foo"), ("CLIENT", "TRACKING", "ON", "REDIRECT", 1), ("GET", "foo")]
+
+        # Re-subscribed on another listener connection:
+        near_cache.clear()
+        listener._client_id = 2
+        connection.commands.clear()
+        assert dict(backend.get_many("foo")) == {"foo": b"1"}
+        assert dict(backend.get_many("foo")) == {"foo": b"1"}
+        assert connection.commands == [("CLIENT", "TRACKING", "ON", "REDIRECT", 2), ("MGET", "foo")]
+
+        # The listener connection is lost before the data connection redirects to it:
+        near_cache.clear()
+        listener._client_id = 3
+        connection.is_tracking_refused = True
+        assert backend.get("foo") == b"1"
+        assert len(near_cache) == 0
+
+
+async def test_async_near_cache_only_fills_through_tracked_connections() -> None:
+    connection = _AsyncStubConnection()
+    with patch.object(async_redis._InvalidationListener, "_run", new=_idle):
+        async with async_backends.RedisBackend(
+            AsyncRedis(connection_pool=_AsyncStubPool(connection)),  # type: ignore[arg-type]
+            near_cache_size=10,
+            get_batch_size=10,
+        ) as backend:
+            listener, near_cache = backend._listener, backend._near_cache
+            assert listener is not None
+            assert near_cache is not None
+            near_cache.enable()
+            assert await backend.get("foo") == b"1"
+            assert len(near_cache) == 0, "the listener has not subscribed yet"
+
+            listener._client_id = 1
+            assert await backend.get("foo") == b"1"
+            assert len(near_cache) == 1
+            assert connection.commands == [
+                ("MGET", "foo"),
+                ("CLIENT", "TRACKING", "ON", "REDIRECT", 1),
+                ("MGET", "foo"),
+            ]
+
+            near_cache.clear()
+            listener._client_id = 2
+            connection.commands.clear()
+            assert [item async for item in backend.get_many("foo")] == [("foo", b"1")]
+            assert connection.commands == [("CLIENT", "TRACKING", "ON", "REDIRECT", 2), ("MGET", "foo")]
+            assert len(near_cache) == 1
+
+
+@if_redis_enabled
+async def test_async_near_cache(other_client: Redis) -> None:
+    other_client.set("foo", b"1")
+    async with async_backends.RedisBackend.from_url(f"{_URL}?near-cache-size=10") as backend:
+        await _async_wait_until(backend, b"1")
+        other_client.set("foo", b"2")
+        await _async_wait_until(backend, b"2")
+
+
+def _wait_until(condition: Callable[[], bool]) -> None:
+    deadline = monotonic() + 5.0
+    while not condition():
+        assert monotonic() < deadline, "timed out"
+        sleep(0.01)
+
+
+async def _async_wait_until(backend: async_backends.RedisBackend, value: bytes) -> None:
+    deadline = monotonic() + 5.0
+    while (await backend.get("foo"), len(backend._near_cache)) != (value, 1):  # type: ignore[arg-type]
+        assert monotonic() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+@if_redis_enabled
+async def test_async_get_batching() -> None:
+    async with async_backends.RedisBackend.from_url(f"{_URL}?get-batch-size=2") as backend:
+        await backend.set_many([("foo", b"1"), ("bar", b"2")])
+        with patch.object(backend._client, "mget", wraps=backend._client.mget) as mget:
+            results = await asyncio.gather(
+                backend.get("foo"),
+                backend.get("foo"),
+                backend.get("bar"),
+                backend.get("missing"),
+                return_exceptions=True,
+            )
+        assert list(results[:3]) == [b"1", b"1", b"2"]
+        assert isinstance(results[3], KeyError)
+        # The duplicate key is fetched once, and the full batch is sent without waiting for the rest.
+        assert [call.args[0] for call in mget.call_args_list] == [["foo", "bar"], ["missing"]]
+        await backend.delete_many("foo", "bar")
+
+
+@if_redis_enabled
+async def test_async_get_batching_window() -> None:
+    async with async_backends.RedisBackend(
+        AsyncRedis.from_url(_URL),
+        get_batch_size=100,
+        get_batch_window=timedelta(milliseconds=50),
+    ) as backend:
+        await backend.set("foo", b"1")
+        with patch.object(backend._client, "mget", wraps=backend._client.mget) as mget:
+            first = asyncio.create_task(backend.get("foo"))
+            await asyncio.sleep(0.01)  # still within the window
+            assert list(await asyncio.gather(first, backend.get("foo"))) == [b"1", b"1"]
+        mget.assert_called_once_with(["foo"])
+        await backend.delete("foo")
+
+
+@if_redis_enabled
+def test_chunked_get_many_delete_many() -> None:
+    with sync_backends.RedisBackend.from_url(f"{_URL}?chunk-size=2") as backend:
+        backend.set_many([("foo", b"1"), ("bar", b"2"), ("qux", b"3")])
+        with patch.object(backend._client, "mget", wraps=backend._client.mget) as mget:
+            items = iter(backend.get_many("foo", "missing", "bar", "qux"))
+            assert next(items) == ("foo", b"1")
+            assert list(items) == [("bar", b"2"), ("qux", b"3")]
+        assert mget.call_count == 0, "the chunks must be pipelined on a single connection"
+
+        items = iter(backend.get_many("foo", "missing", "bar", "qux"))
+        assert next(items) == ("foo", b"1")
+        del items  # abandoning the unread replies
+        assert backend.get("bar") == b"2", "the connection with the unread replies must not be reused"
+
+        backend.delete_many("foo", "bar", "qux")
+        assert list(backend.get_many("foo", "bar", "qux")) == []
+
+
+@if_redis_enabled
+async def test_async_chunked_get_many_delete_many() -> None:
+    async with async_backends.RedisBackend.from_url(f"{_URL}?chunk-size=2") as backend:
+        await backend.set_many([("foo", b"1"), ("bar", b"2"), ("qux", b"3")])
+        with patch.object(backend._client, "mget", wraps=backend._client.mget) as mget:
+            items = [item async for item in backend.get_many("foo", "missing", "bar", "qux")]
+        assert items == [("foo", b"1"), ("bar", b"2"), ("qux", b"3")]
+        assert [call.args for call in mget.call_args_list] == [("foo", "missing"), ("bar", "qux")]
+        await backend.delete_many("foo", "bar", "qux")
+        assert [item async for item in backend.get_many("foo", "bar", "qux")] == []
+
+
+@if_redis_enabled
+def test_value_chunking(client: Redis) -> None:
+    with sync_backends.RedisBackend.from_url(f"{_URL}?value-chunk-size=4") as backend:
+        backend.set("foo", b"0123456789", time_to_live=timedelta(seconds=60))
+        chunk_keys = _chunk_keys(client, "foo")
+        assert len(chunk_keys) == 3
+        assert all(0 < client.pttl(chunk_key) <= 60000 for chunk_key in chunk_keys)
+        assert backend.get("foo") == b"0123456789"
+        assert dict(backend.get_many("foo", "missing")) == {"foo": b"0123456789"}
+
+        backend.expire_in("foo", None)
+        assert all(client.pttl(chunk_key) == -1 for chunk_key in chunk_keys)
+
+        assert not backend.set("foo", b"abcdefgh", if_not_exists=True)
+        assert _chunk_keys(client, "foo") == chunk_keys  # the unused chunks are deleted
+
+        backend.set("foo", b"abcdefgh")
+        assert backend.get("foo") == b"abcdefgh"
+        assert not any(client.exists(chunk_key) for chunk_key in chunk_keys)  # the replaced chunks are deleted
+
+        client.delete(_chunk_keys(client, "foo")[0])
+        with pytest.raises(KeyError):
+            backend.get("foo")  # missing chunk makes a miss, but never a torn value
+
+        backend.set_many([("foo", b"0123456789"), ("bar", b"1")])
+        assert dict(backend.get_many("foo", "bar")) == {"foo": b"0123456789", "bar": b"1"}
+        backend.delete_many("foo", "bar")
+        assert client.keys("foo*") == []
+
+
+@if_redis_enabled
+async def test_async_value_chunking(client: Redis) -> None:
+    async with async_backends.RedisBackend.from_url(f"{_URL}?value-chunk-size=4") as backend:
+        await backend.set("foo", b"0123456789")
+        chunk_keys = _chunk_keys(client, "foo")
+        assert len(chunk_keys) == 3
+        assert await backend.get("foo") == b"0123456789"
+        assert [item async for item in backend.get_many("foo", "missing")] == [("foo", b"0123456789")]
+
+        await backend.expire_in("foo", timedelta(seconds=60))
+        assert all(0 < client.pttl(chunk_key) <= 60000 for chunk_key in chunk_keys)
+
+        await backend.set("foo", b"1")
+        assert await backend.get("foo") == b"1"
+        assert not any(client.exists(chunk_key) for chunk_key in chunk_keys)
+
+        await backend.set("foo", b"0123456789")
+        assert await backend.delete("foo")
+        assert client.keys("foo*") == []
+
+
+@if_redis_enabled
+def test_lease(client: Redis) -> None:
+    with sync_backends.RedisBackend.from_url(_URL) as backend:
+        value, token = backend.get_or_lease("foo", timedelta(seconds=60))
+        assert value is None
+        assert token is not None
+        assert backend.get_or_lease("foo", timedelta(seconds=60)) == (None, None)  # someone else holds the lease
+
+        assert not backend.fill("foo", b"42", "wrong-token")
+        assert backend.fill("foo", b"42", token, time_to_live=timedelta(seconds=60))
+        assert 0 < client.pttl("foo") <= 60000
+        assert backend.get_or_lease("foo", timedelta(seconds=60)) == (b"42", None)
+        assert not backend.fill("foo", b"43", token)  # the lease is gone with the fill
+
+        _, token = backend.get_or_lease("bar", timedelta(seconds=60))
+        assert token is not None
+        backend.release("bar", "wrong-token")
+        assert backend.get_or_lease("bar", timedelta(seconds=60)) == (None, None)
+        backend.release("bar", token)
+        assert backend.get_or_lease("bar", timedelta(seconds=60))[1] is not None
+
+
+@if_redis_enabled
+def test_lease_wait_for_fill(client: Redis) -> None:
+    with sync_backends.RedisBackend.from_url(_URL) as backend:
+        _, token = backend.get_or_lease("foo", timedelta(seconds=60))
+        assert token is not None
+        with pytest.raises(KeyError):
+            backend.wait_for_fill("foo", timedelta(milliseconds=10))
+
+        def fill() -> None:
+            sleep(0.1)
+            backend.fill("foo", b"42", token)
+
+        filler = Thread(target=fill)
+        filler.start()
+        try:
+            started_at = monotonic()
+            assert backend.wait_for_fill("foo", timedelta(seconds=10)) == b"42"
+            assert monotonic() - started_at < 5.0  # woken up by the notification
+        finally:
+            filler.join()
+
+
+@if_redis_enabled
+def test_lease_wait_for_release(client: Redis) -> None:
+    with sync_backends.RedisBackend.from_url(_URL) as backend:
+        _, token = backend.get_or_lease("foo", timedelta(seconds=60))
+        assert token is not None
+
+        def release() -> None:
+            sleep(0.1)
+            backend.release("foo", token)
+
+        releaser = Thread(target=release)
+        releaser.start()
+        try:
+            started_at = monotonic()
+            with pytest.raises(KeyError):
+                backend.wait_for_fill("foo", timedelta(seconds=10))
+            assert monotonic() - started_at < 5.0, "the waiter must be woken up by the release"
+        finally:
+            releaser.join()
+        assert backend.get_or_lease("foo", timedelta(seconds=60))[1] is not None
+
+
+@if_redis_enabled
+def test_lease_evicted_chunks(client: Redis) -> None:
+    with sync_backends.RedisBackend.from_url(f"{_URL}?value-chunk-size=4") as backend:
+        backend.set("foo", b"0123456789")
+        chunk_keys = _chunk_keys(client, "foo")
+        client.delete(chunk_keys[0])
+        value, token = backend.get_or_lease("foo", timedelta(seconds=60))
+        assert value is None
+        assert token is not None, "the value with the evicted chunks must be treated as missing"
+        assert _chunk_keys(client, "foo") == [], "the rest of the chunks must be deleted"
+
+
+@if_redis_enabled
+def test_lease_value_chunking(client: Redis) -> None:
+    with sync_backends.RedisBackend.from_url(f"{_URL}?value-chunk-size=4") as backend:
+        backend.set("foo", b"0123456789")
+        old_chunk_keys = _chunk_keys(client, "foo")
+        backend.delete("foo")
+        _, token = backend.get_or_lease("foo", timedelta(seconds=60))
+        assert token is not None
+        assert not backend.fill("foo", b"abcdefgh", "wrong-token")
+        assert _chunk_keys(client, "foo") == []  # the chunks of the failed fill are deleted
+        assert backend.fill("foo", b"abcdefgh", token)
+        assert backend.get_or_lease("foo", timedelta(seconds=60)) == (b"abcdefgh", None)
+        assert not any(client.exists(chunk_key) for chunk_key in old_chunk_keys)
+
+
+@if_redis_enabled
+async def test_async_lease(client: Redis) -> None:
+    async with async_backends.RedisBackend.from_url(f"{_URL}?value-chunk-size=4") as backend:
+        value, token = await backend.get_or_lease("foo", timedelta(seconds=60))
+        assert value is None
+        assert token is not None
+        assert await backend.get_or_lease("foo", timedelta(seconds=60)) == (None, None)
+
+        waiter = asyncio.ensure_future(backend.wait_for_fill("foo", timedelta(seconds=10)))
+        await asyncio.sleep(0.1)
+        assert not waiter.done()
+        assert not await backend.fill("foo", b"0123456789", "wrong-token")
+        assert await backend.fill("foo", b"0123456789", token)
+        assert await asyncio.wait_for(waiter, 5.0) == b"0123456789"
+        assert await backend.get_or_lease("foo", timedelta(seconds=60)) == (b"0123456789", None)
+
+        _, token = await backend.get_or_lease("bar", timedelta(seconds=60))
+        assert token is not None
+        waiter = asyncio.ensure_future(backend.wait_for_fill("bar", timedelta(seconds=10)))
+        await asyncio.sleep(0.1)
+        await backend.release("bar", token)
+        with pytest.raises(KeyError):
+            await asyncio.wait_for(waiter, 5.0)  # woken up by the release
+
+        await backend.set("baz", b"0123456789")
+        client.delete(_chunk_keys(client, "baz")[0])
+        assert (await backend.get_or_lease("baz", timedelta(seconds=60)))[1] is not None
+
+
+@if_redis_enabled
+def test_pool_stats(client: Redis) -> None:
+    with sync_backends.RedisBackend.from_url(f"{_URL}?blocking-pool=true&pool-size=1&pool-timeout=0.01") as backend:
+        backend.set("foo", b"42")
+        stats = backend.pool_stats()
+        assert stats is not None
+        assert (stats.max_connections, stats.n_in_use, stats.n_idle, stats.n_acquired) == (1, 0, 1, 1)
+
+        pubsub = backend._client.pubsub()
+        pubsub.subscribe("foo")  # takes the only connection
+        try:
+            with pytest.raises(RedisError):
+                backend.get("foo")
+            stats = backend.pool_stats()
+            assert stats is not None
+            assert (stats.n_in_use, stats.n_failed) == (1, 1)
+            assert stats.max_wait_time >= timedelta(seconds=0.01)
+        finally:
+            pubsub.close()
+        assert backend.get("foo") == b"42"
+
+    with sync_backends.RedisBackend(Redis.from_url(_URL)) as backend:
+        assert backend.pool_stats() is None
+
+
+@if_redis_enabled
+async def test_async_pool_stats(client: Redis) -> None:
+    async with async_backends.RedisBackend.from_url(f"{_URL}?pool-size=2&socket-timeout=5") as backend:
+        await asyncio.gather(backend.set("foo", b"42"), backend.set("bar", b"43"))
+        stats = backend.pool_stats()
+        assert stats is not None
+        assert (stats.max_connections, stats.n_in_use, stats.n_idle, stats.n_acquired) == (2, 0, 2, 2)
+
+
+@pytest.mark.parametrize("backends", [sync_backends, async_backends])
+def test_from_url_pool_timeout_requires_blocking_pool(backends: Any) -> None:
+    with pytest.raises(ValueError, match="blocking-pool"):
+        backends.from_url(f"{_URL}?pool-timeout=0.5")
+
+
+def _chunk_keys(client: Redis, key: str) -> list[bytes | str]:
+    return sorted(client.keys(f"{key}:chunk:*"), key=str)
+
+
+class _StubConnection:
+    """Records the commands, replies to them in order, and calls the connect hook like redis-py does."""
+
+    def __init__(self, redis_connect_func: Callable[[Any], Any] | None = None) -> None:
+        self.redis_connect_func = redis_connect_func
+        self.commands: list[tuple[Any, ...]] = []
+        self.is_tracking_refused = False
+        self._unanswered: list[tuple[Any, ...]] = []
+
+    def connect(self) -> None:
+        if self.redis_connect_func is not None:
+            self.redis_connect_func(self)
+
+    def on_connect(self) -> None:
+        pass
+
+    def disconnect(self) -> None:
+        self._unanswered.clear()
+
+    def send_command(self, *args: Any) -> None:
+        self.commands.append(args)
+        self._unanswered.append(args)
+
+    def pack_commands(self, commands: Iterable[tuple[Any, ...]]) -> list[tuple[Any, ...]]:
+        return list(commands)
+
+    def send_packed_command(self, commands: list[tuple[Any, ...]]) -> None:
+        for command in commands:
+            self.send_command(*command)
+
+    def read_response(self) -> Any:
+        command = self._unanswered.pop(0)
+        if command[0] == "CLIENT":
+            if self.is_tracking_refused:
+                raise ResponseError("the client ID you want redirect to does not exist")
+            return b"OK"
+        return b"1" if command[0] == "GET" else [b"1"] * (len(command) - 1)
+
+
+class _AsyncStubConnection(_StubConnection):
+    async def connect(self) -> None:  # type: ignore[override]
+        if self.redis_connect_func is not None:
+            await self.redis_connect_func(self)
+
+    async def on_connect(self) -> None:  # type: ignore[override]
+        pass
+
+    async def disconnect(self) -> None:  # type: ignore[override]
+        pass
+
+    async def send_command(self, *args: Any) -> None:  # type: ignore[override]
+        super().send_command(*args)
+
+    async def read_response(self) -> Any:
+        return super().read_response()
+
+
+class _StubPool:
+    """Hands out the single connection."""
+
+    connection_class = Connection
+
+    def __init__(self, connection: _StubConnection) -> None:
+        self.connection_kwargs: dict[str, Any] = {}
+        self._connection = connection
+
+    def get_encoder(self) -> Encoder:
+        return Encoder("utf-8", "strict", decode_responses=False)
+
+    def get_connection(self, *_: Any) -> _StubConnection:
+        return self._connection
+
+    def release(self, _: _StubConnection) -> None:
+        pass
+
+    def disconnect(self, *_: Any, **__: Any) -> None:
+        pass
+
+
+class _AsyncStubPool(_StubPool):
+    async def get_connection(self, *_: Any) -> _StubConnection:  # type: ignore[override]
+        return self._connection
+
+    async def release(self, _: _StubConnection) -> None:  # type: ignore[override]
+        pass
+
+    async def disconnect(self, *_: Any, **__: Any) -> None:  # type: ignore[override]
+        pass
+
+
+async def _idle(_: Any) -> None:
+    await asyncio.Event().wait()
@@ -0,0 +1,64 @@
+from collections.abc import AsyncIterable, Iterable
+from datetime import timedelta
+
+import pytest
+
+from cachetory.backends import async_ as async_backends
+from cachetory.backends import sync as sync_backends
+from tests.support import if_redis_cluster_enabled
+
+_URL = "redis+cluster://localhost:7000"
+
+
+@pytest.fixture
+def sync_backend() -> Iterable[sync_backends.RedisClusterBackend]:
+    with sync_backends.RedisClusterBackend.from_url(_URL) as backend:
+        backend.clear()
+        yield backend
+        backend.clear()
+
+
+@pytest.fixture
+async def async_backend() -> AsyncIterable[async_backends.RedisClusterBackend]:
+    async with async_backends.RedisClusterBackend.from_url(_URL) as backend:
+        await backend.clear()
+        yield backend
+        await backend.clear()
+
+
+@if_redis_cluster_enabled
+def test_from_url() -> None:
+    assert isinstance(sync_backends.from_url(_URL), sync_backends.RedisClusterBackend)
+    assert isinstance(async_backends.from_url(_URL), async_backends.RedisClusterBackend)
+
+
+@if_redis_cluster_enabled
+def test_cross_slot(sync_backend: sync_backends.RedisClusterBackend) -> None:
+    keys = [f"key:{i}" for i in range(100)]
+    assert sync_backend.set_many((key, key.encode()) for key in keys) == [True] * 100
+    assert dict(sync_backend.get_many("missing", *keys)) == {key: key.encode() for key in keys}
+
+    assert sync_backend.set_many([("key:1", b"x"), ("new", b"y")], if_not_exists=True) == [False, True]
+    sync_backend.set_many([("ttl:1", b"1"), ("ttl:2", b"2")], time_to_live=timedelta(seconds=60))
+
+    sync_backend.delete_many(*keys[:50])
+    assert len(list(sync_backend.get_many(*keys))) == 50
+
+    sync_backend.clear_prefix("key:")
+    assert list(sync_backend.get_many(*keys)) == []
+    assert dict(sync_backend.get_many("new", "ttl:1")) == {"new": b"y", "ttl:1": b"1"}
+
+
+@if_redis_cluster_enabled
+async def test_async_cross_slot(async_backend: async_backends.RedisClusterBackend) -> None:
+    keys = [f"key:{i}" for i in range(100)]
+    assert await async_backend.set_many((key, key.encode()) for key in keys) == [True] * 100
+    assert {key: value async for key, value in async_backend.get_many("missing", *keys)} == {
+        key: key.encode() for key in keys
+    }
+
+    await async_backend.delete_many(*keys[:50])
+    assert len([item async for item in async_backend.get_many(*keys)]) == 50
+
+    await async_backend.clear_prefix("key:")
+    assert [item async for item in async_backend.get_many(*keys)] == []
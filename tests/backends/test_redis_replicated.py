@@ -0,0 +1,115 @@
+from collections.abc import AsyncIterable, Iterable
+from datetime import timedelta
+
+import pytest
+from redis import Redis
+
+from cachetory.backends import async_ as async_backends
+from cachetory.backends import sync as sync_backends
+from tests.support import if_redis_enabled
+
+# There is no actual replication in the tests: the databases stand for the primary and the replica.
+_PRIMARY_URL = "redis://localhost:6379/0"
+_REPLICA_URL = "redis://localhost:6379/1"
+_UNAVAILABLE_URL = "redis://localhost:1/0"
+
+
+@pytest.fixture
+def replica_client() -> Iterable[Redis]:
+    with Redis.from_url(_PRIMARY_URL) as primary_client, Redis.from_url(_REPLICA_URL) as client:
+        primary_client.flushdb()
+        client.flushdb()
+        yield client
+        client.flushdb()
+        primary_client.flushdb()
+
+
+@pytest.fixture
+async def async_backend() -> AsyncIterable[async_backends.RedisReplicatedBackend]:
+    async with async_backends.RedisReplicatedBackend(
+        async_backends.RedisBackend.from_url(_PRIMARY_URL),
+        [async_backends.RedisBackend.from_url(_REPLICA_URL)],
+        read_your_writes=timedelta(seconds=60),
+    ) as backend:
+        yield backend
+
+
+@if_redis_enabled
+def test_from_url(replica_client: Redis) -> None:
+    url = "redis+replicas://localhost:6379/0?replicas=localhost:6379&read-your-writes-ms=1000&chunk-size=2"
+    with sync_backends.from_url(url) as backend:
+        assert isinstance(backend, sync_backends.RedisReplicatedBackend)
+        backend.set("foo", b"42")
+        assert backend.get("foo") == b"42"
+    assert isinstance(async_backends.from_url(url), async_backends.RedisReplicatedBackend)
+
+
+@if_redis_enabled
+def test_routing(replica_client: Redis) -> None:
+    with sync_backends.RedisReplicatedBackend(
+        sync_backends.RedisBackend.from_url(_PRIMARY_URL),
+        [sync_backends.RedisBackend.from_url(_REPLICA_URL)],
+    ) as backend:
+        backend.set("foo", b"primary")
+        assert replica_client.get("foo") is None  # writes go to the primary
+        with pytest.raises(KeyError):
+            backend.get("foo")  # reads go to the replica
+
+        replica_client.set("foo", b"replica")
+        assert backend.get("foo") == b"replica"
+        assert dict(backend.get_many("foo", "bar")) == {"foo": b"replica"}
+
+
+@if_redis_enabled
+def test_read_your_writes(replica_client: Redis) -> None:
+    with sync_backends.RedisReplicatedBackend(
+        sync_backends.RedisBackend.from_url(_PRIMARY_URL),
+        [sync_backends.RedisBackend.from_url(_REPLICA_URL)],
+        read_your_writes=timedelta(seconds=60),
+    ) as backend:
+        replica_client.set("foo", b"replica")
+        replica_client.set("bar", b"replica")
+        backend.set("foo", b"primary")
+        assert backend.get("foo") == b"primary"
+        assert dict(backend.get_many("foo", "bar")) == {"foo": b"primary", "bar": b"replica"}
+
+        backend.clear()
+        with pytest.raises(KeyError):
+            backend.get("bar")  # after clearing, all the keys are read from the primary
+
+
+@if_redis_enabled
+def test_failover(replica_client: Redis) -> None:
+    with sync_backends.RedisReplicatedBackend(
+        sync_backends.RedisBackend.from_url(_PRIMARY_URL),
+        [sync_backends.RedisBackend.from_url(_UNAVAILABLE_URL)],
+    ) as backend:
+        backend.set("foo", b"42")
+        assert backend.get("foo") == b"42"
+        assert dict(backend.get_many("foo", "bar")) == {"foo": b"42"}
+
+
+@if_redis_enabled
+async def test_async_routing(replica_client: Redis, async_backend: async_backends.RedisReplicatedBackend) -> None:
+    replica_client.set("foo", b"replica")
+    replica_client.set("bar", b"replica")
+    assert await async_backend.get("foo") == b"replica"
+
+    await async_backend.set("foo", b"primary")
+    assert replica_client.get("foo") == b"replica"
+    assert await async_backend.get("foo") == b"primary"
+    assert {key: value async for key, value in async_backend.get_many("foo", "bar")} == {
+        "foo": b"primary",
+        "bar": b"replica",
+    }
+
+
+@if_redis_enabled
+async def test_async_failover(replica_client: Redis) -> None:
+    async with async_backends.RedisReplicatedBackend(
+        async_backends.RedisBackend.from_url(_PRIMARY_URL),
+        [async_backends.RedisBackend.from_url(_UNAVAILABLE_URL)],
+    ) as backend:
+        await backend.set("foo", b"42")
+        assert await backend.get("foo") == b"42"
+        assert [item async for item in backend.get_many("foo", "bar")] == [("foo", b"42")]
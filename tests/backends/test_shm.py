@@ -0,0 +1,99 @@
+import multiprocessing
+from collections.abc import Iterable
+from datetime import timedelta
+from pathlib import Path
+from threading import Event, Thread
+from time import sleep
+
+import pytest
+
+from cachetory.backends import async_ as async_backends
+from cachetory.backends import sync as sync_backends
+from cachetory.backends.sync import SharedMemoryBackend
+from cachetory.backends.sync.shm import _hash
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> str:
+    return str(tmp_path / "shm")
+
+
+@pytest.fixture
+def backend(path: str) -> Iterable[SharedMemoryBackend]:
+    with SharedMemoryBackend(path, slots=4, slot_size=64, ways=2) as backend:
+        yield backend
+
+
+def _set_in_child(path: str) -> None:
+    with SharedMemoryBackend(path, slots=4, slot_size=64, ways=2) as backend:
+        backend.set("foo", b"from-child")
+
+
+def test_shared_between_processes(path: str, backend: SharedMemoryBackend) -> None:
+    process = multiprocessing.get_context("spawn").Process(target=_set_in_child, args=(path,))
+    process.start()
+    process.join()
+    assert process.exitcode == 0
+    assert backend.get("foo") == b"from-child"
+
+
+def test_evicts_least_recently_used_within_set(backend: SharedMemoryBackend) -> None:
+    keys = [str(i) for i in range(100)]
+    backend.set_many((key, key.encode()) for key in keys)
+    assert len(list(backend.get_many(*keys))) <= 4
+    assert backend.get("99") == b"99", "the last written entry must survive"
+
+
+def test_expired_entry_is_missing(backend: SharedMemoryBackend) -> None:
+    backend.set("foo", b"1", time_to_live=timedelta(seconds=0.01))
+    sleep(0.02)
+    with pytest.raises(KeyError):
+        backend.get("foo")
+    assert backend.set("foo", b"2", if_not_exists=True)
+
+
+def test_value_too_large(backend: SharedMemoryBackend) -> None:
+    backend.set("foo", b"1")
+    assert not backend.set("foo", bytes(64))
+    with pytest.raises(KeyError):
+        backend.get("foo")
+
+
+def test_instances_within_process_exclude_each_other(path: str, backend: SharedMemoryBackend) -> None:
+    with SharedMemoryBackend(path, slots=4, slot_size=64, ways=2) as other:
+        is_set = Event()
+
+        def set_foo() -> None:
+            other.set("foo", b"1")
+            is_set.set()
+
+        thread = Thread(target=set_foo)
+        with backend._lock_set(_hash(b"foo")):
+            thread.start()
+            assert not is_set.wait(0.1), "the other instance must wait for the set lock"
+        thread.join()
+        assert is_set.is_set()
+    assert backend.get("foo") == b"1", "closing the other instance must keep the table open"
+
+
+def test_layout_mismatch(path: str, backend: SharedMemoryBackend) -> None:
+    with pytest.raises(ValueError):
+        SharedMemoryBackend(path, slots=8, slot_size=64, ways=2)
+
+
+def test_from_url() -> None:
+    backend = sync_backends.from_url("shm://cachetory-test?slots=8&slot-size=128&ways=4")
+    assert isinstance(backend, SharedMemoryBackend)
+    with backend:
+        backend.set("foo", b"bar")
+        assert backend.get("foo") == b"bar"
+    backend.unlink()
+
+
+async def test_async_from_url() -> None:
+    backend = async_backends.from_url("shm://cachetory-test-async?slots=8&slot-size=128")
+    assert isinstance(backend, async_backends.SharedMemoryBackend)
+    async with backend:
+        await backend.set("foo", b"bar")
+        assert await backend.get("foo") == b"bar"
+    backend.unlink()
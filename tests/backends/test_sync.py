@@ -1,11 +1,19 @@
 from collections.abc import Iterable
 from datetime import timedelta
+from pathlib import Path
 from time import sleep
 from typing import cast
 
 import pytest
 
-from cachetory.backends.sync import DjangoBackend, MemoryBackend, RedisBackend, from_url
+from cachetory.backends.sync import (
+    DiskBackend,
+    DjangoBackend,
+    MemoryBackend,
+    RedisBackend,
+    SharedMemoryBackend,
+    from_url,
+)
 from cachetory.interfaces.backends.sync import SyncBackend
 from cachetory.private.datetime import make_deadline
 
@@ -38,7 +46,19 @@ def redis_backend(request: pytest.FixtureRequest) -> Iterable[RedisBackend]:
             backend.clear()
 
 
-@pytest.fixture(params=["memory_backend", "django_backend", "redis_backend"])
+@pytest.fixture
+def shm_backend(tmp_path: Path) -> Iterable[SharedMemoryBackend]:
+    with SharedMemoryBackend(str(tmp_path / "shm"), slots=64, slot_size=256) as backend:
+        yield backend
+
+
+@pytest.fixture
+def disk_backend(tmp_path: Path) -> Iterable[DiskBackend]:
+    with DiskBackend(tmp_path) as backend:
+        yield backend
+
+
+@pytest.fixture(params=["memory_backend", "django_backend", "redis_backend", "shm_backend", "disk_backend"])
 def backend(request: pytest.FixtureRequest) -> SyncBackend[bytes]:
     return cast(SyncBackend[bytes], request.getfixturevalue(request.param))
 
@@ -95,6 +115,19 @@ def test_set_get_many(backend: SyncBackend[bytes]) -> None:
     assert list(backend.get_many("non-empty", "missing", "empty")) == [("non-empty", b"foo"), ("empty", b"")]
 
 
+def test_set_many_with_ttl(backend: SyncBackend[bytes]) -> None:
+    assert backend.set_many([("foo", b"1"), ("bar", b"2")], time_to_live=timedelta(seconds=0.1)) == [True, True]
+    assert len(list(backend.get_many("foo", "bar"))) == 2
+    sleep(0.2)
+    assert list(backend.get_many("foo", "bar")) == []
+
+
+def test_set_many_if_not_exists(backend: SyncBackend[bytes]) -> None:
+    backend.set("foo", b"1")
+    assert backend.set_many([("foo", b"2"), ("bar", b"3")], if_not_exists=True) == [False, True]
+    assert list(backend.get_many("foo", "bar")) == [("foo", b"1"), ("bar", b"3")]
+
+
 def test_set_with_ttl(backend: SyncBackend[bytes]) -> None:
     backend.set("foo", b"bar", time_to_live=timedelta(seconds=0.1))
     assert backend.get("foo") == b"bar"
@@ -128,6 +161,18 @@ def test_clear(backend: SyncBackend[bytes]) -> None:
         backend.get("foo")
 
 
+def test_clear_prefix(backend: SyncBackend[bytes]) -> None:
+    if isinstance(backend, DjangoBackend):
+        with pytest.raises(NotImplementedError):
+            backend.clear_prefix("foo:")
+        return
+    backend.set_many([("foo:1", b"1"), ("foo:2", b"2"), ("foo*bar", b"3"), ("bar:1", b"4")])
+    backend.clear_prefix("foo:")
+    assert dict(backend.get_many("foo:1", "foo:2", "foo*bar", "bar:1")) == {"foo*bar": b"3", "bar:1": b"4"}
+    backend.clear_prefix("foo*")
+    assert dict(backend.get_many("foo*bar", "bar:1")) == {"bar:1": b"4"}
+
+
 def test_get_empty_value(backend: SyncBackend[bytes]) -> None:
     backend.set("foo", b"")
     assert backend.get("foo") == b""
@@ -1,4 +1,4 @@
-from pytest import fixture
+from pytest import fixture, warns
 
 from cachetory import serializers
 from cachetory.backends import async_ as async_backends
@@ -28,12 +28,33 @@ async def test_get_many(memory_cache: Cache[int, bytes]) -> None:
     assert await memory_cache.get_many("foo", "bar") == {"foo": 42}
 
 
+async def test_aiter_many(memory_cache: Cache[int, bytes]) -> None:
+    await memory_cache.set_many({"foo": 42, "bar": 43})
+    assert [item async for item in memory_cache.aiter_many("foo", "missing", "bar")] == [("foo", 42), ("bar", 43)]
+
+
+async def test_get_many_prefixed() -> None:
+    cache = Cache[int, bytes](
+        serializer=serializers.from_url("pickle://"),
+        backend=async_backends.from_url("memory://"),
+        prefix="foo:",
+    )
+    await cache.set("bar", 42)
+    assert await cache.get_many("bar", "missing") == {"bar": 42}
+
+
 async def test_set_many(memory_cache: Cache[int, bytes]) -> None:
     await memory_cache.set_many({"foo": 42, "bar": 100500})
     assert await memory_cache.get("foo") == 42
     assert await memory_cache.get("bar") == 100500
 
 
+async def test_set_many_if_not_exists(memory_cache: Cache[int, bytes]) -> None:
+    await memory_cache.set("foo", 42)
+    await memory_cache.set_many({"foo": 43, "bar": 100500}, if_not_exists=True)
+    assert await memory_cache.get_many("foo", "bar") == {"foo": 42, "bar": 100500}
+
+
 async def test_delete(memory_cache: Cache[int, bytes]) -> None:
     await memory_cache.set("foo", 42)
     assert await memory_cache.delete("foo")
@@ -57,6 +78,32 @@ async def test_clear(memory_cache: Cache[int, bytes]) -> None:
     assert await memory_cache.get("bar") is None
 
 
+async def test_clear_prefixed() -> None:
+    backend = async_backends.from_url("memory://")
+    foo_cache = Cache[int, bytes](serializer=serializers.from_url("pickle://"), backend=backend, prefix="foo:")
+    bar_cache = Cache[int, bytes](serializer=serializers.from_url("pickle://"), backend=backend, prefix="bar:")
+    await foo_cache.set("1", 1)
+    await bar_cache.set("1", 2)
+
+    await foo_cache.clear()
+
+    assert await foo_cache.get("1") is None
+    assert await bar_cache.get("1") == 2
+
+
+async def test_clear_prefixed_fallback() -> None:
+    backend = async_backends.from_url("django://default")
+    cache = Cache[int, bytes](serializer=serializers.from_url("pickle://"), backend=backend, prefix="foo:")
+    await cache.set("1", 1)
+    await backend.set("bar:1", b"2")
+
+    with warns(RuntimeWarning):
+        await cache.clear()
+
+    assert await cache.get("1") is None
+    assert [item async for item in backend.get_many("bar:1")] == [], "the entire storage must be cleared"
+
+
 async def test_serialize_executor() -> None:
     cache = Cache[int, bytes](
         serializer=serializers.from_url("pickle://"),
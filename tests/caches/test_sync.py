@@ -1,4 +1,7 @@
-from pytest import fixture, raises
+from datetime import timedelta
+from time import sleep
+
+from pytest import fixture, raises, warns
 
 from cachetory import serializers
 from cachetory.backends import sync as sync_backends
@@ -33,12 +36,33 @@ def test_get_many(memory_cache: Cache[int, bytes]) -> None:
     assert memory_cache.get_many("foo", "bar") == {"foo": 42}
 
 
+def test_iter_many(memory_cache: Cache[int, bytes]) -> None:
+    memory_cache.set_many({"foo": 42, "bar": 43})
+    assert list(memory_cache.iter_many("foo", "missing", "bar")) == [("foo", 42), ("bar", 43)]
+
+
+def test_get_many_prefixed() -> None:
+    cache = Cache[int, bytes](
+        serializer=serializers.from_url("pickle://"),
+        backend=sync_backends.from_url("memory://"),
+        prefix="foo:",
+    )
+    cache.set("bar", 42)
+    assert cache.get_many("bar", "missing") == {"bar": 42}
+
+
 def test_set_many(memory_cache: Cache[int, bytes]) -> None:
     memory_cache.set_many({"foo": 42, "bar": 100500})
     assert memory_cache.get("foo") == 42
     assert memory_cache.get("bar") == 100500
 
 
+def test_set_many_with_ttl(memory_cache: Cache[int, bytes]) -> None:
+    memory_cache.set_many({"foo": 42}, time_to_live=timedelta(seconds=0.01))
+    sleep(0.02)
+    assert memory_cache.get("foo") is None
+
+
 def delete_many(memory_cache: Cache[int, bytes]) -> None:
     memory_cache.set_many({"1": 1, "2": 2, "3": 3})
     memory_cache.delete_many("1", "2")
@@ -62,6 +86,32 @@ def test_clear_cache(memory_cache: Cache[int, bytes]) -> None:
     assert memory_cache.get("bar") is None
 
 
+def test_clear_prefixed_cache() -> None:
+    backend = sync_backends.from_url("memory://")
+    foo_cache = Cache[int, bytes](serializer=serializers.from_url("pickle://"), backend=backend, prefix="foo:")
+    bar_cache = Cache[int, bytes](serializer=serializers.from_url("pickle://"), backend=backend, prefix="bar:")
+    foo_cache.set("1", 1)
+    bar_cache.set("1", 2)
+
+    foo_cache.clear()
+
+    assert foo_cache.get("1") is None
+    assert bar_cache.get("1") == 2
+
+
+def test_clear_prefixed_cache_fallback() -> None:
+    backend = sync_backends.from_url("django://default")
+    cache = Cache[int, bytes](serializer=serializers.from_url("pickle://"), backend=backend, prefix="foo:")
+    cache.set("1", 1)
+    backend.set("bar:1", b"2")
+
+    with warns(RuntimeWarning):
+        cache.clear()
+
+    assert cache.get("1") is None
+    assert dict(backend.get_many("bar:1")) == {}, "the entire storage must be cleared"
+
+
 def test_del_item(memory_cache: Cache[int, bytes]) -> None:
     memory_cache.set("foo", 42)
     del memory_cache["foo"]
@@ -9,3 +9,10 @@ def pytest_addoption(parser: Any) -> None:  # noqa: ANN001
         default=False,
         help="test Redis backends",
     )
+    parser.addoption(
+        "--test-redis-cluster",
+        action="store_true",
+        dest="test_redis_cluster",
+        default=False,
+        help="test Redis Cluster backends",
+    )
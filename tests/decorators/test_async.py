@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 from typing import Any
 from unittest import mock
@@ -8,7 +9,8 @@ import pytest
 
 from cachetory.backends.async_ import MemoryBackend
 from cachetory.caches.async_ import Cache
-from cachetory.decorators.async_ import cached
+from cachetory.decorators.async_ import cached, cached_many
+from cachetory.private.envelope import open_envelope
 from cachetory.serializers import NoopSerializer
 
 
@@ -90,3 +92,204 @@ async def test_none_cache() -> None:
         return 42
 
     await expensive_function()
+
+
+async def test_single_flight(cache: Cache[int, int]) -> None:
+    call_counter = 0
+
+    @cached(cache, make_key=lambda _, x: str(x), single_flight=True)
+    async def expensive_function(x: int) -> int:
+        nonlocal call_counter
+        call_counter += 1
+        await asyncio.sleep(0.01)
+        return x * x
+
+    with mock.patch.object(Cache, "set", wraps=cache.set) as set_mock:
+        assert await asyncio.gather(*(expensive_function(2) for _ in range(50))) == [4] * 50
+    assert call_counter == 1
+    set_mock.assert_called_once()
+
+    assert list(await asyncio.gather(expensive_function(2), expensive_function(3))) == [4, 9]
+    assert call_counter == 2, "a different key must not join the flight"
+
+
+async def test_single_flight_exception(cache: Cache[int, int]) -> None:
+    call_counter = 0
+
+    @cached(cache, single_flight=True)
+    async def failing_function() -> int:
+        nonlocal call_counter
+        call_counter += 1
+        await asyncio.sleep(0.01)
+        raise ValueError
+
+    results = await asyncio.gather(*(failing_function() for _ in range(10)), return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+    assert call_counter == 1
+
+    with pytest.raises(ValueError):
+        await failing_function()
+    assert call_counter == 2, "a failed call must not be reused"
+
+
+async def test_single_flight_cancellation(cache: Cache[int, int]) -> None:
+    started = asyncio.Event()
+    finish = asyncio.Event()
+    cancelled = False
+
+    @cached(cache, single_flight=True)
+    async def slow_function() -> int:
+        nonlocal cancelled
+        started.set()
+        try:
+            await finish.wait()
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        return 42
+
+    first = asyncio.ensure_future(slow_function())
+    second = asyncio.ensure_future(slow_function())
+    await started.wait()
+    first.cancel()
+    await asyncio.sleep(0)
+    assert not cancelled, "a cancelled caller must not cancel the call for the others"
+    finish.set()
+    assert await second == 42
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    await cache.clear()
+    finish.clear()
+    started.clear()
+    only = asyncio.ensure_future(slow_function())
+    await started.wait()
+    only.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await only
+    await asyncio.sleep(0)
+    assert cancelled, "the call must be cancelled once all the callers are cancelled"
+
+
+async def test_single_flight_purge(cache: Cache[int, int]) -> None:
+    finish = asyncio.Event()
+    call_counter = 0
+
+    @cached(cache, make_key=lambda _: "key", single_flight=True)
+    async def slow_function() -> int:
+        nonlocal call_counter
+        call_counter += 1
+        call_number = call_counter
+        await finish.wait()
+        return call_number
+
+    purged = asyncio.ensure_future(slow_function())
+    await asyncio.sleep(0)
+    await slow_function.purge()
+    fresh = asyncio.ensure_future(slow_function())
+    await asyncio.sleep(0)
+    finish.set()
+    assert list(await asyncio.gather(purged, fresh)) == [1, 2]
+    assert call_counter == 2, "the callers after the purge must start a new call"
+    assert await cache.get("key") == 2, "the result of the purged call must not be cached"
+
+
+async def test_refresh_after(cache: Cache[int, int]) -> None:
+    finish = asyncio.Event()
+    call_counter = 0
+
+    @cached(cache, make_key=lambda _: "key", refresh_after=timedelta())
+    async def slow_function() -> int:
+        nonlocal call_counter
+        call_counter += 1
+        call_number = call_counter
+        if call_number == 2:
+            await finish.wait()
+        return call_number
+
+    assert await slow_function() == 1
+    assert await slow_function() == 1, "the stale value must be returned immediately"
+    await asyncio.sleep(0)
+    assert await slow_function() == 1
+    assert call_counter == 2, "only one refresh must run at a time"
+
+    finish.set()
+    while open_envelope(await cache.get("key"))[0] != 2:
+        await asyncio.sleep(0)
+
+
+async def test_refresh_after_exception(cache: Cache[int, int]) -> None:
+    call_counter = 0
+
+    @cached(cache, make_key=lambda _: "key", refresh_after=timedelta())
+    async def failing_function() -> int:
+        nonlocal call_counter
+        call_counter += 1
+        if call_counter == 2:
+            raise ValueError
+        return call_counter
+
+    assert await failing_function() == 1
+    while call_counter < 3:
+        assert await failing_function() == 1, "the failed refresh must keep the stale value"
+        await asyncio.sleep(0)
+    while open_envelope(await cache.get("key"))[0] != 3:
+        await asyncio.sleep(0)
+
+
+async def test_early_recompute(cache: Cache[int, int]) -> None:
+    call_counter = 0
+
+    @cached(cache, make_key=lambda _: "key", time_to_live=timedelta(minutes=1), early_recompute=1e6)
+    async def expensive_function() -> int:
+        nonlocal call_counter
+        call_counter += 1
+        await asyncio.sleep(0.001)
+        return call_counter
+
+    assert await expensive_function() == 1
+    with mock.patch("cachetory.private.envelope.random", return_value=0.0):
+        assert await expensive_function() == 1, "the value must not be recomputed on the lucky draw"
+    with mock.patch("cachetory.private.envelope.random", return_value=0.5):
+        # The huge β times the computation time is far beyond the expiration time:
+        assert await expensive_function() == 2, "the value must be recomputed early"
+    assert open_envelope(await cache.get("key"))[0] == 2
+
+
+async def test_early_recompute_mixed_with_plain_values() -> None:
+    cache = Cache[Any, Any](serializer=NoopSerializer(), backend=MemoryBackend[Any]())
+
+    @cached(cache, make_key=lambda _: "plain")
+    async def plain_function() -> list[float]:
+        return [1.0, 2.0, 3]
+
+    @cached(cache, make_key=lambda _: "plain", time_to_live=timedelta(minutes=1), early_recompute=1.0)
+    async def enveloped_function() -> list[float]:
+        return [4.0]
+
+    assert await plain_function() == [1.0, 2.0, 3]
+    assert await enveloped_function() == [4.0], "the plain value must not be taken for an envelope"
+    assert open_envelope(await cache.get("plain")) == ([4.0], False)
+    assert await enveloped_function() == [4.0]
+
+
+async def test_cached_many(cache: Cache[int, int]) -> None:
+    calls: list[list[int]] = []
+
+    @cached_many(cache, make_key=lambda _, id_: str(id_))
+    async def load_squares(ids: list[int]) -> dict[int, int]:
+        calls.append(ids)
+        return {id_: id_ * id_ for id_ in ids if id_ != 0}
+
+    assert await load_squares([1, 2, 2, 0]) == {1: 1, 2: 4}
+    patch_get_many = mock.patch.object(Cache, "get_many", wraps=cache.get_many)
+    patch_set_many = mock.patch.object(Cache, "set_many", wraps=cache.set_many)
+    with patch_get_many as get_many, patch_set_many as set_many:
+        assert await load_squares([3, 2, 1]) == {3: 9, 2: 4, 1: 1}
+    get_many.assert_called_once_with("3", "2", "1")
+    set_many.assert_called_once_with({"3": 9}, time_to_live=None, if_not_exists=False)
+    assert calls == [[1, 2, 0], [3]], "only the missing identifiers must be loaded"
+
+    await load_squares.purge([1, 3])
+    assert await load_squares([1, 2, 3]) == {1: 1, 2: 4, 3: 9}
+    assert calls[-1] == [1, 3]
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
+from threading import Barrier, Event
+from time import sleep
 from typing import Any
 from unittest import mock
 
 from pytest import fixture
 
-from cachetory.backends.sync import MemoryBackend
+from cachetory.backends.sync import MemoryBackend, ShardedMemoryBackend
 from cachetory.caches.sync import Cache
-from cachetory.decorators.sync import cached
+from cachetory.decorators.sync import cached, cached_many
+from cachetory.private.envelope import open_envelope
 from cachetory.serializers import NoopSerializer
 
 
@@ -90,3 +94,153 @@ def test_none_cache() -> None:
         return 42
 
     expensive_function()
+
+
+def test_single_flight() -> None:
+    cache = Cache[int, int](serializer=NoopSerializer(), backend=ShardedMemoryBackend[int]())
+    call_counter = 0
+    barrier = Barrier(20)
+
+    @cached(cache, make_key=lambda _, x: str(x), single_flight=True)
+    def expensive_function(x: int) -> int:
+        nonlocal call_counter
+        call_counter += 1
+        sleep(0.05)
+        return x * x
+
+    def call() -> int:
+        barrier.wait()
+        return expensive_function(2)
+
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        assert list(executor.map(lambda _: call(), range(20))) == [4] * 20
+    assert call_counter == 1
+
+
+def test_single_flight_wait_timeout() -> None:
+    cache = Cache[int, int](serializer=NoopSerializer(), backend=ShardedMemoryBackend[int]())
+    started = Event()
+    finish = Event()
+    call_counter = 0
+
+    @cached(cache, single_flight=True, wait_timeout=timedelta(milliseconds=10))
+    def slow_function() -> int:
+        nonlocal call_counter
+        call_counter += 1
+        call_number = call_counter
+        if call_number == 1:
+            started.set()
+            finish.wait()
+        return call_number
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        first = executor.submit(slow_function)
+        started.wait()
+        assert slow_function() == 2, "the waiting thread must call on its own after the timeout"
+        finish.set()
+        assert first.result() == 1
+
+
+def test_refresh_after(cache: Cache[int, int]) -> None:
+    started = Event()
+    finish = Event()
+    call_counter = 0
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+
+        @cached(cache, make_key=lambda _: "key", refresh_after=timedelta(), refresh_executor=executor)
+        def slow_function() -> int:
+            nonlocal call_counter
+            call_counter += 1
+            call_number = call_counter
+            if call_number == 2:
+                started.set()
+                finish.wait()
+            return call_number
+
+        assert slow_function() == 1
+        assert slow_function() == 1, "the stale value must be returned immediately"
+        started.wait()
+        assert slow_function() == 1
+        finish.set()
+    assert call_counter == 2, "only one refresh must run at a time"
+    assert open_envelope(cache["key"])[0] == 2, "the refreshed value must be cached"
+
+
+def test_refresh_after_purge(cache: Cache[int, int]) -> None:
+    started = Event()
+    finish = Event()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+
+        @cached(cache, make_key=lambda _: "key", refresh_after=timedelta(), refresh_executor=executor)
+        def slow_function() -> int:
+            if cache.get("key") is not None:  # refreshing
+                started.set()
+                finish.wait()
+            return 42
+
+        slow_function()
+        slow_function()
+        started.wait()
+        assert slow_function.purge()
+        finish.set()
+    assert cache.get("key") is None, "the result of the purged refresh must not be cached"
+
+
+def test_early_recompute(cache: Cache[int, int]) -> None:
+    call_counter = 0
+
+    @cached(cache, make_key=lambda _: "key", time_to_live=timedelta(minutes=1), early_recompute=1e6)
+    def expensive_function() -> int:
+        nonlocal call_counter
+        call_counter += 1
+        sleep(0.001)
+        return call_counter
+
+    assert expensive_function() == 1
+    with mock.patch("cachetory.private.envelope.random", return_value=0.0):
+        assert expensive_function() == 1, "the value must not be recomputed on the lucky draw"
+    with mock.patch("cachetory.private.envelope.random", return_value=0.5):
+        # The huge β times the computation time is far beyond the expiration time:
+        assert expensive_function() == 2, "the value must be recomputed early"
+    assert open_envelope(cache["key"])[0] == 2
+
+
+def test_early_recompute_mixed_with_plain_values() -> None:
+    cache = Cache[Any, Any](serializer=NoopSerializer(), backend=MemoryBackend[Any]())
+
+    @cached(cache, make_key=lambda _: "plain")
+    def plain_function() -> list[float]:
+        return [1.0, 2.0, 3]
+
+    @cached(cache, make_key=lambda _: "plain", time_to_live=timedelta(minutes=1), early_recompute=1.0)
+    def enveloped_function() -> list[float]:
+        return [4.0]
+
+    assert plain_function() == [1.0, 2.0, 3]
+    assert enveloped_function() == [4.0], "the plain value must not be taken for an envelope"
+    assert open_envelope(cache["plain"]) == ([4.0], False)
+    assert enveloped_function() == [4.0]
+
+
+def test_cached_many(cache: Cache[int, int]) -> None:
+    calls: list[list[int]] = []
+
+    @cached_many(cache, make_key=lambda _, id_: str(id_))
+    def load_squares(ids: list[int]) -> dict[int, int]:
+        calls.append(ids)
+        return {id_: id_ * id_ for id_ in ids if id_ != 0}
+
+    assert load_squares([1, 2, 2, 0]) == {1: 1, 2: 4}
+    patch_get_many = mock.patch.object(Cache, "get_many", wraps=cache.get_many)
+    patch_set_many = mock.patch.object(Cache, "set_many", wraps=cache.set_many)
+    with patch_get_many as get_many, patch_set_many as set_many:
+        assert load_squares([3, 2, 1]) == {3: 9, 2: 4, 1: 1}
+    get_many.assert_called_once_with("3", "2", "1")
+    set_many.assert_called_once_with({"3": 9}, time_to_live=None, if_not_exists=False)
+    assert calls == [[1, 2, 0], [3]], "only the missing identifiers must be loaded"
+
+    load_squares.purge([1, 3])
+    assert load_squares([1, 2, 3]) == {1: 1, 2: 4, 3: 9}
+    assert calls[-1] == [1, 3]
@@ -0,0 +1,43 @@
+import asyncio
+import logging
+
+import pytest
+
+from cachetory.private.asyncio import SingleFlight
+
+
+async def test_single_flight_cancelled_call_is_not_joined() -> None:
+    flights = SingleFlight[int]()
+    started = asyncio.Event()
+
+    async def slow_call() -> int:
+        started.set()
+        await asyncio.Event().wait()
+        raise AssertionError("unreachable")
+
+    async def fast_call() -> int:
+        return 42
+
+    cancelled = asyncio.ensure_future(flights.run("key", slow_call))
+    await started.wait()
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    # The cancelled call may still be finishing, and the next caller must not join it:
+    assert await flights.run("key", fast_call) == 42
+
+
+async def test_single_flight_background_call_logs_exception(caplog: pytest.LogCaptureFixture) -> None:
+    flights = SingleFlight[int]()
+
+    async def fail() -> int:
+        raise RuntimeError("refresh failed")
+
+    flights.start("foo", fail)
+    while flights._background_tasks:
+        await asyncio.sleep(0)
+    (record,) = caplog.records
+    assert record.levelno == logging.WARNING
+    assert "`foo`" in record.getMessage()
+    assert record.exc_info is not None
+    assert isinstance(record.exc_info[1], RuntimeError)
@@ -0,0 +1,29 @@
+from datetime import timedelta
+from typing import Any
+from unittest import mock
+
+from cachetory.private.envelope import make_envelope, open_envelope
+
+
+def test_envelope() -> None:
+    fresh: Any = make_envelope(42, timedelta(minutes=1), 1.0)
+    stale: Any = make_envelope(42, timedelta(minutes=-1), 1.0)
+    eternal: Any = make_envelope(42, None, 1.0)
+    serialized: Any = list(fresh)
+    assert open_envelope(fresh) == (42, False)
+    assert open_envelope(stale) == (42, True)
+    assert open_envelope(eternal) == (42, False)
+    assert open_envelope(serialized) == (42, False), "JSON turns tuples into lists"
+    assert open_envelope(42) == (42, True), "a value without the envelope must be stale"
+    assert open_envelope([1.0, 2.0, 3]) == ([1.0, 2.0, 3], True), "a look-alike value must not be unpacked"
+    assert open_envelope(["cachetory:envelope:0", None, 1.0, 42])[1], "an envelope of another version must be stale"
+
+
+def test_envelope_early_expiration() -> None:
+    envelope: Any = make_envelope(42, timedelta(seconds=10), 1.0)
+    with mock.patch("cachetory.private.envelope.random", return_value=0.0):
+        assert open_envelope(envelope, beta=1.0) == (42, False)
+    with mock.patch("cachetory.private.envelope.random", return_value=1.0 - 1e-6):
+        # `-log(1e-6)` is about 14: the 1-second computation times 14 is past the 10-second deadline.
+        assert open_envelope(envelope, beta=1.0) == (42, True)
+        assert open_envelope(envelope, beta=0.0) == (42, False)
@@ -0,0 +1,28 @@
+from cachetory.private.sketch import FrequencySketch
+
+
+def test_frequency() -> None:
+    sketch = FrequencySketch(100)
+    for _ in range(3):
+        sketch.increment("foo")
+    sketch.increment("bar")
+    assert sketch.frequency("foo") == 3
+    assert sketch.frequency("bar") == 1
+    assert sketch.frequency("qux") == 0
+
+
+def test_saturation() -> None:
+    sketch = FrequencySketch(100)
+    for _ in range(100):
+        sketch.increment("foo")
+    assert sketch.frequency("foo") == 15
+
+
+def test_aging() -> None:
+    sketch = FrequencySketch(1)  # sample size is 10
+    for _ in range(8):
+        sketch.increment("foo")
+    sketch.increment("bar")
+    sketch.increment("bar")  # the 10th increment halves the counters
+    assert sketch.frequency("foo") == 4
+    assert sketch.frequency("bar") == 1
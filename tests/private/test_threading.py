@@ -0,0 +1,31 @@
+import gc
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cachetory.private.threading import BackgroundCalls, KeyLocks
+
+
+def test_key_locks() -> None:
+    key_locks = KeyLocks()
+    lock = key_locks["foo"]
+    assert key_locks["foo"] is lock
+    assert key_locks["bar"] is not lock
+
+    del lock
+    gc.collect()
+    assert len(key_locks) == 0, "the unused locks must be dropped"
+
+
+def test_background_calls_log_exception(caplog: pytest.LogCaptureFixture) -> None:
+    def fail() -> None:
+        raise RuntimeError("refresh failed")
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        BackgroundCalls(executor).start("foo", fail)
+    (record,) = caplog.records
+    assert record.levelno == logging.WARNING
+    assert "`foo`" in record.getMessage()
+    assert record.exc_info is not None
+    assert isinstance(record.exc_info[1], RuntimeError)
@@ -1,3 +1,4 @@
 from pytest import mark
 
 if_redis_enabled = mark.skipif("not config.getoption('test_redis')")
+if_redis_cluster_enabled = mark.skipif("not config.getoption('test_redis_cluster')")